@@ -0,0 +1,89 @@
+# SPDX-FileCopyrightText: 2025 CERN (home.cern)
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+import json
+import time
+import tracemalloc
+
+import pytest
+
+from repository import GitHubRepository, GitLabRepository
+from session import Session
+from throttle import HostThrottle
+from url import UrlContent, UrlRegistry
+
+RESULTS = []
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--benchmark-json",
+        metavar="PATH",
+        help="write the benchmark results to a JSON file",
+    )
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    if not RESULTS:
+        return
+    terminalreporter.section("benchmark results")
+    terminalreporter.write_line("{0:<40} {1:>10} {2:>10} {3:>12}".format(
+        "benchmark", "wall (s)", "requests", "peak (MiB)",
+    ))
+    for result in RESULTS:
+        terminalreporter.write_line(
+            "{name:<40} {wall_time:>10.3f} {requests:>10} {peak_mib:>12.1f}"
+            .format(peak_mib=result["peak_memory"] / 2 ** 20, **result),
+        )
+    path = config.getoption("--benchmark-json")
+    if path:
+        with open(path, "w") as results_file:
+            json.dump(RESULTS, results_file, indent=2)
+
+
+@pytest.fixture(autouse=True)
+def clear_state():
+    Session.close()
+    UrlRegistry.clear()
+    UrlContent.clear()
+    HostThrottle.clear()
+    GitHubRepository.clear()
+    GitLabRepository.clear()
+    yield
+    Session.close()
+
+
+@pytest.fixture
+def report(request):
+    def record(wall_time, requests, peak_memory):
+        RESULTS.append({
+            "name": request.node.name,
+            "wall_time": wall_time,
+            "requests": requests,
+            "peak_memory": peak_memory,
+        })
+    return record
+
+
+@pytest.fixture
+def measure(report):
+    def run(function, argument, repeat):
+        start = time.perf_counter()
+        for _ in range(repeat):
+            function(argument)
+        wall_time = time.perf_counter() - start
+        tracemalloc.start()
+        result = function(argument)
+        _, peak_memory = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        report(wall_time, 0, peak_memory)
+        return result
+    return run
+
+
+@pytest.fixture
+def sources(tmp_path):
+    for section in ("projects", "news", "redirects"):
+        (tmp_path / "content" / section).mkdir(parents=True)
+    return tmp_path
@@ -0,0 +1,342 @@
+# SPDX-FileCopyrightText: 2025 CERN (home.cern)
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Serve a local stand-in for the forges and sites the projects live on."""
+
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Optional
+from urllib.parse import urlsplit
+
+from session import CountingAdapter, Session
+
+DOCS = 'https://docs.example.org'
+
+DESCRIPTION = """# {0}
+
+<!-- Synthetic project generated by the benchmark suite. -->
+
+![Board]({1}/{0}/board.png)
+
+{0} is a synthetic project. It exists to measure how fast the site is
+composed. It has a description long enough to be split into sections.
+
+## Features
+
+- Gateware
+- Software
+"""
+
+NEWS = """## {0} release {1}
+
+2025-{2:02d}-01
+
+![Release]({3}/{0}/release-{1}.png)
+
+Release {1} of {0} is out. It brings [documentation]({3}/{0}/docs).
+"""
+
+MANIFEST = """version: '1.0.0'
+name: 'Project {0}'
+description: '{1}'
+website: '{2}/{0}'
+licenses:
+  - 'CERN-OHL-W-2.0'
+images:
+  - '{2}/{0}/board.png'
+documentation: '{2}/{0}/docs'
+newsfeed: '{2}/{0}/news.md'
+links:
+  - name: 'Schematics'
+    url: '{2}/{0}/schematics.pdf'
+"""
+
+
+def repository_url(project_id: str, index: int) -> str:
+    """
+    Get the repository URL of a synthetic project.
+
+    Even projects are hosted on GitLab and odd ones on GitHub.
+
+    Parameters:
+        project_id: Project identifier.
+        index: Project index.
+
+    Returns:
+        Repository URL.
+    """
+    if index % 2:
+        return 'https://github.com/ohwr/{0}.git'.format(project_id)
+    return 'https://gitlab.com/ohwr/project/{0}.git'.format(project_id)
+
+
+def config_yaml(projects: int, sources: str, licenses: str) -> str:
+    """
+    Generate a configuration with synthetic projects.
+
+    Parameters:
+        projects: Number of projects.
+        sources: Hugo sources directory path.
+        licenses: SPDX license list JSON file path.
+
+    Returns:
+        Configuration YAML string.
+    """
+    lines = [
+        "sources: '{0}'".format(sources),
+        "licenses: '{0}'".format(licenses),
+        'tags:',
+        "  - 'Benchmark'",
+        'redirects:',
+        "  - url: 'old/benchmark'",
+        "    target: '{0}/benchmark'".format(DOCS),
+        'projects:',
+    ]
+    for index in range(projects):
+        project_id = 'bench-{0}'.format(index)
+        lines.extend([
+            "  - id: '{0}'".format(project_id),
+            "    repository: '{0}'".format(repository_url(project_id, index)),
+            '    contact:',
+            "      name: 'Benchmark Contact'",
+            "      email: 'contact@example.org'",
+            '    tags:',
+            "      - 'Benchmark'",
+        ])
+    return '\n'.join(lines) + '\n'
+
+
+class MockForge:
+    """Local stand-in for GitHub, GitLab and project websites."""
+
+    routes = (
+        (r'^/api\.github\.com/repos/ohwr/([^/]+)/contents/\.ohwr\.yaml$',
+            '_manifest'),
+        (r'^/gitlab\.com/ohwr/project/([^/]+)/-/raw/master/\.ohwr\.yaml$',
+            '_manifest'),
+        (r'^/gitlab\.com/api/v4/projects/ohwr%2Fproject%2F([^/]+)$',
+            '_project'),
+        (r'^/gitlab\.com/api/v4/projects/ohwr%2Fproject%2F([^/]+)/wikis/home$',
+            '_wiki'),
+        (r'^/docs\.example\.org/([^/]+)/description\.md$', '_description'),
+        (r'^/docs\.example\.org/([^/]+)/news\.md$', '_news'),
+    )
+
+    def __init__(
+        self,
+        latency: float = 0,
+        failure_rate: float = 0,
+        news: int = 3,
+        seed: int = 0,
+    ) -> None:
+        """
+        Initialize the mock forge.
+
+        Parameters:
+            latency: Seconds to wait before answering each request.
+            failure_rate: Fraction of requests answered with an error 503.
+            news: Number of news in each project newsfeed.
+            seed: Seed of the failure generator.
+        """
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self.news = news
+        self.requests = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+
+    def __enter__(self) -> 'MockForge':
+        """
+        Serve the mock forge and route every HTTPS request to it.
+
+        Returns:
+            The mock forge.
+        """
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), ForgeHandler)
+        self._server.daemon_threads = True
+        self._server.forge = self
+        threading.Thread(
+            target=self._server.serve_forever, daemon=True,
+        ).start()
+        host, port = self._server.server_address
+        address = '{0}:{1}'.format(host, port)
+        Session.mount('https://', ForgeAdapter(address))
+        for pool_host in Session.pool_sizes:
+            Session.mount(
+                'https://{0}/'.format(pool_host), ForgeAdapter(address),
+            )
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        """
+        Stop serving the mock forge.
+
+        Parameters:
+            args: Exception information.
+        """
+        Session.close()
+        self._server.shutdown()
+        self._server.server_close()
+
+    def answer(self, path: str) -> tuple[int, bytes]:
+        """
+        Answer a GET request.
+
+        Parameters:
+            path: Request path, starting with the original host.
+
+        Returns:
+            The status code and the response body.
+        """
+        if self._failed():
+            return 503, b'Service Unavailable'
+        for route, handler in self.routes:
+            match = re.search(route, path)
+            if match:
+                return 200, getattr(self, handler)(match.group(1)).encode()
+        return 404, b'Not Found'
+
+    def answer_graphql(self, path: str, body: bytes) -> tuple[int, bytes]:
+        """
+        Answer a GraphQL query for GitHub manifests or GitLab branches.
+
+        Parameters:
+            path: Request path, starting with the original host.
+            body: Request body.
+
+        Returns:
+            The status code and the response body.
+        """
+        if self._failed():
+            return 503, b'Service Unavailable'
+        request = json.loads(body)
+        if path == '/gitlab.com/api/graphql':
+            variables = request['variables']
+            nodes = [
+                {'fullPath': project, 'repository': {'rootRef': 'master'}}
+                for project in variables['paths']
+            ][:variables['first']]
+            return 200, json.dumps(
+                {'data': {'projects': {'nodes': nodes}}},
+            ).encode()
+        if path != '/api.github.com/graphql':
+            return 404, b'Not Found'
+        query = request['query']
+        aliases = re.findall(
+            r'(r\d+): repository\(owner: "ohwr", name: "([^"]+)"\)', query,
+        )
+        data = {
+            alias: {'object': {'text': self._manifest(project_id)}}
+            for alias, project_id in aliases
+        }
+        return 200, json.dumps({'data': data}).encode()
+
+    def _failed(self) -> bool:
+        with self._lock:
+            self.requests += 1
+            failed = self._random.random() < self.failure_rate
+        if self.latency:
+            time.sleep(self.latency)
+        return failed
+
+    def _manifest(self, project_id: str) -> str:
+        if int(project_id.rsplit('-', 1)[1]) % 2:
+            description = '{0}/{1}/description.md'.format(DOCS, project_id)
+        else:
+            description = (
+                'https://gitlab.com/ohwr/project/{0}/-/wikis/home'.format(
+                    project_id,
+                )
+            )
+        return MANIFEST.format(project_id, description, DOCS)
+
+    def _project(self, project_id: str) -> str:
+        return json.dumps({'id': project_id, 'default_branch': 'master'})
+
+    def _wiki(self, project_id: str) -> str:
+        return json.dumps({'content': self._description(project_id)})
+
+    def _description(self, project_id: str) -> str:
+        return DESCRIPTION.format(project_id, DOCS)
+
+    def _news(self, project_id: str) -> str:
+        return '\n'.join(
+            NEWS.format(project_id, release, release % 12 + 1, DOCS)
+            for release in range(self.news, 0, -1)
+        )
+
+
+class ForgeHandler(BaseHTTPRequestHandler):
+    """Request handler of the mock forge."""
+
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+    wbufsize = -1
+
+    def do_HEAD(self) -> None:  # noqa: N802
+        """Answer a HEAD request."""
+        status, _ = self.server.forge.answer(self.path)
+        self._send(status if status == 503 else 200, b'', head=True)
+
+    def do_GET(self) -> None:  # noqa: N802
+        """Answer a GET request."""
+        self._send(*self.server.forge.answer(self.path))
+
+    def do_POST(self) -> None:  # noqa: N802
+        """Answer a POST request."""
+        body = self.rfile.read(int(self.headers['Content-Length']))
+        self._send(*self.server.forge.answer_graphql(self.path, body))
+
+    def log_message(self, *args: Any) -> None:
+        """
+        Do not log requests.
+
+        Parameters:
+            args: Log message format and arguments.
+        """
+
+    def _send(self, status: int, body: bytes, head: bool = False) -> None:
+        self.send_response(status)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if not head:
+            self.wfile.write(body)
+
+
+class ForgeAdapter(CountingAdapter):
+    """Transport adapter sending HTTPS requests to the mock forge."""
+
+    def __init__(self, address: str) -> None:
+        """
+        Initialize the adapter.
+
+        Parameters:
+            address: Mock forge host and port.
+        """
+        super().__init__()
+        self.address = address
+
+    def send(self, request: Any, **kwargs: Any) -> Any:
+        """
+        Send a request to the mock forge, keeping the original host as path.
+
+        Parameters:
+            request: Prepared request.
+            kwargs: Arguments passed to HTTPAdapter.send.
+
+        Returns:
+            A requests.Response instance.
+        """
+        url = urlsplit(request.url)
+        request.url = 'http://{0}/{1}{2}'.format(
+            self.address,
+            url.netloc,
+            '{0}?{1}'.format(url.path, url.query) if url.query else url.path,
+        )
+        return super().send(request, **kwargs)
@@ -0,0 +1,42 @@
+# SPDX-FileCopyrightText: 2025 CERN (home.cern)
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Benchmarks of Markdown preprocessing on large wiki pages."""
+
+import pytest
+
+import markdown_preprocess
+
+SECTION = """## Section {0}
+
+<!-- Maintainer note {0}, spanning
+two lines. -->
+
+![Figure {0}](https://docs.example.org/figure-{0}.png)
+
+---
+"""
+
+PROSE = """{0} is documented on this wiki page. It describes the hardware,
+the gateware and the software of the project in detail.
+"""
+
+
+def wiki_page(sections, prose_last):
+    """Generate a wiki page whose only prose is first or last."""
+    page = ["# Wiki\n"]
+    if not prose_last:
+        page.append(PROSE.format("Project"))
+    page.extend(SECTION.format(index) for index in range(sections))
+    if prose_last:
+        page.append("## Overview\n\n" + PROSE.format("Project"))
+    return "\n".join(page)
+
+
+@pytest.mark.parametrize("sections", [100, 10000])
+@pytest.mark.parametrize("prose_last", [False, True])
+def test_first_section(sections, prose_last, measure):
+    md = wiki_page(sections, prose_last)
+    description = measure(markdown_preprocess.first_section, md, 20)
+    assert description.startswith("Project is documented")
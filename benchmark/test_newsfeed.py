@@ -0,0 +1,54 @@
+# SPDX-FileCopyrightText: 2025 CERN (home.cern)
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Benchmarks of the newsfeed parser against the regex implementation."""
+
+import itertools
+
+import pytest
+
+import newsfeed
+from forge import NEWS
+from newsfeed_regex import regex_entries
+
+
+def parser_entries(md):
+    """Parse a newsfeed with the newsfeed parser."""
+    return list(newsfeed.entries(md))
+
+
+def summary(parsed):
+    """Summarize parsed news entries like the regex parser does."""
+    return [
+        entry if isinstance(entry, tuple)
+        else (entry.title, entry.date, entry.images, entry.description)
+        for entry in parsed
+    ]
+
+
+def newsfeed_md(entries):
+    """Generate a newsfeed, newest news first."""
+    return "<!-- Newsfeed of the benchmark project. -->\n\n" + "\n".join(
+        NEWS.format("bench", release, release % 12 + 1, "https://docs.org")
+        for release in range(entries, 0, -1)
+    )
+
+
+@pytest.mark.parametrize("entries", [100, 1000])
+@pytest.mark.parametrize("parse", [regex_entries, parser_entries])
+def test_entries(entries, parse, measure):
+    parsed = measure(parse, newsfeed_md(entries), 20)
+    assert summary(parsed) == regex_entries(newsfeed_md(entries))
+
+
+def recent_entries(md):
+    """Parse the ten most recent news of a newsfeed."""
+    return list(itertools.islice(newsfeed.entries(md), 10))
+
+
+@pytest.mark.parametrize("entries", [100, 1000])
+@pytest.mark.parametrize("parse", [parser_entries, recent_entries])
+def test_recent_entries(entries, parse, measure):
+    parsed = measure(parse, newsfeed_md(entries), 20)
+    assert parsed[0].title == "bench release {0}".format(entries)
@@ -0,0 +1,86 @@
+# SPDX-FileCopyrightText: 2025 CERN (home.cern)
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""End-to-end benchmarks of the compose pipeline against a mock forge."""
+
+import os
+import time
+import tracemalloc
+import warnings
+
+import pytest
+
+from config import Config
+from forge import MockForge, config_yaml
+from license import SpdxLicenseList
+from news import NewsSection
+from project import ProjectSection
+from redirect import RedirectSection
+from session import Session
+
+LICENSES = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)),
+    "..", "third_party", "spdx", "license-list-data", "json", "licenses.json",
+)
+
+
+def compose(config_yaml_str, sources, workers=8):
+    """Run every step of the compose pipeline."""
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        config = Config.from_yaml(config_yaml_str)
+        SpdxLicenseList.from_file(config.licenses)
+        RedirectSection.from_config(config.redirects).write(
+            os.path.join(sources, "content/redirects"),
+        )
+        projects = ProjectSection.from_config(config.projects, workers)
+        projects.write(os.path.join(sources, "content/projects"))
+        news = NewsSection.from_config(config.projects)
+        news.write(os.path.join(sources, "content/news"))
+    return projects, news
+
+
+def measure(forge, projects, sources, report):
+    """Compose a synthetic site and report wall time, requests and memory."""
+    config_yaml_str = config_yaml(projects, str(sources), LICENSES)
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = compose(config_yaml_str, str(sources))
+    wall_time = time.perf_counter() - start
+    _, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    report(wall_time, Session.stats()["requests"], peak_memory)
+    return result
+
+
+@pytest.mark.parametrize("projects", [
+    10, 200, pytest.param(5000, marks=pytest.mark.slow),
+])
+def test_compose(projects, sources, report):
+    with MockForge(news=3) as forge:
+        project_section, news_section = measure(
+            forge, projects, sources, report,
+        )
+    assert len(project_section) == projects
+    assert len(news_section) == projects * 3
+    assert forge.requests > 0
+
+
+def test_compose_graphql(sources, report, monkeypatch):
+    monkeypatch.setenv("GITHUB_TOKEN", "benchmark")
+    with MockForge(latency=0.01) as forge:
+        project_section, _ = measure(forge, 200, sources, report)
+    assert len(project_section) == 200
+
+
+def test_compose_latency(sources, report):
+    with MockForge(latency=0.01) as forge:
+        project_section, _ = measure(forge, 200, sources, report)
+    assert len(project_section) == 200
+
+
+def test_compose_failures(sources, report):
+    with MockForge(failure_rate=0.01, seed=1) as forge:
+        project_section, _ = measure(forge, 200, sources, report)
+    assert 0 < len(project_section) <= 200
@@ -0,0 +1,70 @@
+# SPDX-FileCopyrightText: 2025 CERN (home.cern)
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Benchmarks of the argument validation of hot helpers."""
+
+import json
+
+import pytest
+from pydantic import validate_call
+
+from config import News
+from license import SpdxLicenseList
+from schema import AnnotatedStr
+
+CALLS = 10000
+
+NEWS = "## Release\n\n2025-01-01\n\nRelease of the benchmark project.\n"
+
+LICENSE_IDS = ["CERN-OHL-W-2.0", "GPL-3.0-or-later", "MIT"] * (CALLS // 3)
+
+
+@validate_call
+def validated_get_license(license_id: AnnotatedStr):
+    """Look up a license like get_license did under validate_call."""
+    return SpdxLicenseList.get_license(license_id)
+
+
+@validate_call
+def validated_from_markdown(md: AnnotatedStr):
+    """Load news like from_markdown did under validate_call."""
+    return News.from_markdown(md)
+
+
+def get_licenses(get_license):
+    """Look up every license identifier."""
+    def run(license_ids):
+        return [get_license(license_id) for license_id in license_ids]
+    return run
+
+
+def load_news(from_markdown):
+    """Load the same news many times."""
+    def run(md):
+        return [from_markdown(md) for _ in range(CALLS // 10)]
+    return run
+
+
+@pytest.fixture
+def licenses():
+    SpdxLicenseList.from_json(json.dumps({"licenses": [
+        {"licenseId": license_id, "name": license_id, "reference": "ref"}
+        for license_id in set(LICENSE_IDS)
+    ]}))
+
+
+@pytest.mark.parametrize("get_license", [
+    validated_get_license, SpdxLicenseList.get_license,
+], ids=["validate_call", "unwrapped"])
+def test_get_license(get_license, licenses, measure):
+    found = measure(get_licenses(get_license), LICENSE_IDS, 5)
+    assert [spdx_license.id for spdx_license in found] == LICENSE_IDS
+
+
+@pytest.mark.parametrize("from_markdown", [
+    validated_from_markdown, News.from_markdown,
+], ids=["validate_call", "validate_str"])
+def test_from_markdown(from_markdown, measure):
+    loaded = measure(load_news(from_markdown), NEWS, 5)
+    assert loaded[0].title == "Release"
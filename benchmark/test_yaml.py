@@ -0,0 +1,36 @@
+# SPDX-FileCopyrightText: 2025 CERN (home.cern)
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Benchmarks of YAML loading."""
+
+import pytest
+import yaml
+
+from forge import config_yaml
+from schema import load_yaml
+
+
+def python_loader(yaml_str):
+    """Parse YAML with the pure Python loader."""
+    return yaml.safe_load(yaml_str)
+
+
+def libyaml_loader(yaml_str):
+    """Parse YAML with libyaml, when available."""
+    return load_yaml(yaml_str)
+
+
+@pytest.mark.parametrize("loader", [python_loader, libyaml_loader])
+def test_parse(loader, measure):
+    yaml_str = config_yaml(300, "/sources", "/licenses.json")
+    loaded = measure(loader, yaml_str, 5)
+    assert loaded == yaml.safe_load(yaml_str)
+
+
+def test_cached(tmp_path, measure):
+    yaml_str = config_yaml(300, "/sources", "/licenses.json")
+    cache_path = str(tmp_path / "config.json")
+    load_yaml(yaml_str, cache_path)
+    loaded = measure(lambda text: load_yaml(text, cache_path), yaml_str, 5)
+    assert loaded == yaml.safe_load(yaml_str)
@@ -10,68 +10,335 @@ import os
 import sys
 import warnings
 
+from archive import FetchArchive
+from cache import HttpCache
 from config import Config
 from license import SpdxLicenseList
+from metrics import Metrics
 from news import NewsSection
 from project import ProjectSection
 from pydantic import ValidationError
 from redirect import RedirectSection
+from repository import GitLabRepository
+from session import Session
+from state import BuildState
+from throttle import HostThrottle
+from url import Url, UrlCheck, UrlRegistry
 
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s',  # noqa: WPS323
 )
 
+
+def positive_int(arg_value: str) -> int:
+    """
+    Parse a command line argument as a positive integer.
+
+    Parameters:
+        arg_value: Argument value.
+
+    Returns:
+        The integer.
+
+    Raises:
+        ArgumentTypeError: If the value is not an integer of at least 1.
+    """
+    try:
+        int_value = int(arg_value)
+    except ValueError:
+        int_value = 0
+    if int_value < 1:
+        raise argparse.ArgumentTypeError(
+            "'{0}' is not a positive integer".format(arg_value),
+        )
+    return int_value
+
+
 parser = argparse.ArgumentParser()
 parser.add_argument('config', type=str)
+parser.add_argument(
+    '--workers',
+    type=positive_int,
+    default=8,
+    help='maximum number of projects generated concurrently',
+)
+network = parser.add_mutually_exclusive_group()
+network.add_argument(
+    '--cache',
+    type=str,
+    help='directory to cache and revalidate HTTP responses in',
+)
+network.add_argument(
+    '--record',
+    type=str,
+    metavar='ARCHIVE',
+    help='record every HTTP request and response to an archive',
+)
+network.add_argument(
+    '--replay',
+    type=str,
+    metavar='ARCHIVE',
+    help='answer every HTTP request from an archive, without network access',
+)
+parser.add_argument(
+    '--incremental',
+    type=str,
+    metavar='STATE',
+    help='build state file; only regenerate projects whose inputs changed',
+)
+parser.add_argument(
+    '--rate-limit',
+    type=str,
+    action='append',
+    default=[],
+    metavar='HOST=RATE',
+    help='maximum number of requests per second sent to a host',
+)
+parser.add_argument(
+    '--lint',
+    action='store_true',
+    help='only validate the configuration, without network access',
+)
+parser.add_argument(
+    '--skip-url-checks',
+    action='store_true',
+    help='do not check that the URLs in the configuration and manifests '
+    'are reachable',
+)
+parser.add_argument(
+    '--max-download-size',
+    type=positive_int,
+    default=Url.max_bytes,
+    metavar='BYTES',
+    help='maximum size of a downloaded file, larger files are rejected',
+)
+parser.add_argument(
+    '--news-per-project',
+    type=positive_int,
+    metavar='COUNT',
+    help='maximum number of news generated per project, the first ones of '
+    'its newsfeed',
+)
+parser.add_argument(
+    '--news-max-age',
+    type=positive_int,
+    metavar='DAYS',
+    help='maximum age of the news generated, in days; newsfeeds are read up '
+    'to their first older news, so they must list the newest news first',
+)
+parser.add_argument(
+    '--news-limit',
+    type=positive_int,
+    metavar='COUNT',
+    help='maximum number of news generated, the most recent ones first',
+)
+parser.add_argument(
+    '--report',
+    type=str,
+    help='JSON file to write phase, project and HTTP request metrics to',
+)
+parser.add_argument(
+    '--summary',
+    action='store_true',
+    help='log a summary table of the phase, project and HTTP request metrics',
+)
 args = parser.parse_args()
 
-logging.info("Loading configuration from '{0}'...".format(args.config))
-try:
-    with open(args.config, 'r') as config_file:
+Url.max_bytes = args.max_download_size
+UrlCheck.skip = args.skip_url_checks
+NewsSection.max_per_project = args.news_per_project
+NewsSection.max_age = args.news_max_age
+NewsSection.max_news = args.news_limit
+
+for rate_limit in args.rate_limit:
+    host, _, rate = rate_limit.partition('=')
+    try:
+        HostThrottle.rates[host] = float(rate)
+    except ValueError:
+        parser.error("invalid rate limit '{0}'".format(rate_limit))
+
+if args.cache:
+    logging.info("Using HTTP cache in '{0}'...".format(args.cache))
+    try:
+        HttpCache.open(args.cache)
+        GitLabRepository.load_default_branches(
+            os.path.join(args.cache, 'gitlab-default-branches.json'),
+        )
+        UrlRegistry.load(os.path.join(args.cache, 'url-checks.json'))
+    except ValueError as cache_error:
+        logging.error('Failed to open HTTP cache:\n{0}'.format(cache_error))
+        sys.exit(1)
+
+if args.record:
+    logging.info("Recording HTTP requests to '{0}'...".format(args.record))
+    FetchArchive.record(args.record)
+elif args.replay:
+    logging.info("Replaying HTTP requests from '{0}'...".format(args.replay))
+    try:
+        FetchArchive.replay(args.replay)
+    except ValueError as archive_error:
+        logging.error('Failed to open archive:\n{0}'.format(archive_error))
+        sys.exit(1)
+
+config_cache = None
+if args.cache:
+    config_cache = os.path.join(args.cache, 'config.json')
+
+with Metrics.timer('phases', 'config'):
+    logging.info("Loading configuration from '{0}'...".format(args.config))
+    try:
+        with open(args.config, 'r') as config_file:
+            with warnings.catch_warnings(record=True) as warns:
+                warnings.simplefilter('always')
+                with UrlCheck() as url_check:
+                    config = Config.from_yaml(
+                        config_file.read(),
+                        cache_path=config_cache,
+                    )
+                if warns:
+                    for warn in warns:
+                        logging.warning('Warning: {0}'.format(warn.message))
+    except (ValidationError, ValueError) as config_error:
+        logging.error('Failed to load configuration:\n{0}'.format(
+            config_error,
+        ))
+        sys.exit(1)
+
+if args.lint:
+    logging.info('Configuration is valid.')
+    sys.exit(0)
+
+with Metrics.timer('phases', 'urls'):
+    logging.info('Checking {0} configuration URLs...'.format(len(url_check)))
+    try:
         with warnings.catch_warnings(record=True) as warns:
             warnings.simplefilter('always')
-            config = Config.from_yaml(config_file.read())
+            url_check.run()
             if warns:
                 for warn in warns:
                     logging.warning('Warning: {0}'.format(warn.message))
-except (ValidationError, ValueError) as config_error:
-    logging.error('Failed to load configuration:\n{0}'.format(config_error))
-    sys.exit(1)
+    except ValueError as url_error:
+        logging.error('Failed to check configuration URLs:\n{0}'.format(
+            url_error,
+        ))
+        sys.exit(1)
+
+with Metrics.timer('phases', 'licenses'):
+    logging.info("Loading SPDX license list from '{0}'...".format(
+        config.licenses,
+    ))
+    try:
+        SpdxLicenseList.from_file(config.licenses)
+    except (ValidationError, ValueError) as spdx_error:
+        logging.error('Failed to load SPDX license list:\n{0}'.format(
+            spdx_error,
+        ))
+        sys.exit(1)
+
+build_state = None
+projects_state = None
+news_state = None
+if args.incremental:
+    logging.info("Loading build state from '{0}'...".format(args.incremental))
+    compose = os.path.dirname(os.path.abspath(__file__))
+    try:
+        build_state = BuildState(args.incremental, BuildState.key_from_files(
+            [str(config.licenses)] + sorted(
+                os.path.join(compose, name) for name in os.listdir(compose)
+                if name.endswith('.py')
+            ),
+        ))
+    except ValueError as state_error:
+        logging.error('Failed to load build state:\n{0}'.format(state_error))
+        sys.exit(1)
+    projects_state = build_state.section(
+        'projects', os.path.join(config.sources, 'content/projects'),
+    )
+    news_state = build_state.section(
+        'news', os.path.join(config.sources, 'content/news'),
+    )
+
+with Metrics.timer('phases', 'redirects'):
+    logging.info("Generating 'redirects' section...")
+    redirects = RedirectSection.from_config(config.redirects)
+
+    logging.info("Writing 'redirects' section...")
+    summary = redirects.write(
+        os.path.join(config.sources, 'content/redirects'),
+    )
+    logging.info("Wrote 'redirects' section: {0}.".format(summary))
+
+with Metrics.timer('phases', 'projects'):
+    logging.info("Generating 'projects' section...")
+    with warnings.catch_warnings(record=True) as warns:
+        warnings.simplefilter('always')
+        projects = ProjectSection.from_config(
+            config.projects, args.workers, projects_state,
+        )
+        if warns:
+            for warn in warns:
+                logging.warning('Warning: {0}'.format(
+                    warn.message,
+                ))
+
+    logging.info("Writing 'projects' section...")
+    summary = projects.write(
+        os.path.join(config.sources, 'content/projects'),
+    )
+    logging.info("Wrote 'projects' section: {0}.".format(summary))
+
+with Metrics.timer('phases', 'news'):
+    logging.info("Generating 'news' section...")
+    with warnings.catch_warnings(record=True) as warns:
+        warnings.simplefilter('always')
+        news = NewsSection.from_config(config.projects, news_state)
+        if warns:
+            for warn in warns:
+                logging.warning('Warning: {0}'.format(warn.message))
+
+    logging.info("Writing 'news' section...")
+    summary = news.write(os.path.join(config.sources, 'content/news'))
+    logging.info("Wrote 'news' section: {0}.".format(summary))
+
+if build_state:
+    try:
+        build_state.save()
+    except ValueError as save_error:
+        logging.warning('Failed to save build state:\n{0}'.format(
+            save_error,
+        ))
+
+if args.cache:
+    try:
+        GitLabRepository.save_default_branches(
+            os.path.join(args.cache, 'gitlab-default-branches.json'),
+        )
+        UrlRegistry.save(os.path.join(args.cache, 'url-checks.json'))
+    except ValueError as save_error:
+        logging.warning('Failed to save HTTP cache:\n{0}'.format(
+            save_error,
+        ))
 
-logging.info("Loading SPDX license list from '{0}'...".format(config.licenses))
 try:
-    SpdxLicenseList.from_file(config.licenses)
-except (ValidationError, ValueError) as spdx_error:
-    logging.error('Failed to load SPDX license list:\n{0}'.format(spdx_error))
-    sys.exit(1)
-
-logging.info("Generating 'redirects' section...")
-redirects = RedirectSection.from_config(config.redirects)
-
-logging.info("Writing 'redirects' section...")
-redirects.write(os.path.join(config.sources, 'content/redirects'))
-
-logging.info("Generating 'projects' section...")
-with warnings.catch_warnings(record=True) as warns:
-    warnings.simplefilter('always')
-    projects = ProjectSection.from_config(config.projects)
-    if warns:
-        for warn in warns:
-            logging.warning('Warning: {0}'.format(
-                warn.message,
-            ))
-
-logging.info("Writing 'projects' section...")
-projects.write(os.path.join(config.sources, 'content/projects'))
-
-logging.info("Generating 'news' section...")
-with warnings.catch_warnings(record=True) as warns:
-    warnings.simplefilter('always')
-    news = NewsSection.from_config(config.projects)
-    if warns:
-        for warn in warns:
-            logging.warning('Warning: {0}'.format(warn.message))
-
-logging.info("Writing 'news' section...")
-news.write(os.path.join(config.sources, 'content/news'))
+    FetchArchive.close()
+except ValueError as archive_error:
+    logging.warning('Failed to save archive:\n{0}'.format(archive_error))
+
+logging.info(
+    'Served {requests} HTTP requests over {connections} connections.'.format(
+        **Session.stats(),
+    ),
+)
+logging.info('Checked {urls} unique URLs, saving {saved} checks.'.format(
+    **UrlRegistry.stats(),
+))
+
+if args.report:
+    try:
+        Metrics.save(args.report)
+    except ValueError as report_error:
+        logging.warning('Failed to save report:\n{0}'.format(report_error))
+
+if args.summary:
+    logging.info('Build summary:\n{0}'.format(Metrics.summary()))
@@ -0,0 +1,198 @@
+# SPDX-FileCopyrightText: 2025 CERN (home.cern)
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Record and replay HTTP requests."""
+
+import base64
+import gzip
+import json
+import os
+import tempfile
+import threading
+from typing import Any, Optional
+
+import requests
+
+RECORD = 'record'
+REPLAY = 'replay'
+
+
+class ReplayError(requests.exceptions.ConnectionError):
+    """Request failed when it was recorded, or missing from the archive."""
+
+
+class FetchArchive:
+    """
+    Archive of the HTTP requests and responses of a build.
+
+    Requests are keyed by method, URL, headers and JSON body. Authorization
+    headers are left out of the archive.
+    """
+
+    _path: Optional[str] = None
+    _mode: Optional[str] = None
+    _entries: dict[str, dict] = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def record(cls, path: str) -> None:
+        """
+        Record every request and response to an archive.
+
+        The archive is written when it is closed.
+
+        Parameters:
+            path: Archive file path.
+        """
+        with cls._lock:
+            cls._path = path
+            cls._mode = RECORD
+            cls._entries = {}
+
+    @classmethod
+    def replay(cls, path: str) -> None:
+        """
+        Answer every request from an archive without network access.
+
+        Parameters:
+            path: Archive file path.
+
+        Raises:
+            ValueError: If loading the archive fails.
+        """
+        try:
+            with gzip.open(path, 'rt') as archive_file:
+                entries = json.load(archive_file)
+        except (OSError, EOFError, json.JSONDecodeError) as load_error:
+            raise ValueError("Failed to load archive '{0}':\n{1}".format(
+                path, load_error,
+            ))
+        if not isinstance(entries, dict):
+            raise ValueError("Invalid archive '{0}'".format(path))
+        with cls._lock:
+            cls._path = path
+            cls._mode = REPLAY
+            cls._entries = entries
+
+    @classmethod
+    def close(cls) -> None:
+        """
+        Write the recorded archive and stop recording or replaying.
+
+        Raises:
+            ValueError: If writing the archive fails.
+        """
+        with cls._lock:
+            path, mode, entries = cls._path, cls._mode, cls._entries
+            cls._path = None
+            cls._mode = None
+            cls._entries = {}
+        if mode != RECORD:
+            return
+        directory = os.path.dirname(os.path.abspath(path))
+        try:
+            descriptor, tmp_path = tempfile.mkstemp(dir=directory)
+            with os.fdopen(descriptor, 'wb') as tmp_file:
+                with gzip.open(tmp_file, 'wt') as archive_file:
+                    json.dump(entries, archive_file, sort_keys=True)
+            os.replace(tmp_path, path)
+        except OSError as save_error:
+            raise ValueError("Failed to save archive '{0}':\n{1}".format(
+                path, save_error,
+            ))
+
+    @classmethod
+    def replaying(cls) -> bool:
+        """
+        Check if requests are answered from an archive.
+
+        Returns:
+            True if an archive is being replayed.
+        """
+        return cls._mode == REPLAY
+
+    @classmethod
+    def load(
+        cls, method: str, url: str, headers: Any, body: Any = None,
+    ) -> requests.Response:
+        """
+        Answer a request from the replayed archive.
+
+        Parameters:
+            method: Request method.
+            url: Request URL.
+            headers: Request headers.
+            body: Request JSON body.
+
+        Returns:
+            The archived response.
+
+        Raises:
+            ReplayError: If the request failed when it was recorded or is
+                missing from the archive.
+        """
+        entry = cls._entries.get(cls._key(method, url, headers, body))
+        if entry is None:
+            raise ReplayError(
+                "Request '{0} {1}' is not archived".format(method, url),
+            )
+        if 'error' in entry:
+            raise ReplayError(entry['error'])
+        res = requests.Response()
+        res.status_code = entry['status']
+        res.url = entry['url']
+        res.reason = entry['reason']
+        res.encoding = entry['encoding']
+        res.headers.update(entry['headers'])
+        res._content = base64.b64decode(entry['content'])  # noqa: WPS437
+        return res
+
+    @classmethod
+    def store(
+        cls,
+        method: str,
+        url: str,
+        headers: Any,
+        body: Any = None,
+        res: Optional[requests.Response] = None,
+        error: Optional[Exception] = None,
+    ) -> None:
+        """
+        Add a response, or the error of a failed request, to the archive.
+
+        Nothing is stored unless an archive is being recorded.
+
+        Parameters:
+            method: Request method.
+            url: Request URL.
+            headers: Request headers.
+            body: Request JSON body.
+            res: Response to store.
+            error: Error raised by the request.
+        """
+        if cls._mode != RECORD:
+            return
+        if res is None:
+            entry = {'error': str(error)}
+        else:
+            entry = {
+                'status': res.status_code,
+                'url': res.url,
+                'reason': res.reason,
+                'encoding': res.encoding,
+                'headers': dict(res.headers),
+                'content': base64.b64encode(res.content).decode(),
+            }
+        with cls._lock:
+            cls._entries[cls._key(method, url, headers, body)] = entry
+
+    @classmethod
+    def _key(cls, method: str, url: str, headers: Any, body: Any) -> str:
+        request = [method, url, sorted(
+            (name, header) for name, header in (headers or {}).items()
+            if name.lower() != 'authorization'
+        )]
+        if body is not None:
+            request.append(body)
+        return json.dumps(request, sort_keys=True)
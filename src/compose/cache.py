@@ -0,0 +1,163 @@
+# SPDX-FileCopyrightText: 2025 CERN (home.cern)
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Cache HTTP responses."""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from dataclasses import dataclass
+from typing import Optional
+
+import requests
+
+
+@dataclass
+class CacheEntry:
+    """Cached HTTP response."""
+
+    url: str
+    content: bytes
+    encoding: Optional[str] = None
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    def validators(self) -> dict[str, str]:
+        """
+        Get the headers to revalidate the entry with a conditional request.
+
+        Returns:
+            Conditional request headers.
+        """
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+    def response(self) -> requests.Response:
+        """
+        Rebuild the response from the cached entry.
+
+        Returns:
+            A requests.Response instance.
+        """
+        res = requests.Response()
+        res.status_code = 200
+        res.url = self.url
+        res.encoding = self.encoding
+        res._content = self.content  # noqa: WPS437
+        return res
+
+
+class HttpCache:
+    """Persistent HTTP cache with ETag and Last-Modified revalidation."""
+
+    _directory: Optional[str] = None
+
+    @classmethod
+    def open(cls, directory: str) -> None:
+        """
+        Store and revalidate GET responses in a directory.
+
+        Parameters:
+            directory: Cache directory path.
+
+        Raises:
+            ValueError: If creating the cache directory fails.
+        """
+        try:
+            os.makedirs(directory, exist_ok=True)
+        except OSError as dir_error:
+            raise ValueError("Failed to create cache '{0}':\n{1}".format(
+                directory, dir_error,
+            ))
+        cls._directory = directory
+
+    @classmethod
+    def close(cls) -> None:
+        """Stop caching responses."""
+        cls._directory = None
+
+    @classmethod
+    def load(cls, url: str, headers: Optional[dict]) -> Optional[CacheEntry]:
+        """
+        Load the cached response for a request.
+
+        Parameters:
+            url: Request URL.
+            headers: Request headers.
+
+        Returns:
+            The cached entry, or None if there is none.
+        """
+        if cls._directory is None:
+            return None
+        path = cls._path(url, headers)
+        try:
+            with open('{0}.json'.format(path), 'r') as meta_file:
+                meta = json.load(meta_file)
+            with open('{0}.body'.format(path), 'rb') as body_file:
+                return CacheEntry(content=body_file.read(), **meta)
+        except (OSError, TypeError, ValueError):
+            return None
+
+    @classmethod
+    def store(
+        cls, url: str, headers: Optional[dict], res: requests.Response,
+    ) -> None:
+        """
+        Store a response if it can be revalidated later.
+
+        Parameters:
+            url: Request URL.
+            headers: Request headers.
+            res: Response to store.
+        """
+        if cls._directory is None:
+            return
+        entry = CacheEntry(
+            url=url,
+            content=res.content,
+            encoding=res.encoding,
+            etag=res.headers.get('ETag'),
+            last_modified=res.headers.get('Last-Modified'),
+        )
+        if not entry.validators():
+            return
+        meta = {
+            'url': entry.url,
+            'encoding': entry.encoding,
+            'etag': entry.etag,
+            'last_modified': entry.last_modified,
+        }
+        path = cls._path(url, headers)
+        try:
+            cls._write('{0}.body'.format(path), entry.content)
+            cls._write('{0}.json'.format(path), json.dumps(meta).encode())
+        except OSError as write_error:
+            logging.warning("Failed to cache '{0}':\n{1}".format(
+                url, write_error,
+            ))
+
+    @classmethod
+    def _path(cls, url: str, headers: Optional[dict]) -> str:
+        key = json.dumps([url, sorted((headers or {}).items())])
+        return os.path.join(
+            cls._directory, hashlib.sha256(key.encode()).hexdigest(),
+        )
+
+    @classmethod
+    def _write(cls, path: str, content: bytes) -> None:
+        descriptor, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path))
+        try:
+            with os.fdopen(descriptor, 'wb') as tmp_file:
+                tmp_file.write(content)
+            os.replace(tmp_path, path)
+        except OSError:
+            os.unlink(tmp_path)
+            raise
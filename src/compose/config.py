@@ -6,12 +6,15 @@
 
 
 import datetime
-import re
+import hashlib
 from functools import cached_property
 from typing import Annotated, Optional
 
+import markdown_preprocess
+import newsfeed
 from license import License, SpdxLicenseList
 from manifest import Manifest
+from newsfeed import NewsEntry
 from pydantic import (
     DirectoryPath,
     EmailStr,
@@ -20,11 +23,19 @@ from pydantic import (
     ValidationError,
     computed_field,
     model_validator,
-    validate_call,
 )
 from repository import Repository
-from schema import AnnotatedStr, AnnotatedStrList, BaseModelForbidExtra, Schema
-from url import Url, UrlList
+from schema import (
+    AnnotatedStr,
+    AnnotatedStrList,
+    BaseModelForbidExtra,
+    Schema,
+    load_yaml,
+    validate_str,
+)
+from url import Url, UrlCheck, UrlContent, UrlList
+
+MANIFEST_PATH = '.ohwr.yaml'
 
 
 class Contact(BaseModelForbidExtra):
@@ -42,9 +53,9 @@ class News(BaseModelForbidExtra):
     images: Optional[UrlList] = None
     project: Optional['Project'] = Field(default=None, exclude=True)
     description: Optional[AnnotatedStr] = Field(default=None, exclude=True)
+    number: Optional[int] = Field(default=None, exclude=True)
 
     @classmethod
-    @validate_call
     def from_markdown(cls, md: AnnotatedStr):
         """
         Load news from a markdown string.
@@ -54,58 +65,39 @@ class News(BaseModelForbidExtra):
 
         Returns:
             News: An instance of the News class.
+
+        Raises:
+            ValidationError: If the markdown string is blank.
+            ValueError: If the markdown string has no valid news entry.
         """
-        news_data = {
-            'title': cls._parse_title(md), 'date': cls._parse_date(md),
-        }
-        images = cls._parse_images(md)
-        if images:
-            news_data['images'] = images
-        description = cls._parse_description(md)
-        if description:
-            news_data['description'] = description
-        return cls(**news_data)
+        for entry in newsfeed.entries(validate_str(md)):
+            return cls.from_entry(entry)
+        raise ValueError('Failed to parse title')
 
     @classmethod
-    @validate_call
-    def _parse_title(cls, md: str) -> str:
-        try:
-            return re.search('^## (.+)', md).group(1)
-        except (re.error, TypeError, IndexError) as title_error:
-            raise ValueError('Failed to parse title:\n{0}'.format(title_error))
+    def from_entry(cls, entry: NewsEntry) -> 'News':
+        """
+        Load news from a newsfeed entry.
 
-    @classmethod
-    @validate_call
-    def _parse_date(cls, md: str) -> datetime.date:
-        try:
-            date = re.search(r'\d{4}-\d{2}-\d{2}', md, re.MULTILINE).group()
-        except (re.error, TypeError, AttributeError) as error:
-            raise ValueError('Failed to fetch date:\n{0}'.format(error))
-        return datetime.date.fromisoformat(date)
+        Parameters:
+            entry: The newsfeed entry.
 
-    @classmethod
-    @validate_call
-    def _parse_images(cls, md: str) -> list[str]:
-        try:
-            return re.findall(r'!\[.*?\]\((.*?)\)', md)
-        except re.error as error:
-            raise ValueError('Failed to parse images:\n{0}'.format(error))
+        Returns:
+            News: An instance of the News class.
 
-    @classmethod
-    @validate_call
-    def _parse_description(cls, md: str) -> str:
-        exp = r'\d{4}-\d{2}-\d{2}.*?\n(.*)'
-        try:
-            description = re.search(exp, md, re.DOTALL).group(1)
-        except (re.error, TypeError, IndexError) as description_error:
-            raise ValueError('Failed to parse description:\n{0}'.format(
-                description_error,
-            ))
+        Raises:
+            ValueError: If the entry is not valid news.
+        """
+        news_data = {'title': entry.title, 'date': entry.date}
+        if entry.images:
+            news_data['images'] = entry.images
+        if entry.description:
+            news_data['description'] = entry.description
         try:
-            return re.sub(r'!\[.*?\]\(.*?\)', '', description, flags=re.DOTALL)
-        except (re.error, TypeError) as cleanup_error:
-            raise ValueError('Failed to cleanup description:\n{0}'.format(
-                cleanup_error,
+            return cls(**news_data)
+        except ValidationError as news_error:
+            raise ValueError('Invalid news at line {0}:\n{1}'.format(
+                entry.line, news_error,
             ))
 
 
@@ -119,6 +111,36 @@ class Project(BaseModelForbidExtra):
     tags: Optional[AnnotatedStrList] = None
     compatibles: Optional[AnnotatedStrList] = None
 
+    @classmethod
+    def prefetch(cls, projects: list['Project']) -> None:
+        """
+        Fetch the manifests of many projects in batches.
+
+        Parameters:
+            projects: Projects to fetch the manifests of.
+        """
+        Repository.prefetch(
+            [project.repository for project in projects], MANIFEST_PATH,
+        )
+
+    @cached_property
+    def manifest_yaml(self) -> str:
+        """
+        Get manifest YAML.
+
+        Returns:
+            str: project manifest YAML string.
+
+        Raises:
+            ValueError: If fetching the manifest fails.
+        """
+        try:
+            return self.repository.fetch(MANIFEST_PATH)
+        except ValueError as fetch_error:
+            raise ValueError("Failed to fetch '{0}' from '{1}':\n{2}".format(
+                MANIFEST_PATH, self.repository.url, fetch_error,
+            ))
+
     @cached_property
     def manifest(self) -> Manifest:
         """
@@ -130,14 +152,7 @@ class Project(BaseModelForbidExtra):
         Raises:
             ValueError: If loading the manifest fails.
         """
-        try:
-            manifest_yaml = self.repository.fetch('.ohwr.yaml')
-        except ValueError as fetch_error:
-            raise ValueError(
-                "Failed to fetch '.ohwr.yaml' from '{0}':\n{1}".format(
-                    self.repository.url, fetch_error,
-                ),
-            )
+        manifest_yaml = self.manifest_yaml
         try:
             return Manifest.from_yaml(manifest_yaml)
         except (ValidationError, ValueError) as manifest_error:
@@ -145,6 +160,36 @@ class Project(BaseModelForbidExtra):
                 self.repository.url, manifest_error,
             ))
 
+    @cached_property
+    def fingerprint(self) -> str:
+        """
+        Get fingerprint.
+
+        The fingerprint changes whenever the project configuration, the
+        manifest, or the description or newsfeed it points to changes. It is
+        computed without validating the manifest.
+
+        Returns:
+            str: fingerprint hex digest.
+
+        Raises:
+            ValueError: If fetching the project inputs fails.
+        """
+        digest = hashlib.sha256(self.model_dump_json(
+            include=set(type(self).model_fields),
+        ).encode())
+        digest.update(self.manifest_yaml.encode())
+        manifest_data = load_yaml(self.manifest_yaml)
+        if not isinstance(manifest_data, dict):
+            raise ValueError('Invalid manifest in {0}'.format(
+                self.repository.url,
+            ))
+        for field_name in ('description', 'newsfeed'):
+            url = manifest_data.get(field_name)
+            if isinstance(url, str):
+                digest.update(UrlContent.create(url).text.encode())
+        return digest.hexdigest()
+
     @cached_property
     def description(self) -> str:
         """
@@ -156,19 +201,11 @@ class Project(BaseModelForbidExtra):
         Raises:
             ValueError: If loading the description fails.
         """
-        md = self.manifest.description.text
-        try:
-            sections = re.split('(^#.*$)', md, flags=re.MULTILINE)
-        except (re.error, TypeError) as split_error:
-            raise ValueError('Failed to split sections:\n{0}'.format(
-                split_error,
-            ))
-        for section in sections:
-            md = re.sub('<!--(.*?)-->', '', section, flags=re.DOTALL).strip()
-            md = re.sub(r'^\s*-{3,}\s*$', '', md, flags=re.MULTILINE).strip()
-            md = re.sub(r'!\[.*?\]\(.*?\)', '', md, flags=re.DOTALL).strip()
-            if not md.startswith('#') and md:
-                return md
+        description = markdown_preprocess.first_section(
+            self.manifest.description.text,
+        )
+        if description:
+            return description
         raise ValueError('Failed to parse the Markdown description.')
 
     @computed_field
@@ -183,10 +220,9 @@ class Project(BaseModelForbidExtra):
         Raises:
             ValueError: If parsing the summary from the description fails.
         """
-        exp = r'^.*?(?=\.\s|\.\r?\n|:\r?\n|\r?\n\r?\n|\.$|$)'
-        match = re.search(exp, self.description, re.DOTALL)
-        if match:
-            return match.group()
+        summary = markdown_preprocess.summary(self.description)
+        if summary is not None:
+            return summary
         raise ValueError('Failed to parse the summary from the description.')
 
     @computed_field
@@ -218,31 +254,58 @@ class Project(BaseModelForbidExtra):
         Get news.
 
         Returns:
-            list[News]: news list.
+            list[News]: news list, oldest first.
+
+        Raises:
+            ValueError: If loading the news fails.
+        """
+        return self.recent_news()
+
+    def recent_news(
+        self,
+        limit: Optional[int] = None,
+        since: Optional[datetime.date] = None,
+    ) -> list[News]:
+        """
+        Get the most recent news.
+
+        Newsfeeds list the newest news first, so the newsfeed is only parsed
+        up to the oldest news returned. Each news is numbered by its
+        position in the newsfeed, counting from the oldest one, so the
+        numbers do not depend on the limits.
+
+        Parameters:
+            limit: Maximum number of news, or None for no limit.
+            since: Date of the oldest news, or None for no limit.
+
+        Returns:
+            list[News]: news list, oldest first.
 
         Raises:
             ValueError: If loading the news fails.
         """
-        if not self.manifest.newsfeed:
+        if not self.manifest.newsfeed or limit == 0:
             return []
-        md = self.manifest.newsfeed.text
-        md = re.sub('<!--(.*?)-->', '', md, flags=re.DOTALL).strip()
-        try:
-            matches = re.findall(r'(## .+?)(?=\n## |$)', md, re.DOTALL)
-        except (re.error, TypeError) as re_error:
-            raise ValueError('Failed to process Markdown:\n{0}'.format(
-                re_error,
-            ))
+        feed = newsfeed.Newsfeed(self.manifest.newsfeed.text)
+        total = len(feed)
         news_list = []
-        for match in matches:
+        with UrlCheck() as url_check:
             try:
-                news = News.from_markdown(match)
-            except (ValidationError, ValueError) as news_error:
+                for position, entry in enumerate(feed):
+                    if since is not None and entry.date < since:
+                        break
+                    news = News.from_entry(entry)
+                    news.project = self
+                    news.number = total - position
+                    news_list.append(news)
+                    if len(news_list) == limit:
+                        break
+            except ValueError as news_error:
                 raise ValueError('Failed to load news:\n{0}'.format(
                     news_error,
                 ))
-            news.project = self
-            news_list.insert(0, news)
+        url_check.run()
+        news_list.reverse()
         return news_list
 
 
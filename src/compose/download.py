@@ -0,0 +1,115 @@
+# SPDX-FileCopyrightText: 2025 CERN (home.cern)
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Download HTTP response bodies with a size limit."""
+
+import codecs
+from typing import Optional
+
+import requests
+
+CHUNK_SIZE = 64 * 1024
+
+DEFAULT_ENCODING = 'utf-8'
+
+REJECTED_TYPES = (
+    'application/gzip',
+    'application/octet-stream',
+    'application/pdf',
+    'application/zip',
+    'audio/',
+    'font/',
+    'image/',
+    'text/html',
+    'video/',
+)
+
+
+class DownloadError(requests.exceptions.RequestException):
+    """Response body rejected before or while it is downloaded."""
+
+
+def media_type(content_type: str) -> tuple[str, Optional[str]]:
+    """
+    Split a Content-Type header into its media type and charset.
+
+    Parameters:
+        content_type: Content-Type header value.
+
+    Returns:
+        The lowercase media type, and the charset or None if it has none.
+    """
+    media, *params = content_type.split(';')
+    charset = None
+    for param in params:
+        name, _, param_value = param.partition('=')
+        if name.strip().lower() == 'charset':
+            charset = param_value.strip().strip('"\'') or None
+    return media.strip().lower(), charset
+
+
+def download(res: requests.Response, max_bytes: int) -> requests.Response:
+    """
+    Download the body of a streamed response.
+
+    The response is rejected before its body is downloaded if it is
+    successful and its media type is binary or HTML, or if its
+    Content-Length exceeds max_bytes, and while it is downloaded as soon as
+    it exceeds max_bytes. The body is decoded with the charset of the
+    Content-Type header, or UTF-8 if it has none, so the encoding is never
+    guessed from the content.
+
+    Parameters:
+        res: Response sent with stream=True.
+        max_bytes: Maximum body size in bytes, after content decoding.
+
+    Returns:
+        The response, with its body downloaded.
+
+    Raises:
+        DownloadError: If the response is rejected.
+    """
+    try:
+        media, charset = media_type(res.headers.get('Content-Type', ''))
+        if res.ok and media.startswith(REJECTED_TYPES):
+            raise DownloadError(
+                "Content type '{0}' of '{1}' is not text".format(
+                    media, res.url,
+                ),
+                response=res,
+            )
+        length = res.headers.get('Content-Length', '')
+        if length.isdigit() and int(length) > max_bytes:
+            raise DownloadError(
+                "Content of '{0}' exceeds {1} bytes".format(
+                    res.url, max_bytes,
+                ),
+                response=res,
+            )
+        chunks = []
+        received = 0
+        for chunk in res.iter_content(CHUNK_SIZE):
+            received += len(chunk)
+            if received > max_bytes:
+                raise DownloadError(
+                    "Content of '{0}' exceeds {1} bytes".format(
+                        res.url, max_bytes,
+                    ),
+                    response=res,
+                )
+            chunks.append(chunk)
+    finally:
+        res.close()
+    res._content = b''.join(chunks)  # noqa: WPS437
+    res.encoding = _encoding(charset)
+    return res
+
+
+def _encoding(charset: Optional[str]) -> str:
+    if charset:
+        try:
+            return codecs.lookup(charset).name
+        except LookupError:
+            return DEFAULT_ENCODING
+    return DEFAULT_ENCODING
@@ -5,11 +5,14 @@
 """Generate Hugo content."""
 
 from collections import UserDict
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import logging
 import os
+import tempfile
+from typing import Any, Iterable, Optional
 
 import yaml
+from state import SectionState
 
 
 @dataclass
@@ -19,13 +22,18 @@ class Page:
     front_matter: dict
     markdown: str
 
-    def write(self, path: str) -> None:
+    def write(self, path: str) -> bool:
         """
-        Write Hugo page to a file.
+        Write Hugo page to a file, unless the file is already up to date.
+
+        The file is replaced atomically, so readers never see a partial page.
 
         Parameters:
             path: File path.
 
+        Returns:
+            True if the file was written, False if it was unchanged.
+
         Raises:
             ValueError: If writing the Hugo page to a file fails.
         """
@@ -37,32 +45,156 @@ class Page:
             )
         page = '---\n{0}---\n{1}'.format(front_matter, self.markdown)
         try:
-            with open(path, 'w') as hugo_file:
-                hugo_file.write(page)
+            with open(path, 'r') as hugo_file:
+                if hugo_file.read() == page:
+                    return False
+        except (OSError, UnicodeDecodeError):
+            pass  # noqa: WPS420
+        try:
+            self._replace(path, page)
         except OSError as write_error:
             raise ValueError("Failed to write Hugo page to '{0}':\n{1}".format(
                 path, write_error,
             ))
+        return True
+
+    def _replace(self, path: str, page: str) -> None:
+        with tempfile.NamedTemporaryFile(
+            'w', dir=os.path.dirname(path), prefix='.', delete=False,
+        ) as tmp_file:
+            tmp_file.write(page)
+        try:
+            os.chmod(tmp_file.name, 0o644)  # noqa: WPS432
+            os.replace(tmp_file.name, path)
+        except OSError:
+            os.unlink(tmp_file.name)
+            raise
+
+
+@dataclass
+class WriteSummary:
+    """Summary of the pages written by a section."""
+
+    written: list[str] = field(default_factory=list)
+    unchanged: list[str] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+
+    def __str__(self) -> str:
+        """
+        Count the pages.
+
+        Returns:
+            Number of written, unchanged and removed pages.
+        """
+        return '{0} written, {1} unchanged, {2} removed'.format(
+            len(self.written), len(self.unchanged), len(self.removed),
+        )
 
 
 class Section(UserDict[str, Page]):
     """Hugo section."""
 
-    def write(self, path: str) -> None:
+    def __init__(
+        self,
+        pages: Optional[dict[str, Page]] = None,
+        kept: Iterable[str] = (),
+    ) -> None:
+        """
+        Initialize the section.
+
+        Parameters:
+            pages: Section pages.
+            kept: Names of the existing pages to leave as they are.
+        """
+        super().__init__(pages)
+        self.kept = set(kept)
+
+    def write(self, path: str) -> WriteSummary:
         """
         Write the section to files.
 
+        Unchanged pages are not rewritten, and the pages that are neither in
+        the section nor kept are removed.
+
         Parameters:
             path: Content directory path.
+
+        Returns:
+            WriteSummary: The written, unchanged and removed pages.
         """
+        summary = WriteSummary()
         for name, page in self.data.items():
-            logging.info("Writing '{0}' page...".format(name))
             try:
-                page.write(self._page_path(path, name))
+                written = page.write(self._page_path(path, name))
             except ValueError as write_error:
                 logging.error("Failed to write '{0}' page:\n{1}".format(
                     name, write_error,
                 ))
+                continue
+            if written:
+                logging.info("Wrote '{0}' page.".format(name))
+                summary.written.append(name)
+            else:
+                summary.unchanged.append(name)
+        for name in self._stale_pages(path):
+            logging.info("Removing '{0}' page...".format(name))
+            try:
+                os.remove(self._page_path(path, name))
+            except OSError as remove_error:
+                logging.error("Failed to remove '{0}' page:\n{1}".format(
+                    name, remove_error,
+                ))
+                continue
+            summary.removed.append(name)
+        return summary
+
+    def _is_kept(self, name: str) -> bool:
+        """
+        Check if an existing page must be left as it is.
+
+        Parameters:
+            name: Page name.
+
+        Returns:
+            True if the page is kept.
+        """
+        return name in self.kept
+
+    def _stale_pages(self, path: str) -> list[str]:
+        try:
+            file_names = sorted(os.listdir(path))
+        except FileNotFoundError:
+            return []
+        stale_pages = []
+        for file_name in file_names:
+            name, extension = os.path.splitext(file_name)
+            if extension != '.md' or name.startswith('_'):
+                continue
+            if name not in self.data and not self._is_kept(name):
+                stale_pages.append(name)
+        return stale_pages
+
+    @classmethod
+    def _fingerprint(
+        cls, config: Any, section_state: Optional[SectionState],
+    ) -> Optional[str]:
+        """
+        Get the fingerprint of a configuration for an incremental build.
+
+        Parameters:
+            config: Configuration with a fingerprint.
+            section_state: State of the section in the previous build.
+
+        Returns:
+            The fingerprint, or None if the build is not incremental or the
+            fingerprint is not available.
+        """
+        if section_state is None:
+            return None
+        try:
+            return config.fingerprint
+        except ValueError:
+            return None
 
     def _page_path(self, path: str, name: str) -> str:
         """
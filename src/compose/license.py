@@ -6,6 +6,7 @@
 
 
 import json
+from typing import Any
 
 from pydantic import Field, FilePath, ValidationError, validate_call
 from schema import AnnotatedStr, BaseModelForbidExtra
@@ -22,16 +23,31 @@ class License(BaseModelForbidExtra):
 class SpdxLicenseList:
     """SPDX license list data."""
 
-    _spdx_license_list: list[License] = []
+    _records: dict[str, tuple[Any, Any]] = {}
+    _licenses: dict[str, License] = {}
+    _aliases: dict[str, str] = {}
 
     @classmethod
     @validate_call
-    def from_json(cls, licenses_json: AnnotatedStr):
+    def from_json(
+        cls,
+        licenses_json: AnnotatedStr,
+        case_insensitive: bool = False,
+        resolve_deprecated: bool = False,
+    ):
         """
         Load SPDX license list data from JSON.
 
+        The license list replaces any previously loaded one. Only the name
+        and reference of each license are kept, indexed by SPDX license
+        identifier; License objects are created when first requested.
+
         Parameters:
             licenses_json: SPDX license list data JSON string.
+            case_insensitive: Whether to also look up identifiers ignoring
+                their case.
+            resolve_deprecated: Whether to look up deprecated identifiers as
+                their replacement (e.g. 'GPL-2.0+' as 'GPL-2.0-or-later').
 
         Raises:
             ValueError: if JSON is not valid.
@@ -40,45 +56,74 @@ class SpdxLicenseList:
             licenses_data = json.loads(licenses_json)
         except (TypeError, json.JSONDecodeError) as json_error:
             raise ValueError('Failed to load JSON:\n{0}'.format(json_error))
+        records = {}
+        deprecated = []
         for license_data in licenses_data['licenses']:
             try:
-                spdx_license = License(
-                    id=license_data['licenseId'],
-                    name=license_data['name'],
-                    url=license_data['reference'],
-                )
-            except (ValidationError, KeyError) as license_error:
+                license_id = license_data['licenseId']
+                record = (license_data['name'], license_data['reference'])
+            except KeyError as license_error:
                 raise ValueError('Failed to load license data:\n{0}'.format(
                     license_error,
                 ))
-            cls._spdx_license_list.append(spdx_license)
+            if license_id in records:
+                raise ValueError("Duplicate SPDX identifier '{0}'.".format(
+                    license_id,
+                ))
+            records[license_id] = record
+            if license_data.get('isDeprecatedLicenseId'):
+                deprecated.append(license_id)
+        aliases = {}
+        if resolve_deprecated:
+            aliases.update(cls._deprecated_aliases(deprecated, records))
+        if case_insensitive:
+            for license_id in records:
+                aliases.setdefault(
+                    license_id.lower(), aliases.get(license_id, license_id),
+                )
+        cls._records = records
+        cls._licenses = {}
+        cls._aliases = aliases
 
     @classmethod
     @validate_call
-    def from_file(cls, path: FilePath):
+    def from_file(
+        cls,
+        path: FilePath,
+        case_insensitive: bool = False,
+        resolve_deprecated: bool = False,
+    ):
         """
         Load SPDX license list data from JSON file.
 
         Parameters:
             path: SPDX license list data JSON file path.
+            case_insensitive: Whether to also look up identifiers ignoring
+                their case.
+            resolve_deprecated: Whether to look up deprecated identifiers as
+                their replacement.
 
         Raises:
             ValueError: if file is not valid.
         """
         try:
             with open(path, 'r') as licenses_file:
-                cls.from_json(licenses_file.read())
+                cls.from_json(
+                    licenses_file.read(), case_insensitive, resolve_deprecated,
+                )
         except (ValueError, FileNotFoundError) as file_error:
             raise ValueError("Failed to load file '{0}':\n{1}".format(
                 path, file_error,
             ))
 
     @classmethod
-    @validate_call
-    def get_license(cls, license_id: AnnotatedStr) -> License:
+    def get_license(cls, license_id: str) -> License:
         """
         Find license data for an SPDX license identifier.
 
+        The identifier is not validated, since it comes from a validated
+        manifest.
+
         Parameters:
             license_id: license identifier string.
 
@@ -88,7 +133,37 @@ class SpdxLicenseList:
         Raises:
             ValueError: if no data was found for an SPDX license identifier.
         """
-        for spdx_license in cls._spdx_license_list:
-            if spdx_license.id == license_id:
-                return spdx_license
-        raise ValueError("Unknown SPDX identifier '{0}'.".format(license_id))
+        canonical_id = cls._aliases.get(license_id, license_id)
+        if canonical_id not in cls._records:
+            canonical_id = cls._aliases.get(license_id.lower(), canonical_id)
+        spdx_license = cls._licenses.get(canonical_id)
+        if spdx_license is not None:
+            return spdx_license
+        try:
+            name, reference = cls._records[canonical_id]
+        except KeyError:
+            raise ValueError("Unknown SPDX identifier '{0}'.".format(
+                license_id,
+            ))
+        try:
+            spdx_license = License(id=canonical_id, name=name, url=reference)
+        except ValidationError as license_error:
+            raise ValueError('Failed to load license data:\n{0}'.format(
+                license_error,
+            ))
+        cls._licenses[canonical_id] = spdx_license
+        return spdx_license
+
+    @classmethod
+    def _deprecated_aliases(
+        cls, deprecated: list[str], records: dict[str, tuple[Any, Any]],
+    ) -> dict[str, str]:
+        aliases = {}
+        for license_id in deprecated:
+            if license_id.endswith('+'):
+                replacement = '{0}-or-later'.format(license_id[:-1])
+            else:
+                replacement = '{0}-only'.format(license_id)
+            if replacement in records:
+                aliases[license_id] = replacement
+        return aliases
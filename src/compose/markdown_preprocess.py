@@ -0,0 +1,99 @@
+# SPDX-FileCopyrightText: 2025 CERN (home.cern)
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Preprocess Markdown documents."""
+
+import re
+from typing import Optional
+
+COMMENT = re.compile('<!--.*?-->', re.DOTALL)
+
+IMAGE = re.compile(r'!\[.*?\]\(.*?\)', re.DOTALL)
+
+IMAGE_URL = re.compile(r'!\[.*?\]\((.*?)\)')
+
+SUMMARY = re.compile(
+    r'^.*?(?=\.\s|\.\r?\n|:\r?\n|\r?\n\r?\n|\.$|$)', re.DOTALL,
+)
+
+TOKENS = re.compile(
+    '|'.join((
+        '(?P<comment><!--.*?-->)',
+        '(?P<heading>^#[^\n]*)',
+        r'(?P<rule>^\s*-{3,}\s*$)',
+        r'(?P<image>!\[.*?\]\(.*?\))',
+    )),
+    re.DOTALL | re.MULTILINE,
+)
+
+
+def strip_images(md: str) -> str:
+    """
+    Remove the images of a Markdown document.
+
+    Parameters:
+        md: Markdown document.
+
+    Returns:
+        The document without images.
+    """
+    return IMAGE.sub('', md)
+
+
+def images(md: str) -> list[str]:
+    """
+    Get the image URLs of a Markdown document.
+
+    Parameters:
+        md: Markdown document.
+
+    Returns:
+        URLs of the images written on a single line, in document order.
+    """
+    return IMAGE_URL.findall(md)
+
+
+def first_section(md: str) -> Optional[str]:
+    """
+    Get the first section of a Markdown document with prose in it.
+
+    Comments, horizontal rules and images are removed. The document is
+    scanned once, up to the end of the section found.
+
+    Parameters:
+        md: Markdown document.
+
+    Returns:
+        The text of the section without its heading, or None if no section
+        has prose in it.
+    """
+    pieces = []
+    position = 0
+    for match in TOKENS.finditer(md):
+        pieces.append(md[position:match.start()])
+        position = match.end()
+        if match.lastgroup == 'heading':
+            section = ''.join(pieces).strip()
+            if section:
+                return section
+            pieces = []
+    pieces.append(md[position:])
+    return ''.join(pieces).strip() or None
+
+
+def summary(text: str) -> Optional[str]:
+    """
+    Get the first sentence of a text.
+
+    Parameters:
+        text: Text to summarize.
+
+    Returns:
+        The text up to its first full stop, colon or blank line, or None if
+        it has none.
+    """
+    match = SUMMARY.search(text)
+    if match:
+        return match.group()
+    return None
@@ -0,0 +1,229 @@
+# SPDX-FileCopyrightText: 2025 CERN (home.cern)
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Measure build phases and HTTP requests."""
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Iterator
+from urllib.parse import urlsplit
+
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+
+def _empty_histogram() -> list[int]:
+    return [0] * (len(LATENCY_BUCKETS) + 1)
+
+
+@dataclass
+class HostMetrics:
+    """Requests sent to a host."""
+
+    requests: int = 0
+    errors: int = 0
+    retries: int = 0
+    received: int = 0
+    latency: float = 0
+    histogram: list[int] = field(default_factory=_empty_histogram)
+
+    def observe(self, latency: float, received: int, failed: bool) -> None:
+        """
+        Count a request.
+
+        Parameters:
+            latency: Seconds until the response was received.
+            received: Number of bytes received.
+            failed: Whether the request failed without a response.
+        """
+        self.requests += 1
+        self.errors += int(failed)
+        self.received += received
+        self.latency += latency
+        bucket = 0
+        while bucket < len(LATENCY_BUCKETS) and latency > LATENCY_BUCKETS[
+            bucket
+        ]:
+            bucket += 1
+        self.histogram[bucket] += 1
+
+    def as_dict(self) -> dict[str, Any]:
+        """
+        Get the host metrics as a JSON serializable dictionary.
+
+        Returns:
+            Request, error and retry counts, bytes received, total latency and
+            latency histogram keyed by upper bound in seconds.
+        """
+        bounds = ['{0:g}'.format(bound) for bound in LATENCY_BUCKETS]
+        return {
+            'requests': self.requests,
+            'errors': self.errors,
+            'retries': self.retries,
+            'bytes': self.received,
+            'latency': round(self.latency, 6),
+            'histogram': dict(zip(bounds + ['inf'], self.histogram)),
+        }
+
+
+class Metrics:
+    """Timers and HTTP request metrics of a build."""
+
+    _lock = threading.Lock()
+    _timers: dict[str, dict[str, float]] = {}
+    _hosts: dict[str, HostMetrics] = {}
+
+    @classmethod
+    @contextmanager
+    def timer(cls, category: str, name: str) -> Iterator[None]:
+        """
+        Time a block of code.
+
+        Times of the same category and name add up.
+
+        Parameters:
+            category: Timer category (e.g. 'phases' or 'projects').
+            name: Timer name within its category.
+
+        Yields:
+            Nothing; the block is timed until it exits.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            with cls._lock:
+                timers = cls._timers.setdefault(category, {})
+                timers[name] = timers.get(name, 0) + elapsed
+
+    @classmethod
+    def record_request(
+        cls, url: str, latency: float, received: int = 0, failed: bool = False,
+    ) -> None:
+        """
+        Count a request sent to the host of a URL.
+
+        Parameters:
+            url: Request URL.
+            latency: Seconds until the response was received.
+            received: Number of bytes received.
+            failed: Whether the request failed without a response.
+        """
+        with cls._lock:
+            cls._host(url).observe(latency, received, failed)
+
+    @classmethod
+    def record_retry(cls, url: str) -> None:
+        """
+        Count a retried request to the host of a URL.
+
+        Parameters:
+            url: Request URL.
+        """
+        with cls._lock:
+            cls._host(url).retries += 1
+
+    @classmethod
+    def report(cls) -> dict[str, Any]:
+        """
+        Get the metrics of the build.
+
+        Returns:
+            Timers in seconds by category and name, and metrics by host.
+        """
+        with cls._lock:
+            return {
+                'timers': {
+                    category: {
+                        name: round(elapsed, 6)
+                        for name, elapsed in timers.items()
+                    }
+                    for category, timers in cls._timers.items()
+                },
+                'hosts': {
+                    host: host_metrics.as_dict()
+                    for host, host_metrics in sorted(cls._hosts.items())
+                },
+            }
+
+    @classmethod
+    def save(cls, path: str) -> None:
+        """
+        Save the metrics of the build as JSON.
+
+        Parameters:
+            path: JSON file path.
+
+        Raises:
+            ValueError: If writing the file fails.
+        """
+        tmp_path = '{0}.tmp'.format(path)
+        try:
+            with open(tmp_path, 'w') as report_file:
+                json.dump(cls.report(), report_file, indent=2)
+            os.replace(tmp_path, path)
+        except OSError as save_error:
+            raise ValueError("Failed to save file '{0}':\n{1}".format(
+                path, save_error,
+            ))
+
+    @classmethod
+    def summary(cls, slowest: int = 10) -> str:
+        """
+        Summarize the metrics of the build in tables.
+
+        Parameters:
+            slowest: Number of slowest projects to list.
+
+        Returns:
+            Phase times, slowest projects and requests by host.
+        """
+        report = cls.report()
+        timers = report['timers']
+        lines = ['{0:<32} {1:>10}'.format('phase', 'seconds')]
+        for phase, elapsed in timers.get('phases', {}).items():
+            lines.append('{0:<32} {1:>10.3f}'.format(phase, elapsed))
+        projects = sorted(
+            timers.get('projects', {}).items(),
+            key=lambda project: project[1],
+            reverse=True,
+        )
+        lines.append('')
+        lines.append('{0:<32} {1:>10}'.format('project', 'seconds'))
+        for project_id, elapsed in projects[:slowest]:
+            lines.append('{0:<32} {1:>10.3f}'.format(project_id, elapsed))
+        lines.append('')
+        lines.append('{0:<32} {1:>8} {2:>7} {3:>7} {4:>12} {5:>9}'.format(
+            'host', 'requests', 'errors', 'retries', 'bytes', 'mean (s)',
+        ))
+        for host, host_metrics in report['hosts'].items():
+            lines.append(
+                '{0:<32} {1:>8} {2:>7} {3:>7} {4:>12} {5:>9.3f}'.format(
+                    host,
+                    host_metrics['requests'],
+                    host_metrics['errors'],
+                    host_metrics['retries'],
+                    host_metrics['bytes'],
+                    host_metrics['latency'] / max(host_metrics['requests'], 1),
+                ),
+            )
+        return '\n'.join(lines)
+
+    @classmethod
+    def clear(cls) -> None:
+        """Reset every timer and request metric."""
+        with cls._lock:
+            cls._timers = {}
+            cls._hosts = {}
+
+    @classmethod
+    def _host(cls, url: str) -> HostMetrics:
+        host = urlsplit(url).netloc
+        if host not in cls._hosts:
+            cls._hosts[host] = HostMetrics()
+        return cls._hosts[host]
@@ -4,10 +4,15 @@
 
 """Load news."""
 
+import datetime
 import logging
+import re
+from typing import ClassVar, Iterable, Optional
 
 from config import News, Project
 from hugo import Page, Section
+from metrics import Metrics
+from state import SectionState
 
 
 class NewsPage(Page):
@@ -32,34 +37,118 @@ class NewsPage(Page):
 class NewsSection(Section):
     """News Hugo section."""
 
+    max_per_project: ClassVar[Optional[int]] = None
+    max_age: ClassVar[Optional[int]] = None
+    max_news: ClassVar[Optional[int]] = None
+
+    def __init__(
+        self,
+        pages: Optional[dict[str, Page]] = None,
+        kept: Iterable[str] = (),
+        kept_projects: Iterable[str] = (),
+    ) -> None:
+        """
+        Initialize the section.
+
+        Parameters:
+            pages: Section pages.
+            kept: Names of the existing pages to leave as they are.
+            kept_projects: Identifiers of the projects whose existing news
+                pages are left as they are.
+        """
+        super().__init__(pages, kept)
+        self.kept_projects = set(kept_projects)
+
     @classmethod
-    def from_config(cls, configs: list[Project]) -> 'NewsSection':
+    def from_config(
+        cls,
+        configs: list[Project],
+        section_state: Optional[SectionState] = None,
+    ) -> 'NewsSection':
         """
         Create a news section from a list of configurations.
 
+        Only the news within the limits are generated: at most
+        max_per_project news per project, none older than max_age days, and
+        at most max_news of the most recent news overall. Newsfeeds are only
+        parsed up to the oldest news that can be within the limits, and the
+        existing pages of news beyond them are removed.
+
+        The existing pages of news that fail are kept. With a section state,
+        the pages of projects whose inputs did not change since the previous
+        build are kept as well, unless max_news is set, since the news of a
+        project then depend on the news of the others.
+
         Parameters:
             configs: Project configurations.
+            section_state: State of the section in the previous build.
 
         Returns:
             NewsSection: Instance of NewsSection class.
         """
         news_section = {}
+        kept = set()
+        kept_projects = set()
+        projects_news = []
         for project in configs:
+            fingerprint = cls._fingerprint(project, section_state)
+            if fingerprint:
+                pages = section_state.unchanged(project.id, fingerprint)
+                if pages is not None:
+                    logging.info("Keeping unchanged '{0}' news...".format(
+                        project.id,
+                    ))
+                    kept.update(pages)
+                    continue
             try:
-                news = project.news
+                with Metrics.timer('news', project.id):
+                    news = project.recent_news(cls._limit(), cls._since())
             except ValueError as enumerate_error:
                 logging.error("Failed to get news from '{0}':\n{1}".format(
                     project.id, enumerate_error,
                 ))
+                kept_projects.add(project.id)
                 continue
-            news_section.update(cls._from_config(news))
-        return cls(news_section)
+            projects_news.append((project, fingerprint, news))
+        selected = cls._select([
+            news for _, _, project_news in projects_news
+            for news in project_news
+        ])
+        for project, fingerprint, project_news in projects_news:
+            news = [
+                recent for recent in project_news if id(recent) in selected
+            ]
+            with Metrics.timer('news', project.id):
+                pages = cls._from_config(news)
+            news_section.update(pages)
+            for recent in news:
+                page = '{0}-{1}'.format(project.id, recent.number)
+                if page not in pages:
+                    kept.add(page)
+            if fingerprint and len(pages) == len(news):
+                section_state.update(project.id, fingerprint, list(pages))
+        return cls(news_section, kept, kept_projects)
+
+    def _is_kept(self, name: str) -> bool:
+        """
+        Check if an existing page must be left as it is.
+
+        Parameters:
+            name: Page name.
+
+        Returns:
+            True if the page is kept.
+        """
+        match = re.fullmatch(r'(.+)-\d+', name)
+        if match and match.group(1) in self.kept_projects:
+            return True
+        return super()._is_kept(name)
 
     @classmethod
     def _from_config(cls, config: list[News]):
         news_section = {}
-        for index, news in enumerate(config):
-            page = '{0}-{1}'.format(news.project.id, index + 1)
+        for news in config:
+            page = '{0}-{1}'.format(news.project.id, news.number)
             logging.info("Generating '{0}' page...".format(page))
             try:
                 news_section[page] = NewsPage.from_config(news)
@@ -68,3 +157,39 @@ class NewsSection(Section):
                     page, news_error,
                 ))
         return news_section
+
+    @classmethod
+    def _fingerprint(
+        cls, config: Project, section_state: Optional[SectionState],
+    ) -> Optional[str]:
+        if cls.max_news is not None:
+            return None
+        fingerprint = super()._fingerprint(config, section_state)
+        if fingerprint is None:
+            return None
+        if cls.max_per_project is None and cls.max_age is None:
+            return fingerprint
+        return '{0}:{1}:{2}'.format(
+            fingerprint, cls.max_per_project, cls._since(),
+        )
+
+    @classmethod
+    def _limit(cls) -> Optional[int]:
+        limits = [
+            limit for limit in (cls.max_per_project, cls.max_news)
+            if limit is not None
+        ]
+        return min(limits, default=None)
+
+    @classmethod
+    def _since(cls) -> Optional[datetime.date]:
+        if cls.max_age is None:
+            return None
+        return datetime.date.today() - datetime.timedelta(days=cls.max_age)
+
+    @classmethod
+    def _select(cls, news: list[News]) -> set[int]:
+        if cls.max_news is not None:
+            news = sorted(news, key=lambda recent: recent.date, reverse=True)
+            news = news[:cls.max_news]
+        return {id(recent) for recent in news}
@@ -0,0 +1,164 @@
+# SPDX-FileCopyrightText: 2025 CERN (home.cern)
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Parse Markdown newsfeeds."""
+
+import datetime
+import re
+from dataclasses import dataclass, field
+from typing import Iterator, Optional
+
+import markdown_preprocess
+
+DATE = re.compile(r'\d{4}-\d{2}-\d{2}')
+
+HEADING = '## '
+
+
+@dataclass
+class NewsEntry:
+    """News entry of a newsfeed."""
+
+    line: int
+    title: str
+    date: datetime.date
+    images: list[str] = field(default_factory=list)
+    description: Optional[str] = None
+
+
+class Newsfeed:
+    """
+    Newsfeed whose entries are parsed when they are reached.
+
+    Each entry starts with a '## ' heading and holds a date, and the text
+    after the line of the date is its description. HTML comments are
+    ignored, and so are headings with a blank title, which belong to the
+    text of the entry before them.
+    """
+
+    def __init__(self, md: str) -> None:
+        """
+        Initialize the newsfeed.
+
+        Parameters:
+            md: Newsfeed Markdown document.
+        """
+        self._text, self._shifts = _strip_comments(md)
+
+    def __len__(self) -> int:
+        """
+        Count the entries without parsing them.
+
+        Returns:
+            Number of entries.
+        """
+        return sum(1 for _ in self._spans())
+
+    def __iter__(self) -> Iterator[NewsEntry]:
+        """
+        Parse the entries, in document order.
+
+        Yields:
+            The news entries.
+
+        Raises:
+            ValueError: If parsing an entry fails.
+        """
+        for line, start, end in self._spans():
+            yield _entry(line, self._text[start:end])
+
+    def _spans(self) -> Iterator[tuple[int, int, int]]:
+        text = self._text
+        line = 1
+        position = 0
+        shift = 0
+        headings = self._headings()
+        start = next(headings, -1)
+        while start >= 0:
+            line += text.count('\n', position, start)
+            while shift < len(self._shifts) and (
+                self._shifts[shift][0] <= start
+            ):
+                line += self._shifts[shift][1]
+                shift += 1
+            position = start
+            end = next(headings, -1)
+            yield line, start, end - 1 if end >= 0 else len(text)
+            start = end
+
+    def _headings(self) -> Iterator[int]:
+        text = self._text
+        found = False
+        start = text.find(HEADING)
+        while start >= 0:
+            newline = text.find('\n', start)
+            if newline < 0:
+                newline = len(text)
+            if text[start + len(HEADING):newline].strip():
+                found = True
+                yield start
+            if found:
+                start = text.find('\n' + HEADING, start + len(HEADING))
+                start = start + 1 if start >= 0 else -1
+            else:
+                start = text.find(HEADING, start + 1)
+
+
+def entries(md: str) -> Iterator[NewsEntry]:
+    """
+    Parse the news entries of a newsfeed, in document order.
+
+    Each entry is parsed when it is reached, so parsing stops at the last
+    entry requested.
+
+    Parameters:
+        md: Newsfeed Markdown document.
+
+    Returns:
+        An iterator over the news entries.
+    """
+    return iter(Newsfeed(md))
+
+
+def _strip_comments(md: str) -> tuple[str, list[tuple[int, int]]]:
+    pieces = []
+    shifts = []
+    position = 0
+    length = 0
+    for match in markdown_preprocess.COMMENT.finditer(md):
+        pieces.append(md[position:match.start()])
+        length += match.start() - position
+        shifts.append((length, md.count('\n', match.start(), match.end())))
+        position = match.end()
+    if not shifts:
+        return md, shifts
+    pieces.append(md[position:])
+    return ''.join(pieces), shifts
+
+
+def _entry(line: int, text: str) -> NewsEntry:
+    newline = text.find('\n')
+    title = text[len(HEADING):newline] if newline >= 0 else text[len(HEADING):]
+    match = DATE.search(text)
+    if match is None:
+        raise ValueError('Failed to fetch date at line {0}'.format(line))
+    try:
+        date = datetime.date.fromisoformat(match.group())
+    except ValueError as date_error:
+        raise ValueError('Failed to fetch date at line {0}:\n{1}'.format(
+            line, date_error,
+        ))
+    newline = text.find('\n', match.end())
+    description = ''
+    if newline >= 0:
+        description = markdown_preprocess.strip_images(
+            text[newline + 1:],
+        ).strip()
+    return NewsEntry(
+        line=line,
+        title=title,
+        date=date,
+        images=markdown_preprocess.images(text),
+        description=description or None,
+    )
@@ -6,9 +6,15 @@
 
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Optional, Union
 
 from config import Project
 from hugo import Page, Section
+from metrics import Metrics
+from state import SectionState
+from url import WarningBuffer
 
 
 class ProjectPage(Page):
@@ -37,25 +43,77 @@ class ProjectSection(Section):
     """Projects Hugo section."""
 
     @classmethod
-    def from_config(cls, configs: list[Project]) -> 'ProjectSection':
+    def from_config(
+        cls,
+        configs: list[Project],
+        workers: int = 1,
+        section_state: Optional[SectionState] = None,
+    ) -> 'ProjectSection':
         """
         Create a projects section from a list of configurations.
 
+        Projects are generated concurrently, but pages, logs and warnings are
+        produced in configuration order. The existing page of a project that
+        fails is kept. With a section state, the pages of projects whose
+        inputs did not change since the previous build are kept as well.
+
         Parameters:
             configs: Project configurations.
+            workers: Maximum number of projects generated concurrently.
+            section_state: State of the section in the previous build.
 
         Returns:
             ProjectSection: Instance of ProjectSection class.
         """
         projects = {}
-        for config in configs:
-            logging.info("Generating '{0}' page...".format(config.id))
+        kept = set()
+        Project.prefetch(configs)
+        generate = partial(cls._generate, section_state=section_state)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            generated = executor.map(generate, configs)
+            for config, project, warning_buffer in generated:
+                if project is None:
+                    logging.info("Keeping unchanged '{0}' page...".format(
+                        config.id,
+                    ))
+                    kept.add(config.id)
+                    continue
+                logging.info("Generating '{0}' page...".format(config.id))
+                warning_buffer.replay()
+                if isinstance(project, ValueError):
+                    logging.error(
+                        "Failed to generate '{0}' page:\n{1}".format(
+                            config.id, project,
+                        ),
+                    )
+                    kept.add(config.id)
+                    continue
+                projects[config.id] = project
+        return cls(projects, kept)
+
+    @classmethod
+    def _generate(
+        cls, config: Project, section_state: Optional[SectionState],
+    ) -> tuple[
+        Project, Union[ProjectPage, ValueError, None], WarningBuffer,
+    ]:
+        with Metrics.timer('projects', config.id):
+            return cls._generate_page(config, section_state)
+
+    @classmethod
+    def _generate_page(
+        cls, config: Project, section_state: Optional[SectionState],
+    ) -> tuple[
+        Project, Union[ProjectPage, ValueError, None], WarningBuffer,
+    ]:
+        with WarningBuffer() as warning_buffer:
+            fingerprint = cls._fingerprint(config, section_state)
+            if fingerprint and section_state.unchanged(config.id, fingerprint):
+                return config, None, warning_buffer
             try:
                 project = ProjectPage.from_config(config)
             except ValueError as project_error:
-                logging.error("Failed to generate '{0}' page:\n{1}".format(
-                    config.id, project_error,
-                ))
-                continue
-            projects[config.id] = project
-        return cls(projects)
+                return config, project_error, warning_buffer
+        if fingerprint:
+            section_state.update(config.id, fingerprint, [config.id])
+        return config, project, warning_buffer
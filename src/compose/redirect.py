@@ -45,6 +45,7 @@ class RedirectSection(Section):
             RedirectSection: Instance of RedirectSection class.
         """
         redirect_section = {}
+        kept = set()
         for index, config in enumerate(configs):
             logging.info("Generating '{0}' page...".format(config.url))
             try:
@@ -53,6 +54,7 @@ class RedirectSection(Section):
                 logging.error("Failed to generate '{0}' page:\n{1}".format(
                     config.url, redirect_error,
                 ))
+                kept.add(str(index))
                 continue
             redirect_section[str(index)] = redirect
-        return cls(redirect_section)
+        return cls(redirect_section, kept)
@@ -5,10 +5,13 @@
 """Represent Git Repositories."""
 
 import json
+import logging
+import os
 import re
+import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, ClassVar
 from urllib.parse import quote
 
 from url import StrictUrl
@@ -40,6 +43,27 @@ class Repository(StrictUrl, ABC):
             return GitLabRepository(url)
         raise ValueError("Unsupported repository URL '{0}'".format(url))
 
+    @classmethod
+    def prefetch(cls, repositories: list[Any], path: str) -> None:
+        """
+        Fetch a file from many repositories ahead of their fetch calls.
+
+        Each repository class fetches its repositories in batches where its
+        forge supports it. Files that fail to prefetch are fetched one by one
+        later.
+
+        Parameters:
+            repositories: Repositories to fetch the file from.
+            path: Path to the file to fetch from each repository.
+        """
+        for repository_cls in cls.__subclasses__():
+            batch = [
+                repository for repository in repositories
+                if type(repository) is repository_cls
+            ]
+            if batch:
+                repository_cls.prefetch_batch(batch, path)
+
     @abstractmethod
     def fetch(self, path: str) -> str:
         """
@@ -49,6 +73,18 @@ class Repository(StrictUrl, ABC):
             path: Path to the file to fetch from the Git repository.
         """
 
+    @classmethod
+    def prefetch_batch(
+        cls, repositories: list['Repository'], path: str,
+    ) -> None:
+        """
+        Fetch a file from many repositories of this class in batches.
+
+        Parameters:
+            repositories: Repositories to fetch the file from.
+            path: Path to the file to fetch from each repository.
+        """
+
     @classmethod
     def _validate(cls, input_value: Any) -> 'Repository':
         """
@@ -73,16 +109,31 @@ class Repository(StrictUrl, ABC):
 class GitHubRepository(Repository):
     """GitHub repository."""
 
+    graphql_url: ClassVar[str] = 'https://api.github.com/graphql'
+    token_variable: ClassVar[str] = 'GITHUB_TOKEN'
+    batch_size: ClassVar[int] = 50
+
+    _files: ClassVar[dict[tuple[str, str], str]] = {}
+    _query_block: ClassVar[str] = (
+        'r{0}: repository(owner: {1}, name: {2}) ' +
+        '{{ object(expression: {3}) {{ ... on Blob {{ text }} }} }}'
+    )
+
     def fetch(self, path: str) -> str:
         """
         Fetch a file from the GitHub repository.
 
+        Files prefetched by a batched GraphQL query are not requested again.
+
         Parameters:
             path: Path to the file to fetch from the GitHub repository.
 
         Returns:
             File contents.
         """
+        text = self._files.get((self.url, path))
+        if text is not None:
+            return text
         url = 'https://api.github.com/repos/{0}/contents/{1}'.format(
             re.search(r'^https://github\.com/(.+?)\.git', self.url).group(1),
             path,
@@ -90,14 +141,167 @@ class GitHubRepository(Repository):
         headers = {'Accept': 'application/vnd.github.v3.raw'}
         return self._get(url, headers=headers).text
 
+    @classmethod
+    def clear(cls) -> None:
+        """Forget every prefetched file."""
+        cls._files = {}
+
+    @classmethod
+    def prefetch_batch(
+        cls, repositories: list[Repository], path: str,
+    ) -> None:
+        """
+        Fetch a file from many GitHub repositories with GraphQL queries.
+
+        Each query fetches the file from the default branch of up to
+        batch_size repositories. GraphQL requires a token, read from the
+        token_variable environment variable; without it nothing is
+        prefetched.
+
+        Parameters:
+            repositories: Repositories to fetch the file from.
+            path: Path to the file to fetch from each repository.
+        """
+        token = os.environ.get(cls.token_variable)
+        if not token:
+            return
+        headers = {'Authorization': 'bearer {0}'.format(token)}
+        for start in range(0, len(repositories), cls.batch_size):
+            batch = repositories[start:start + cls.batch_size]
+            try:
+                cls._files.update(cls._query_files(batch, path, headers))
+            except ValueError as query_error:
+                logging.warning(
+                    "Failed to prefetch '{0}' from GitHub:\n{1}".format(
+                        path, query_error,
+                    ),
+                )
+
+    @classmethod
+    def _query_files(
+        cls, repositories: list[Repository], path: str, headers: dict,
+    ) -> dict[tuple[str, str], str]:
+        expression = json.dumps('HEAD:{0}'.format(path))
+        blocks = []
+        for index, repository in enumerate(repositories):
+            owner, name = re.search(
+                r'^https://github\.com/(.+?)/(.+?)\.git', repository.url,
+            ).groups()
+            blocks.append(cls._query_block.format(
+                index, json.dumps(owner), json.dumps(name), expression,
+            ))
+        query = 'query {{ {0} }}'.format(' '.join(blocks))
+        res = cls._post(cls.graphql_url, {'query': query}, headers=headers)
+        try:
+            data = res.json()['data']
+        except (TypeError, json.JSONDecodeError, KeyError) as json_error:
+            raise ValueError('Failed to load JSON:\n{0}'.format(json_error))
+        files = {}
+        for index, repository in enumerate(repositories):
+            alias = (data or {}).get('r{0}'.format(index)) or {}
+            blob = alias.get('object')
+            if blob and isinstance(blob.get('text'), str):
+                files[(repository.url, path)] = blob['text']
+        return files
+
 
 class GitLabRepository(Repository):
     """GitLab repository."""
 
+    graphql_url: ClassVar[str] = 'https://{0}/api/graphql'
+    batch_size: ClassVar[int] = 50
+    max_age: ClassVar[float] = 7 * 24 * 60 * 60
+
+    _default_branches: ClassVar[dict[str, str]] = {}
+    _known_branches: ClassVar[dict[str, str]] = {}
+    _resolved: ClassVar[dict[str, float]] = {}
+    _query: ClassVar[str] = (
+        'query($paths: [String!], $first: Int) { ' +
+        'projects(fullPaths: $paths, first: $first) { ' +
+        'nodes { fullPath repository { rootRef } } } }'
+    )
+
+    @classmethod
+    def clear(cls) -> None:
+        """Forget every default branch resolved or loaded."""
+        cls._default_branches = {}
+        cls._known_branches = {}
+        cls._resolved = {}
+
+    @classmethod
+    def load_default_branches(cls, path: str) -> None:
+        """
+        Load the default branches resolved by a previous build.
+
+        Known default branches are used without a metadata lookup, which is
+        only made if fetching a file from the known branch fails. Default
+        branches resolved more than max_age seconds ago are looked up again,
+        so that a project whose default branch changed is not served from
+        its old one indefinitely.
+
+        Parameters:
+            path: JSON file path.
+
+        Raises:
+            ValueError: If the file is not valid.
+        """
+        try:
+            with open(path, 'r') as branches_file:
+                branches = json.load(branches_file)
+        except FileNotFoundError:
+            return
+        except (OSError, json.JSONDecodeError) as load_error:
+            raise ValueError("Failed to load file '{0}':\n{1}".format(
+                path, load_error,
+            ))
+        if not isinstance(branches, dict):
+            raise ValueError("Invalid default branches in '{0}'".format(path))
+        oldest = time.time() - cls.max_age
+        for url, known in branches.items():
+            if not isinstance(known, dict):
+                continue
+            branch = known.get('branch')
+            resolved = known.get('resolved')
+            if not isinstance(branch, str):
+                continue
+            if isinstance(resolved, (int, float)) and resolved > oldest:
+                cls._known_branches[url] = branch
+                cls._resolved[url] = resolved
+
+    @classmethod
+    def save_default_branches(cls, path: str) -> None:
+        """
+        Save the default branches resolved by this build, with the time
+        they were resolved.
+
+        Parameters:
+            path: JSON file path.
+
+        Raises:
+            ValueError: If writing the file fails.
+        """
+        now = time.time()
+        branches = {
+            url: {'branch': branch, 'resolved': cls._resolved.get(url, now)}
+            for url, branch in cls._default_branches.items()
+        }
+        tmp_path = '{0}.tmp'.format(path)
+        try:
+            with open(tmp_path, 'w') as branches_file:
+                json.dump(branches, branches_file, indent=2)
+            os.replace(tmp_path, path)
+        except OSError as save_error:
+            raise ValueError("Failed to save file '{0}':\n{1}".format(
+                path, save_error,
+            ))
+
     def fetch(self, path: str) -> str:
         """
         Fetch a file from the GitLab repository.
 
+        The default branch is looked up once per repository and reused for
+        every file fetched from it.
+
         Parameters:
             path: Path to the file to fetch from the GitLab repository.
 
@@ -107,19 +311,107 @@ class GitLabRepository(Repository):
         Raises:
             ValueError: If requesting the file fails.
         """
-        match = re.search(
-            r'^https://((?:gitlab\.com|gitlab\.cern\.ch))/(.+?)\.git',
-            self.url,
-        )
+        default_branch = self._default_branches.get(self.url)
+        if default_branch:
+            return self._get(self._raw_url(default_branch, path)).text
+        default_branch = self._known_branches.get(self.url)
+        if default_branch:
+            try:
+                text = self._get(self._raw_url(default_branch, path)).text
+            except ValueError:
+                text = None
+            if text is not None:
+                self._default_branches[self.url] = default_branch
+                return text
+        default_branch = self._fetch_default_branch()
+        self._default_branches[self.url] = default_branch
+        self._resolved[self.url] = time.time()
+        return self._get(self._raw_url(default_branch, path)).text
+
+    @classmethod
+    def prefetch_batch(
+        cls, repositories: list[Repository], path: str,
+    ) -> None:
+        """
+        Resolve the default branches of many GitLab repositories in batches.
+
+        Repositories are grouped by host, and each GraphQL query resolves the
+        default branches of up to batch_size of them, so that fetching a file
+        only downloads it.
+
+        Parameters:
+            repositories: Repositories to fetch the file from.
+            path: Path to the file to fetch from each repository.
+        """
+        hosts: dict[str, dict[str, str]] = {}
+        for repository in repositories:
+            if repository.url in cls._default_branches:
+                continue
+            host, project = repository.project_path()
+            hosts.setdefault(host, {})[project.lower()] = repository.url
+        for host, projects in hosts.items():
+            paths = list(projects)
+            for start in range(0, len(paths), cls.batch_size):
+                batch = paths[start:start + cls.batch_size]
+                try:
+                    branches = cls._query_default_branches(host, batch)
+                except ValueError as query_error:
+                    logging.warning(
+                        "Failed to resolve default branches on '{0}':\n{1}"
+                        .format(host, query_error),
+                    )
+                    continue
+                for project, branch in branches.items():
+                    cls._default_branches[projects[project]] = branch
+                    cls._resolved[projects[project]] = time.time()
+
+    @classmethod
+    def _query_default_branches(
+        cls, host: str, paths: list[str],
+    ) -> dict[str, str]:
+        res = cls._post(cls.graphql_url.format(host), {
+            'query': cls._query,
+            'variables': {'paths': paths, 'first': len(paths)},
+        })
+        try:
+            nodes = res.json()['data']['projects']['nodes'] or []
+        except (TypeError, json.JSONDecodeError, KeyError) as json_error:
+            raise ValueError('Failed to load JSON:\n{0}'.format(json_error))
+        branches = {}
+        for node in nodes:
+            branch = (node.get('repository') or {}).get('rootRef')
+            if branch:
+                branches[node['fullPath'].lower()] = branch
+        return branches
+
+    def _fetch_default_branch(self) -> str:
+        host, project = self.project_path()
         url = 'https://{0}/api/v4/projects/{1}'.format(
-            match.group(1),
-            quote(match.group(2), safe=''),
+            host, quote(project, safe=''),
         )
         try:
-            default_branch = self._get(url).json()['default_branch']
+            return self._get(url).json()['default_branch']
         except (TypeError, json.JSONDecodeError, KeyError) as json_error:
             raise ValueError('Failed to load JSON:\n{0}'.format(json_error))
-        url = 'https://{0}/{1}/-/raw/{2}/{3}'.format(
-            match.group(1), match.group(2), default_branch, path,
+
+    def _raw_url(self, branch: str, path: str) -> str:
+        host, project = self.project_path()
+        return 'https://{0}/{1}/-/raw/{2}/{3}'.format(
+            host, project, branch, path,
+        )
+
+    def project_path(self) -> tuple[str, str]:
+        """
+        Get the host and the path of the GitLab project.
+
+        Returns:
+            The host and the path of the project.
+        """
+        host, project = self._match().groups()
+        return host, project
+
+    def _match(self) -> re.Match:
+        return re.search(
+            r'^https://((?:gitlab\.com|gitlab\.cern\.ch))/(.+?)\.git',
+            self.url,
         )
-        return self._get(url).text
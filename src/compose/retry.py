@@ -0,0 +1,133 @@
+# SPDX-FileCopyrightText: 2025 CERN (home.cern)
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Retry transient HTTP failures."""
+
+import random
+import time
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from http import HTTPStatus
+from typing import Optional
+
+import requests
+from archive import ReplayError
+from download import DownloadError
+
+TRANSIENT_STATUS_CODES = frozenset((
+    HTTPStatus.REQUEST_TIMEOUT,
+    HTTPStatus.TOO_EARLY,
+    HTTPStatus.TOO_MANY_REQUESTS,
+    HTTPStatus.INTERNAL_SERVER_ERROR,
+    HTTPStatus.BAD_GATEWAY,
+    HTTPStatus.SERVICE_UNAVAILABLE,
+    HTTPStatus.GATEWAY_TIMEOUT,
+))
+
+PERMANENT_ERRORS = (
+    DownloadError,
+    ReplayError,
+    requests.exceptions.InvalidHeader,
+    requests.exceptions.InvalidSchema,
+    requests.exceptions.InvalidURL,
+    requests.exceptions.MissingSchema,
+    requests.exceptions.RetryError,
+    requests.exceptions.TooManyRedirects,
+    requests.exceptions.URLRequired,
+)
+
+
+def throttled(res: requests.Response) -> bool:
+    """
+    Check if a response reports that its host is rate limiting requests.
+
+    Parameters:
+        res: Response to check.
+
+    Returns:
+        True if the status is 429, or 403 with no remaining quota.
+    """
+    remaining = res.headers.get('X-RateLimit-Remaining')
+    return res.status_code == HTTPStatus.TOO_MANY_REQUESTS or (
+        res.status_code == HTTPStatus.FORBIDDEN and remaining == '0'
+    )
+
+
+def transient(res: requests.Response) -> bool:
+    """
+    Check if the error status of a response may go away when retried.
+
+    Parameters:
+        res: Response to check.
+
+    Returns:
+        True if the request is throttled or failed on the server side.
+    """
+    return res.status_code in TRANSIENT_STATUS_CODES or throttled(res)
+
+
+def requested_delay(res: requests.Response) -> Optional[float]:
+    """
+    Get how long a response asks to wait before sending the next request.
+
+    Parameters:
+        res: Response with Retry-After or rate limit reset headers.
+
+    Returns:
+        Seconds to wait, or None if the response does not ask to wait.
+    """
+    retry_after = res.headers.get('Retry-After')
+    if retry_after:
+        if retry_after.strip().isdigit():
+            return float(retry_after)
+        try:
+            retry_date = parsedate_to_datetime(retry_after)
+        except (TypeError, ValueError):
+            return None
+        return max(0, retry_date.timestamp() - time.time())
+    for header in ('X-RateLimit-Reset', 'RateLimit-Reset'):
+        reset = res.headers.get(header)
+        if reset and reset.strip().isdigit():
+            return max(0, int(reset) - time.time())
+    return None
+
+
+@dataclass
+class RetryPolicy:
+    """Exponential backoff with full jitter for transient failures."""
+
+    attempts: int = 3
+    base_delay: float = 0.5
+    max_delay: float = 30
+
+    def delay(
+        self, attempt: int, error: requests.exceptions.RequestException,
+    ) -> Optional[float]:
+        """
+        Get how long to wait before retrying a failed attempt.
+
+        Connection errors, timeouts, rate limits and server errors are
+        transient. A wait requested by the server with Retry-After or a rate
+        limit reset header is honoured if it does not exceed max_delay.
+
+        Parameters:
+            attempt: Index of the failed attempt, starting at 0.
+            error: Error raised by the failed attempt.
+
+        Returns:
+            Seconds to wait, or None if the request must not be retried.
+        """
+        if attempt + 1 >= self.attempts:
+            return None
+        if isinstance(error, PERMANENT_ERRORS):
+            return None
+        res = error.response
+        if res is not None:
+            if not transient(res):
+                return None
+            requested = requested_delay(res)
+            if requested is not None:
+                return requested if requested <= self.max_delay else None
+        backoff = min(self.max_delay, self.base_delay * 2 ** attempt)
+        return random.uniform(0, backoff)  # noqa: S311
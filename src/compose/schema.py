@@ -4,16 +4,26 @@
 
 """Pydantic schema for YAML validation."""
 
-from typing import Annotated
+import hashlib
+import json
+import os
+import warnings
+from typing import Annotated, Any, Optional
 
 import yaml
 from pydantic import (
     BaseModel,
     Field,
     StringConstraints,
+    TypeAdapter,
     ValidationError,
-    validate_call,
 )
+from url import UrlCheck
+
+try:
+    from yaml import CSafeLoader as SafeLoader  # noqa: WPS433
+except ImportError:
+    from yaml import SafeLoader  # noqa: WPS433, WPS440
 
 
 class BaseModelForbidExtra(BaseModel, extra='forbid'):
@@ -25,29 +35,131 @@ AnnotatedStr = Annotated[str, StringConstraints(
 )]
 AnnotatedStrList = Annotated[list[AnnotatedStr], Field(min_length=1)]
 
+_annotated_str = TypeAdapter(AnnotatedStr)
+
+
+def validate_str(str_value: Any) -> str:
+    """
+    Validate a string passed to a public function.
+
+    Unlike validate_call, only the string is validated, so the check is
+    cheap enough for functions called once per project.
+
+    Parameters:
+        str_value: Value to validate as an AnnotatedStr.
+
+    Returns:
+        The string, with surrounding whitespace stripped.
+
+    Raises:
+        ValidationError: If the value is not a non-blank string.
+    """
+    return _annotated_str.validate_python(str_value)
+
+
+def load_yaml(yaml_str: str, cache_path: Optional[str] = None) -> Any:
+    """
+    Parse a YAML string.
+
+    Parameters:
+        yaml_str: YAML string.
+        cache_path: JSON file path to cache the parsed YAML in, keyed by the
+            SHA-256 hash of the YAML string.
+
+    Returns:
+        The parsed YAML.
+
+    Raises:
+        ValueError: If the YAML string is not valid.
+    """
+    digest = None
+    if cache_path:
+        digest = hashlib.sha256(yaml_str.encode()).hexdigest()
+        cached = _read_cache(cache_path)
+        if cached.get('sha256') == digest and 'yaml' in cached:
+            return cached['yaml']
+    try:
+        yaml_data = yaml.load(yaml_str, Loader=SafeLoader)
+    except yaml.YAMLError as yaml_error:
+        raise ValueError('Failed to load YAML:\n{0}'.format(yaml_error))
+    if digest:
+        _write_cache(cache_path, digest, yaml_data)
+    return yaml_data
+
+
+def _read_cache(cache_path: str) -> dict[str, Any]:
+    try:
+        with open(cache_path, 'r') as cache_file:
+            cached = json.load(cache_file)
+    except (OSError, json.JSONDecodeError):
+        return {}
+    return cached if isinstance(cached, dict) else {}
+
+
+def _write_cache(cache_path: str, digest: str, yaml_data: Any) -> None:
+    try:
+        cache_json = json.dumps({'sha256': digest, 'yaml': yaml_data})
+    except (TypeError, ValueError):
+        return
+    if json.loads(cache_json)['yaml'] != yaml_data:
+        return
+    tmp_path = '{0}.tmp'.format(cache_path)
+    try:
+        with open(tmp_path, 'w') as cache_file:
+            cache_file.write(cache_json)
+        os.replace(tmp_path, cache_path)
+    except OSError as cache_error:
+        warnings.warn("Failed to save file '{0}':\n{1}".format(
+            cache_path, cache_error,
+        ))
+
 
 class Schema(BaseModelForbidExtra):
     """Model validation schema."""
 
     @classmethod
-    @validate_call
-    def from_yaml(cls, yaml_str: AnnotatedStr):
+    def from_yaml(
+        cls, yaml_str: AnnotatedStr, cache_path: Optional[str] = None,
+    ):
         """
         Load model from YAML.
 
+        YAML is parsed with libyaml when PyYAML was built with it. With a
+        cache path, the parsed YAML is saved as JSON along with the SHA-256
+        hash of the YAML string, and an unchanged YAML string is not parsed
+        again.
+
+        URLs are checked concurrently once the model is validated, unless a
+        URL check is already collecting them; it is then up to its owner to
+        run it.
+
         Parameters:
             yaml_str: YAML string.
+            cache_path: JSON file path to cache the parsed YAML in.
 
         Returns:
             Schema: The schema object.
 
         Raises:
+            ValidationError: If the YAML string is blank.
             ValueError: If loading the model from YAML fails.
         """
+        yaml_str = validate_str(yaml_str)
+        yaml_dict = load_yaml(yaml_str, cache_path)
+        if UrlCheck.collecting():
+            return cls._from_dict(yaml_dict)
+        with UrlCheck() as url_check:
+            model = cls._from_dict(yaml_dict)
         try:
-            yaml_dict = yaml.safe_load(yaml_str)
-        except yaml.YAMLError as yaml_error:
-            raise ValueError('Failed to load YAML:\n{0}'.format(yaml_error))
+            url_check.run()
+        except ValueError as url_error:
+            raise ValueError('Failed to initialize model:\n{0}'.format(
+                url_error,
+            ))
+        return model
+
+    @classmethod
+    def _from_dict(cls, yaml_dict: Any) -> 'Schema':
         try:
             return cls(**yaml_dict)
         except (ValidationError, TypeError) as cls_error:
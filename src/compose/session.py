@@ -0,0 +1,256 @@
+# SPDX-FileCopyrightText: 2025 CERN (home.cern)
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Share pooled HTTP connections."""
+
+import threading
+import time
+from typing import Any, Optional
+
+import requests
+from archive import FetchArchive
+from download import download
+from metrics import Metrics
+from requests.adapters import HTTPAdapter
+from throttle import HostThrottle
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+
+class Session:
+    """
+    Pooled HTTP session shared by all requests.
+
+    Requests are recorded to, or answered from, the active FetchArchive, and
+    throttled per host by HostThrottle unless they are answered from it. GET
+    responses may be streamed with a size limit.
+    """
+
+    pool_sizes: dict[str, int] = {
+        'api.github.com': 32,
+        'gitlab.com': 32,
+        'gitlab.cern.ch': 16,
+    }
+    default_pool_size: int = 10
+
+    _session: Optional[requests.Session] = None
+    _lock = threading.Lock()
+    _connections: int = 0
+    _requests: int = 0
+
+    @classmethod
+    def head(cls, url: str, **kwargs: Any) -> requests.Response:
+        """
+        Send a HEAD request through the shared session.
+
+        Parameters:
+            url: Request URL.
+            kwargs: Arguments passed to requests.Session.head.
+
+        Returns:
+            A requests.Response instance.
+        """
+        return cls._request('HEAD', url, **kwargs)
+
+    @classmethod
+    def get(
+        cls, url: str, max_bytes: Optional[int] = None, **kwargs: Any,
+    ) -> requests.Response:
+        """
+        Send a GET request through the shared session.
+
+        With max_bytes, the response body is streamed and rejected as soon as
+        it exceeds max_bytes or turns out not to be text (see download).
+
+        Parameters:
+            url: Request URL.
+            max_bytes: Maximum response body size in bytes.
+            kwargs: Arguments passed to requests.Session.get.
+
+        Returns:
+            A requests.Response instance.
+
+        Raises:
+            DownloadError: If the response body is rejected.
+        """
+        return cls._request('GET', url, max_bytes=max_bytes, **kwargs)
+
+    @classmethod
+    def post(cls, url: str, **kwargs: Any) -> requests.Response:
+        """
+        Send a POST request through the shared session.
+
+        Parameters:
+            url: Request URL.
+            kwargs: Arguments passed to requests.Session.post.
+
+        Returns:
+            A requests.Response instance.
+        """
+        return cls._request('POST', url, **kwargs)
+
+    @classmethod
+    def stats(cls) -> dict[str, int]:
+        """
+        Get the connection reuse counters.
+
+        Returns:
+            Number of connections opened and requests served.
+        """
+        with cls._lock:
+            return {'connections': cls._connections, 'requests': cls._requests}
+
+    @classmethod
+    def mount(cls, prefix: str, adapter: HTTPAdapter) -> None:
+        """
+        Send the requests to URLs starting with a prefix through an adapter.
+
+        Parameters:
+            prefix: URL prefix.
+            adapter: Transport adapter.
+        """
+        cls._get_session().mount(prefix, adapter)
+
+    @classmethod
+    def close(cls) -> None:
+        """Close the shared session and reset the counters."""
+        with cls._lock:
+            if cls._session is not None:
+                cls._session.close()
+            cls._session = None
+            cls._connections = 0
+            cls._requests = 0
+
+    @classmethod
+    def count_connection(cls) -> None:
+        """Count a newly opened connection."""
+        with cls._lock:
+            cls._connections += 1
+
+    @classmethod
+    def _request(
+        cls, method: str, url: str, **kwargs: Any,
+    ) -> requests.Response:
+        cls._count_request()
+        start = time.perf_counter()
+        throttled = not FetchArchive.replaying()
+        try:
+            if throttled:
+                HostThrottle.admit(url)
+            res = cls._send(method, url, **kwargs)
+        except requests.exceptions.RequestException as request_error:
+            if throttled:
+                HostThrottle.record(url, error=request_error)
+            Metrics.record_request(
+                url, time.perf_counter() - start, failed=True,
+            )
+            raise
+        if throttled:
+            HostThrottle.record(url, res=res)
+        content = res.content
+        Metrics.record_request(
+            url,
+            time.perf_counter() - start,
+            len(content) if isinstance(content, bytes) else 0,
+        )
+        return res
+
+    @classmethod
+    def _send(
+        cls,
+        method: str,
+        url: str,
+        max_bytes: Optional[int] = None,
+        **kwargs: Any,
+    ) -> requests.Response:
+        headers = kwargs.get('headers')
+        body = kwargs.get('json')
+        if FetchArchive.replaying():
+            return FetchArchive.load(method, url, headers, body)
+        send = getattr(cls._get_session(), method.lower())
+        try:
+            if max_bytes is None:
+                res = send(url, **kwargs)
+            else:
+                res = download(send(url, stream=True, **kwargs), max_bytes)
+        except requests.exceptions.RequestException as request_error:
+            FetchArchive.store(
+                method, url, headers, body, error=request_error,
+            )
+            raise
+        FetchArchive.store(method, url, headers, body, res=res)
+        return res
+
+    @classmethod
+    def _count_request(cls) -> None:
+        with cls._lock:
+            cls._requests += 1
+
+    @classmethod
+    def _get_session(cls) -> requests.Session:
+        with cls._lock:
+            if cls._session is None:
+                cls._session = cls._create_session()
+            return cls._session
+
+    @classmethod
+    def _create_session(cls) -> requests.Session:
+        session = requests.Session()
+        for scheme in ('http://', 'https://'):
+            session.mount(scheme, CountingAdapter(
+                pool_maxsize=cls.default_pool_size,
+            ))
+        for host, pool_size in cls.pool_sizes.items():
+            session.mount('https://{0}/'.format(host), CountingAdapter(
+                pool_maxsize=pool_size,
+            ))
+        return session
+
+
+class CountingHTTPConnection(HTTPConnection):
+    """HTTP connection counting the connections it opens."""
+
+    def connect(self) -> None:
+        """Open the connection."""
+        Session.count_connection()
+        super().connect()
+
+
+class CountingHTTPSConnection(HTTPSConnection):
+    """HTTPS connection counting the connections it opens."""
+
+    def connect(self) -> None:
+        """Open the connection."""
+        Session.count_connection()
+        super().connect()
+
+
+class CountingHTTPConnectionPool(HTTPConnectionPool):
+    """HTTP connection pool of counting connections."""
+
+    ConnectionCls = CountingHTTPConnection
+
+
+class CountingHTTPSConnectionPool(HTTPSConnectionPool):
+    """HTTPS connection pool of counting connections."""
+
+    ConnectionCls = CountingHTTPSConnection
+
+
+class CountingAdapter(HTTPAdapter):
+    """HTTP adapter using counting connection pools."""
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        """
+        Initialize the pool manager with counting connection pools.
+
+        Parameters:
+            args: Positional arguments passed to HTTPAdapter.init_poolmanager.
+            kwargs: Keyword arguments passed to HTTPAdapter.init_poolmanager.
+        """
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            'http': CountingHTTPConnectionPool,
+            'https': CountingHTTPSConnectionPool,
+        }
@@ -0,0 +1,154 @@
+# SPDX-FileCopyrightText: 2025 CERN (home.cern)
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Track the state of incremental builds."""
+
+import hashlib
+import json
+import os
+from dataclasses import dataclass, field
+from typing import Optional
+
+
+@dataclass
+class SectionState:
+    """Fingerprints and pages of the projects of a Hugo section."""
+
+    directory: str
+    previous: dict[str, dict] = field(default_factory=dict)
+    current: dict[str, dict] = field(default_factory=dict)
+
+    def unchanged(self, project_id: str, fingerprint: str) -> Optional[list]:
+        """
+        Check if the pages of a project can be kept from the previous build.
+
+        Parameters:
+            project_id: Project identifier.
+            fingerprint: Fingerprint of the project inputs.
+
+        Returns:
+            The names of the pages to keep, or None if they must be generated.
+        """
+        entry = self.previous.get(project_id)
+        if not entry or entry.get('fingerprint') != fingerprint:
+            return None
+        pages = entry.get('pages', [])
+        for page in pages:
+            page_path = os.path.join(self.directory, '{0}.md'.format(page))
+            if not os.path.isfile(page_path):
+                return None
+        self.current[project_id] = entry
+        return pages
+
+    def update(self, project_id: str, fingerprint: str, pages: list) -> None:
+        """
+        Record the pages generated for a project.
+
+        Parameters:
+            project_id: Project identifier.
+            fingerprint: Fingerprint of the project inputs.
+            pages: Names of the generated pages.
+        """
+        self.current[project_id] = {'fingerprint': fingerprint, 'pages': pages}
+
+
+class BuildState:
+    """State of an incremental build."""
+
+    def __init__(self, path: str, key: str) -> None:
+        """
+        Load the state of the previous build.
+
+        The previous state is discarded if it was recorded with another key.
+
+        Parameters:
+            path: Build state JSON file path.
+            key: Hash of the inputs shared by every project.
+
+        Raises:
+            ValueError: If the build state file is not valid.
+        """
+        self.path = path
+        self.key = key
+        self.sections: dict[str, SectionState] = {}
+        self._previous: dict[str, dict] = {}
+        try:
+            with open(path, 'r') as state_file:
+                state = json.load(state_file)
+        except FileNotFoundError:
+            return
+        except (OSError, json.JSONDecodeError) as load_error:
+            raise ValueError("Failed to load file '{0}':\n{1}".format(
+                path, load_error,
+            ))
+        if not isinstance(state, dict):
+            raise ValueError("Invalid build state in '{0}'".format(path))
+        if state.get('key') == key:
+            self._previous = state.get('sections', {})
+
+    @classmethod
+    def key_from_files(cls, paths: list[str]) -> str:
+        """
+        Hash the content of files shared by every project.
+
+        Parameters:
+            paths: File paths.
+
+        Returns:
+            Hex digest of the files.
+
+        Raises:
+            ValueError: If reading a file fails.
+        """
+        digest = hashlib.sha256()
+        for path in paths:
+            try:
+                with open(path, 'rb') as key_file:
+                    digest.update(key_file.read())
+            except OSError as read_error:
+                raise ValueError("Failed to read file '{0}':\n{1}".format(
+                    path, read_error,
+                ))
+        return digest.hexdigest()
+
+    def section(self, name: str, directory: str) -> SectionState:
+        """
+        Get the state of a Hugo section.
+
+        Parameters:
+            name: Section name.
+            directory: Section content directory path.
+
+        Returns:
+            SectionState: The section state.
+        """
+        if name not in self.sections:
+            self.sections[name] = SectionState(
+                directory=directory, previous=self._previous.get(name, {}),
+            )
+        return self.sections[name]
+
+    def save(self) -> None:
+        """
+        Save the state of this build.
+
+        Raises:
+            ValueError: If writing the build state file fails.
+        """
+        state = {
+            'key': self.key,
+            'sections': {
+                name: section.current
+                for name, section in self.sections.items()
+            },
+        }
+        tmp_path = '{0}.tmp'.format(self.path)
+        try:
+            with open(tmp_path, 'w') as state_file:
+                json.dump(state, state_file, indent=2, sort_keys=True)
+            os.replace(tmp_path, self.path)
+        except OSError as save_error:
+            raise ValueError("Failed to save file '{0}':\n{1}".format(
+                self.path, save_error,
+            ))
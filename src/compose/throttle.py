@@ -0,0 +1,180 @@
+# SPDX-FileCopyrightText: 2025 CERN (home.cern)
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Throttle requests to hosts that are rate limiting or down."""
+
+import threading
+import time
+from dataclasses import dataclass, field
+from http import HTTPStatus
+from typing import Any, Optional
+from urllib.parse import urlsplit
+
+import requests
+from retry import requested_delay, throttled
+
+
+class CircuitOpenError(requests.exceptions.RetryError):
+    """Request not sent because its host is rate limiting or down."""
+
+
+@dataclass
+class TokenBucket:
+    """Token bucket pacing the requests sent to a host."""
+
+    rate: float
+    capacity: float
+    tokens: float = field(init=False)
+    updated: float = field(init=False)
+
+    def __post_init__(self) -> None:
+        """Start with a full bucket."""
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+
+    def reserve(self) -> float:
+        """
+        Take a token, borrowing it from the future if the bucket is empty.
+
+        Returns:
+            Seconds to wait before the token can be used.
+        """
+        now = time.monotonic()
+        self.tokens = min(
+            self.capacity, self.tokens + (now - self.updated) * self.rate,
+        )
+        self.updated = now
+        self.tokens -= 1
+        if self.tokens >= 0:
+            return 0
+        return -self.tokens / self.rate
+
+
+@dataclass
+class CircuitBreaker:
+    """Circuit breaker of a host."""
+
+    failures: int = 0
+    open_until: float = 0
+
+    def record(
+        self, failed: bool, threshold: int, cooldown: float,
+        wait: Optional[float] = None,
+    ) -> None:
+        """
+        Record the outcome of a request.
+
+        Parameters:
+            failed: Whether the request failed because of its host.
+            threshold: Consecutive failures opening the circuit.
+            cooldown: Seconds the circuit stays open after failures.
+            wait: Seconds the host asked to wait, opening the circuit.
+        """
+        if wait is not None:
+            self.open_until = max(self.open_until, time.time() + wait)
+        if not failed:
+            self.failures = 0
+            return
+        self.failures += 1
+        if self.failures >= threshold:
+            self.open_until = max(self.open_until, time.time() + cooldown)
+
+
+class HostThrottle:
+    """Per-host rate limits and circuit breakers shared by all requests."""
+
+    rates: dict[str, float] = {}
+    burst: int = 10
+    threshold: int = 5
+    cooldown: float = 30
+    max_defer: float = 5
+
+    _buckets: dict[str, TokenBucket] = {}
+    _breakers: dict[str, CircuitBreaker] = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def admit(cls, url: str) -> None:
+        """
+        Wait until a request can be sent to the host of a URL.
+
+        A request to a host whose circuit is open is deferred if the circuit
+        closes within max_defer seconds, or fails fast otherwise. Requests to
+        a host with a rate limit are paced by its token bucket.
+
+        Parameters:
+            url: Request URL.
+
+        Raises:
+            CircuitOpenError: If the host is rate limiting or down.
+        """
+        host = urlsplit(url).netloc
+        with cls._lock:
+            breaker = cls._breakers.get(host)
+            wait = breaker.open_until - time.time() if breaker else 0
+        if wait > cls.max_defer:
+            raise CircuitOpenError(
+                "Host '{0}' is unavailable for {1:.0f} s".format(host, wait),
+            )
+        if wait > 0:
+            time.sleep(wait)
+        rate = cls.rates.get(host)
+        if rate:
+            with cls._lock:
+                if host not in cls._buckets:
+                    cls._buckets[host] = TokenBucket(rate, cls.burst)
+                wait = cls._buckets[host].reserve()
+            if wait > 0:
+                time.sleep(wait)
+
+    @classmethod
+    def record(
+        cls,
+        url: str,
+        res: Optional[requests.Response] = None,
+        error: Optional[requests.exceptions.RequestException] = None,
+    ) -> None:
+        """
+        Record the outcome of a request to the host of a URL.
+
+        Connection errors, timeouts and server errors count as failures of
+        the host. A throttled response, or one with no remaining quota, opens
+        the circuit until the quota is reset.
+
+        Parameters:
+            url: Request URL.
+            res: Response received.
+            error: Error raised instead of receiving a response.
+        """
+        if isinstance(error, CircuitOpenError):
+            return
+        if res is None and error is not None:
+            res = error.response
+        failed, wait = cls._outcome(res)
+        with cls._lock:
+            breaker = cls._breakers.setdefault(
+                urlsplit(url).netloc, CircuitBreaker(),
+            )
+            breaker.record(failed, cls.threshold, cls.cooldown, wait)
+
+    @classmethod
+    def clear(cls) -> None:
+        """Forget every token bucket and circuit breaker."""
+        with cls._lock:
+            cls._buckets = {}
+            cls._breakers = {}
+
+    @classmethod
+    def _outcome(cls, res: Any) -> tuple[bool, Optional[float]]:
+        if res is None:
+            return True, None
+        status_code = getattr(res, 'status_code', None)
+        if not isinstance(status_code, int):
+            return False, None
+        if throttled(res):
+            wait = requested_delay(res)
+            return True, cls.cooldown if wait is None else wait
+        if res.headers.get('X-RateLimit-Remaining') == '0':
+            return False, requested_delay(res)
+        return status_code >= HTTPStatus.INTERNAL_SERVER_ERROR, None
@@ -4,19 +4,253 @@
 
 """Represent URLs."""
 
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
 from functools import partial
+from http import HTTPStatus
+import itertools
 import json
+import os
 import re
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+import threading
 import time
-from typing import Annotated, Any
+from typing import Annotated, Any, Callable, ClassVar, Optional
 from urllib.parse import quote, urljoin
 import warnings
 
 import requests
+from archive import FetchArchive
+from cache import CacheEntry, HttpCache
+from metrics import Metrics
 from pydantic import Field, GetCoreSchemaHandler
 from pydantic_core import CoreSchema, core_schema
+from retry import RetryPolicy
+from session import Session
+
+
+class WarningBuffer:
+    """Buffer the warnings emitted by URL validation in the current context."""
+
+    _active: ContextVar[Optional['WarningBuffer']] = ContextVar(
+        'warning_buffer', default=None,
+    )
+
+    def __init__(self) -> None:
+        """Initialize an empty warning buffer."""
+        self.messages: list[Any] = []
+        self._tokens = []
+
+    def __enter__(self) -> 'WarningBuffer':
+        """
+        Buffer the warnings emitted in this context instead of emitting them.
+
+        Returns:
+            The WarningBuffer instance.
+        """
+        self._tokens.append(self._active.set(self))
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """
+        Stop buffering warnings.
+
+        Parameters:
+            exc_info: Exception information.
+        """
+        self._active.reset(self._tokens.pop())
+
+    @classmethod
+    def warn(cls, message: Any) -> None:
+        """
+        Emit a warning, or buffer it if a warning buffer is active.
+
+        Parameters:
+            message: Warning message.
+        """
+        warning_buffer = cls._active.get()
+        if warning_buffer is None:
+            warnings.warn(message)
+        else:
+            warning_buffer.messages.append(message)
+
+    def replay(self) -> None:
+        """Emit the buffered warnings in the order they were buffered."""
+        messages, self.messages = self.messages, []
+        for message in messages:
+            self.warn(message)
+
+
+@dataclass
+class UrlResult:
+    """Result of a URL check, shared by every check of the same URL."""
+
+    done: threading.Event = field(default_factory=threading.Event)
+    response: Optional[requests.Response] = None
+    error: Optional[Exception] = None
+    checked: float = field(default_factory=time.time)
+
+    def wait(self) -> Optional[requests.Response]:
+        """
+        Wait for the check to complete.
+
+        Returns:
+            The response of the check, or None if the URL was checked by a
+            previous build or answered by a GET request.
+
+        Raises:
+            ValueError: If the check failed.
+        """
+        self.done.wait()
+        if self.error is not None:
+            raise ValueError(*self.error.args)
+        return self.response
+
+
+class UrlRegistry:
+    """Process-wide registry answering each unique URL check once."""
+
+    max_age: float = 24 * 60 * 60
+
+    _results: dict[str, UrlResult] = {}
+    _lock = threading.Lock()
+    _saved: int = 0
+
+    @classmethod
+    def check(
+        cls, url: str, head: Callable[[str], requests.Response],
+    ) -> Optional[requests.Response]:
+        """
+        Check a URL, unless it was already checked or is being checked.
+
+        Concurrent checks of the same URL wait for the first one to complete
+        and share its result.
+
+        Parameters:
+            url: URL to check.
+            head: Function checking the URL.
+
+        Returns:
+            The response of the check, or None if the URL was checked by a
+            previous build or answered by a GET request.
+
+        Raises:
+            ValueError: If the check failed.
+        """
+        with cls._lock:
+            url_result = cls._results.get(url)
+            if url_result is not None:
+                cls._saved += 1
+                owner = False
+            else:
+                url_result = UrlResult()
+                cls._results[url] = url_result
+                owner = True
+        if owner:
+            try:
+                url_result.response = head(url)
+            except Exception as head_error:
+                url_result.error = head_error
+                raise
+            finally:
+                url_result.done.set()
+            return url_result.response
+        return url_result.wait()
+
+    @classmethod
+    def record(cls, url: str) -> None:
+        """
+        Record a successful request, which answers later checks of the URL.
+
+        Only the success is recorded, not the response, so that response
+        bodies are not kept for the whole build.
+
+        Parameters:
+            url: Requested URL.
+        """
+        with cls._lock:
+            if url not in cls._results:
+                url_result = UrlResult()
+                url_result.done.set()
+                cls._results[url] = url_result
+
+    @classmethod
+    def load(cls, path: str) -> None:
+        """
+        Load the URLs found reachable by previous builds.
+
+        URLs checked less than max_age seconds ago are not checked again.
+
+        Parameters:
+            path: JSON file path.
+
+        Raises:
+            ValueError: If the file is not valid.
+        """
+        try:
+            with open(path, 'r') as checks_file:
+                checks = json.load(checks_file)
+        except FileNotFoundError:
+            return
+        except (OSError, json.JSONDecodeError) as load_error:
+            raise ValueError("Failed to load file '{0}':\n{1}".format(
+                path, load_error,
+            ))
+        if not isinstance(checks, dict):
+            raise ValueError("Invalid URL checks in '{0}'".format(path))
+        oldest = time.time() - cls.max_age
+        with cls._lock:
+            for url, checked in checks.items():
+                if isinstance(checked, (int, float)) and checked > oldest:
+                    url_result = UrlResult(checked=checked)
+                    url_result.done.set()
+                    cls._results.setdefault(url, url_result)
+
+    @classmethod
+    def save(cls, path: str) -> None:
+        """
+        Save the URLs found reachable, with the time they were checked.
+
+        Parameters:
+            path: JSON file path.
+
+        Raises:
+            ValueError: If writing the file fails.
+        """
+        with cls._lock:
+            checks = {
+                url: url_result.checked
+                for url, url_result in cls._results.items()
+                if url_result.done.is_set() and url_result.error is None
+            }
+        tmp_path = '{0}.tmp'.format(path)
+        try:
+            with open(tmp_path, 'w') as checks_file:
+                json.dump(checks, checks_file, indent=2, sort_keys=True)
+            os.replace(tmp_path, path)
+        except OSError as save_error:
+            raise ValueError("Failed to save file '{0}':\n{1}".format(
+                path, save_error,
+            ))
+
+    @classmethod
+    def stats(cls) -> dict[str, int]:
+        """
+        Get the registry counters.
+
+        Returns:
+            Number of unique URLs and of checks saved by the registry.
+        """
+        with cls._lock:
+            return {'urls': len(cls._results), 'saved': cls._saved}
+
+    @classmethod
+    def clear(cls) -> None:
+        """Forget all URL results and reset the counters."""
+        with cls._lock:
+            cls._results = {}
+            cls._saved = 0
 
 
 @dataclass
@@ -25,6 +259,8 @@ class Url:
 
     url: str
 
+    max_bytes: ClassVar[int] = 8 * 1024 * 1024
+
     @classmethod
     def __get_pydantic_core_schema__(
         cls, source_type: Any, core_schema_handler: GetCoreSchemaHandler,
@@ -61,65 +297,264 @@ class Url:
         if isinstance(input_value, cls):
             return input_value
         if isinstance(input_value, str):
+            if UrlCheck.defer(cls, input_value, strict=False):
+                return cls(input_value)
             try:
                 cls._head(input_value)
             except ValueError as head_error:
-                warnings.warn(head_error)
+                WarningBuffer.warn(head_error)
             return cls(input_value)
-        warnings.warn("Invalid value: '{0}'".format(input_value))
+        WarningBuffer.warn("Invalid value: '{0}'".format(input_value))
 
     @classmethod
     def _serialize(cls, url: 'Url') -> str:
         return url.url
 
+    @classmethod
+    def head(cls, url: str) -> requests.Response:
+        """
+        Check that a URL is reachable.
+
+        Parameters:
+            url: URL to check.
+
+        Returns:
+            The response to the HEAD request.
+
+        Raises:
+            ValueError: If the URL is not reachable.
+        """
+        return cls._head(url)
+
     @classmethod
     def _head(cls, url: str, max_retries: int = 3) -> requests.Response:
-        requests_error = None
-        for attempt in range(max_retries):
-            if attempt > 0:
-                time.sleep(attempt)
-            try:
-                res = requests.head(url, timeout=10, allow_redirects=True)
-            except requests.exceptions.RequestException as head_error:
-                requests_error = head_error
-                continue
-            try:
-                res.raise_for_status()
-            except requests.exceptions.RequestException as status_error:
-                requests_error = status_error
-                continue
-            return res
-        raise ValueError("HEAD request to '{0}' failed:\n{1}".format(
-            url, requests_error,
-        ))
+        return UrlRegistry.check(url, partial(cls._send_head, max_retries))
+
+    @classmethod
+    def _send_head(cls, max_retries: int, url: str) -> requests.Response:
+        send = partial(Session.head, url, timeout=10, allow_redirects=True)
+        return cls._retry(
+            'HEAD', url, partial(cls._checked, send), max_retries,
+        )
 
     @classmethod
     def _get(
         cls, url: str, headers: str = '', max_retries: int = 3,
     ) -> requests.Response:
-        requests_error = None
-        for attempt in range(max_retries):
-            if attempt > 0:
-                time.sleep(attempt)
-            try:
-                res = requests.get(url, headers=headers, timeout=10)
-            except requests.exceptions.RequestException as get_error:
-                requests_error = get_error
-                continue
+        cache_entry = HttpCache.load(url, headers)
+        send = partial(cls._send_get, url, headers, cache_entry)
+        return cls._retry('GET', url, send, max_retries)
+
+    @classmethod
+    def _post(
+        cls, url: str, payload: Any, headers: str = '', max_retries: int = 3,
+    ) -> requests.Response:
+        send = partial(
+            Session.post, url, json=payload, headers=headers, timeout=30,
+        )
+        return cls._retry(
+            'POST', url, partial(cls._checked, send), max_retries,
+        )
+
+    @classmethod
+    def _retry(
+        cls,
+        method: str,
+        url: str,
+        send: Callable[[], requests.Response],
+        max_retries: int,
+    ) -> requests.Response:
+        policy = RetryPolicy(max_retries)
+        for attempt in itertools.count():
             try:
-                res.raise_for_status()
-            except requests.exceptions.RequestException as status_error:
-                requests_error = status_error
-                continue
-            return res
-        raise ValueError("GET request to '{0}' failed:\n{1}".format(
-            url, requests_error,
-        ))
+                return send()
+            except requests.exceptions.RequestException as request_error:
+                delay = cls._retry_delay(
+                    policy, attempt, method, url, request_error,
+                )
+            time.sleep(delay)
+
+    @classmethod
+    def _retry_delay(
+        cls,
+        policy: RetryPolicy,
+        attempt: int,
+        method: str,
+        url: str,
+        request_error: requests.exceptions.RequestException,
+    ) -> float:
+        delay = None
+        if not FetchArchive.replaying():
+            delay = policy.delay(attempt, request_error)
+        if delay is None:
+            raise ValueError("{0} request to '{1}' failed:\n{2}".format(
+                method, url, request_error,
+            ))
+        Metrics.record_retry(url)
+        return delay
+
+    @classmethod
+    def _checked(
+        cls, send: Callable[[], requests.Response],
+    ) -> requests.Response:
+        res = send()
+        res.raise_for_status()
+        return res
+
+    @classmethod
+    def _send_get(
+        cls, url: str, headers: str, cache_entry: Optional[CacheEntry],
+    ) -> requests.Response:
+        request_headers = headers
+        if cache_entry:
+            request_headers = dict(headers or {}, **cache_entry.validators())
+        res = Session.get(
+            url, max_bytes=cls.max_bytes, headers=request_headers, timeout=10,
+        )
+        if cache_entry and res.status_code == HTTPStatus.NOT_MODIFIED:
+            return cache_entry.response()
+        res.raise_for_status()
+        HttpCache.store(url, headers, res)
+        UrlRegistry.record(url)
+        return res
 
 
 UrlList = Annotated[list[Url], Field(min_length=1)]
 
 
+class UrlCheck:
+    """
+    Collect URLs during validation and check them concurrently.
+
+    Validation only records URLs, so models can be validated without network
+    access and their URLs checked in a separate pass, or never.
+    """
+
+    skip: ClassVar[bool] = False
+
+    _active: ContextVar[Optional['UrlCheck']] = ContextVar(
+        'url_check', default=None,
+    )
+
+    def __init__(self, max_workers: int = 16) -> None:
+        """
+        Initialize the URL check.
+
+        Parameters:
+            max_workers: Maximum number of concurrent HEAD requests.
+        """
+        self.max_workers = max_workers
+        self._urls: list[tuple[type[Url], str, bool]] = []
+        self._tokens = []
+
+    def __enter__(self) -> 'UrlCheck':
+        """
+        Collect the URLs validated in this context instead of checking them.
+
+        Returns:
+            The UrlCheck instance.
+        """
+        self._tokens.append(self._active.set(self))
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """
+        Stop collecting URLs.
+
+        Parameters:
+            exc_info: Exception information.
+        """
+        self._active.reset(self._tokens.pop())
+
+    def __len__(self) -> int:
+        """
+        Get the number of URLs collected and not checked yet.
+
+        Returns:
+            Number of URLs.
+        """
+        return len(self._urls)
+
+    @classmethod
+    def collecting(cls) -> bool:
+        """
+        Check if a URL check is collecting the URLs validated in this context.
+
+        Returns:
+            True if a URL check is active.
+        """
+        return cls._active.get() is not None
+
+    @classmethod
+    def defer(cls, url_cls: type[Url], url: str, strict: bool) -> bool:
+        """
+        Defer the check of a URL to the active URL check, if any.
+
+        If skip is set, URLs are never checked.
+
+        Parameters:
+            url_cls: Url class requesting the check.
+            url: URL to check.
+            strict: Whether an unreachable URL is an error or a warning.
+
+        Returns:
+            True if the check was deferred or skipped, False otherwise.
+        """
+        if cls.skip:
+            return True
+        url_check = cls._active.get()
+        if url_check is None:
+            return False
+        url_check.add(url_cls, url, strict)
+        return True
+
+    def add(self, url_cls: type[Url], url: str, strict: bool) -> None:
+        """
+        Collect a URL to check when the URL check runs.
+
+        Parameters:
+            url_cls: Url class requesting the check.
+            url: URL to check.
+            strict: Whether an unreachable URL is an error or a warning.
+        """
+        self._urls.append((url_cls, url, strict))
+
+    def run(self) -> None:
+        """
+        Check the collected URLs concurrently.
+
+        Unreachable URLs produce the same warnings as Url validation, in the
+        order the URLs were collected.
+
+        Raises:
+            ValueError: If a strict URL is not reachable.
+        """
+        urls, self._urls = self._urls, []
+        if not urls:
+            return
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            head_errors = list(executor.map(self._check, urls))
+        errors = []
+        for (_, _, strict), head_error in zip(urls, head_errors):
+            if head_error is None:
+                continue
+            if strict:
+                errors.append(str(head_error))
+            else:
+                WarningBuffer.warn(head_error)
+        if errors:
+            raise ValueError('\n'.join(errors))
+
+    @classmethod
+    def _check(cls, url: tuple[type[Url], str, bool]) -> Optional[ValueError]:
+        url_cls, url_str, _ = url
+        try:
+            url_cls.head(url_str)
+        except ValueError as head_error:
+            return head_error
+        return None
+
+
 @dataclass
 class StrictUrl(Url):
     """Represent a reachable URL."""
@@ -141,7 +576,8 @@ class StrictUrl(Url):
         if isinstance(input_value, cls):
             return input_value
         if isinstance(input_value, str):
-            cls._head(input_value)
+            if not UrlCheck.defer(cls, input_value, strict=True):
+                cls._head(input_value)
             return cls(input_value)
         raise ValueError("Invalid value: '{0}'".format(input_value))
 
@@ -155,6 +591,8 @@ class UrlContent(StrictUrl, ABC):
 
     text: str
 
+    _contents: ClassVar[dict[str, 'UrlContent']] = {}
+
     @classmethod
     @abstractmethod
     def from_url(cls, url: str) -> 'UrlContent':
@@ -173,16 +611,29 @@ class UrlContent(StrictUrl, ABC):
         """
         Return a specific UrlContent instance based on the URL.
 
+        The content of each URL is only fetched once per process.
+
         Parameters:
             url: URL to fetch content from.
 
         Returns:
             A UrlContent instance.
         """
+        url_content = cls._contents.get(url)
+        if url_content is not None:
+            return url_content
         gitlab = r'^https://(?:gitlab\.com|gitlab\.cern\.ch)/.+?/wikis/.+'
         if re.search(gitlab, url):
-            return GitLabWikiPage.from_url(url)
-        return GenericUrlContent.from_url(url)
+            url_content = GitLabWikiPage.from_url(url)
+        else:
+            url_content = GenericUrlContent.from_url(url)
+        cls._contents[url] = url_content
+        return url_content
+
+    @classmethod
+    def clear(cls) -> None:
+        """Forget the content fetched from every URL."""
+        UrlContent._contents = {}
 
     @classmethod
     def _validate(cls, input_value: Any) -> 'UrlContent':
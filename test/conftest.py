@@ -2,11 +2,29 @@
 #
 # SPDX-License-Identifier: BSD-3-Clause
 
+import threading
+from http.server import ThreadingHTTPServer
+
 import pytest
+import requests
 
 from config import Contact, Project
-from repository import Repository
-from url import StrictUrl
+from repository import GitHubRepository, GitLabRepository, Repository
+from session import Session
+from throttle import HostThrottle
+from url import StrictUrl, UrlContent, UrlRegistry
+
+
+def make_response(status_code, content=b"", headers=None, url=None):
+    """Create a requests.Response."""
+    res = requests.Response()
+    res.status_code = status_code
+    res.url = url
+    res._content = content
+    res._content_consumed = True
+    res.encoding = "utf-8"
+    res.headers.update(headers or {})
+    return res
 
 
 @pytest.fixture(autouse=True)
@@ -14,11 +32,37 @@ def mock_requests(mocker):
     mock_response = mocker.Mock()
     mock_response.status_code = 200
     mock_response.text = "# Description\n\nExample description"
-    mocker.patch('requests.head', return_value=mock_response)
-    mocker.patch('requests.get', return_value=mock_response)
+    mock_response.headers = {}
+    mock_response.iter_content.return_value = [mock_response.text.encode()]
+    mocker.patch('requests.Session.head', return_value=mock_response)
+    mocker.patch('requests.Session.get', return_value=mock_response)
     return mock_response
 
 
+@pytest.fixture(autouse=True)
+def clear_url_registry():
+    UrlRegistry.clear()
+    UrlContent.clear()
+    HostThrottle.clear()
+    GitHubRepository.clear()
+    GitLabRepository.clear()
+
+
+@pytest.fixture
+def server_url(server_handler):
+    """Serve HTTP requests with the module's server_handler locally."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), server_handler)
+    thread = threading.Thread(
+        target=server.serve_forever, args=(0.05,), daemon=True,
+    )
+    thread.start()
+    Session.close()
+    yield "http://127.0.0.1:{0}".format(server.server_port)
+    Session.close()
+    server.shutdown()
+    server.server_close()
+
+
 @pytest.fixture
 def sample_contact():
     return Contact(name="John Doe", email="john@example.com")
@@ -0,0 +1,29 @@
+# SPDX-FileCopyrightText: 2025 CERN (home.cern)
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Regex newsfeed parsing the newsfeed parser is checked against."""
+
+import re
+from datetime import date
+
+
+def regex_entries(md):
+    """Parse a newsfeed like Project.news did before the newsfeed parser."""
+    md = re.sub("<!--(.*?)-->", "", md, flags=re.DOTALL).strip()
+    parsed = []
+    for match in re.findall(r"(## .+?)(?=\n## |$)", md, re.DOTALL):
+        description = re.search(
+            r"\d{4}-\d{2}-\d{2}.*?\n(.*)", match, re.DOTALL,
+        )
+        description = description.group(1) if description else ""
+        description = re.sub(
+            r"!\[.*?\]\(.*?\)", "", description, flags=re.DOTALL,
+        ).strip()
+        parsed.append((
+            re.search("^## (.+)", match).group(1),
+            date.fromisoformat(re.search(r"\d{4}-\d{2}-\d{2}", match).group()),
+            re.findall(r"!\[.*?\]\((.*?)\)", match),
+            description or None,
+        ))
+    return parsed
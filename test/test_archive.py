@@ -0,0 +1,95 @@
+# SPDX-FileCopyrightText: 2025 CERN (home.cern)
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Test cases for the fetch archive."""
+
+import pytest
+import requests
+
+from archive import FetchArchive, ReplayError
+from conftest import make_response
+from session import Session
+from url import Url
+
+EXAMPLE_URL = "https://example.com/file.txt"
+HEADERS = {"Accept": "text/plain"}
+TEXT_HEADERS = {"Content-Type": "text/plain"}
+
+
+@pytest.fixture(autouse=True)
+def close_archive():
+    """Stop recording or replaying after each test."""
+    yield
+    FetchArchive.close()
+
+
+class TestFetchArchive:
+    """Test cases for FetchArchive class."""
+
+    def test_record_replay(self, tmp_path, mocker):
+        archive_path = str(tmp_path / "archive.json.gz")
+        mocker.patch(
+            "requests.Session.get",
+            return_value=make_response(
+                200, b"file content", TEXT_HEADERS, EXAMPLE_URL,
+            ),
+        )
+        FetchArchive.record(archive_path)
+        assert Url._get(EXAMPLE_URL, headers=HEADERS).text == "file content"
+        FetchArchive.close()
+
+        mock_get = mocker.patch("requests.Session.get")
+        FetchArchive.replay(archive_path)
+        res = Url._get(EXAMPLE_URL, headers=HEADERS)
+
+        assert res.text == "file content"
+        assert res.headers["Content-Type"] == "text/plain"
+        mock_get.assert_not_called()
+
+    def test_replay_error(self, tmp_path, mocker):
+        archive_path = str(tmp_path / "archive.json.gz")
+        mocker.patch(
+            "requests.Session.head",
+            side_effect=requests.exceptions.ConnectionError("Refused"),
+        )
+        FetchArchive.record(archive_path)
+        with pytest.raises(requests.exceptions.ConnectionError):
+            Session.head(EXAMPLE_URL)
+        FetchArchive.close()
+
+        FetchArchive.replay(archive_path)
+        with pytest.raises(ReplayError, match="Refused"):
+            Session.head(EXAMPLE_URL)
+
+    def test_replay_missing(self, tmp_path):
+        archive_path = str(tmp_path / "archive.json.gz")
+        FetchArchive.record(archive_path)
+        FetchArchive.close()
+
+        FetchArchive.replay(archive_path)
+        with pytest.raises(ReplayError, match="not archived"):
+            FetchArchive.load("GET", EXAMPLE_URL, HEADERS)
+
+    def test_replay_invalid(self, tmp_path):
+        archive_path = tmp_path / "archive.json.gz"
+        archive_path.write_text("not gzip")
+        with pytest.raises(ValueError, match="Failed to load archive"):
+            FetchArchive.replay(str(archive_path))
+
+    @pytest.mark.parametrize("res", [None, make_response(503)])
+    def test_replay_not_retried(self, tmp_path, mocker, res):
+        archive_path = str(tmp_path / "archive.json.gz")
+        FetchArchive.record(archive_path)
+        if res is not None:
+            FetchArchive.store("GET", EXAMPLE_URL, HEADERS, None, res=res)
+        FetchArchive.close()
+        mock_sleep = mocker.patch("time.sleep")
+        mock_admit = mocker.patch("throttle.HostThrottle.admit")
+
+        FetchArchive.replay(archive_path)
+        with pytest.raises(ValueError, match="GET request"):
+            Url._get(EXAMPLE_URL, headers=HEADERS)
+
+        mock_sleep.assert_not_called()
+        mock_admit.assert_not_called()
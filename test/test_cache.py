@@ -0,0 +1,77 @@
+# SPDX-FileCopyrightText: 2025 CERN (home.cern)
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Test cases for the HTTP cache."""
+
+import pytest
+
+from cache import CacheEntry, HttpCache
+from conftest import make_response
+from url import Url
+
+EXAMPLE_URL = "https://example.com/file.txt"
+EXAMPLE_ETAG = '"abc"'
+EXAMPLE_CONTENT = b"file content"
+HEADERS = {"Accept": "text/plain"}
+
+
+@pytest.fixture
+def http_cache(tmp_path):
+    """Open the HTTP cache in a temporary directory."""
+    HttpCache.open(str(tmp_path))
+    yield tmp_path
+    HttpCache.close()
+
+
+class TestCacheEntry:
+    """Test cases for CacheEntry class."""
+
+    def test_validators(self):
+        entry = CacheEntry(
+            EXAMPLE_URL, EXAMPLE_CONTENT,
+            etag=EXAMPLE_ETAG, last_modified="Wed, 01 Jan 2025 00:00:00 GMT",
+        )
+        assert entry.validators() == {
+            "If-None-Match": EXAMPLE_ETAG,
+            "If-Modified-Since": "Wed, 01 Jan 2025 00:00:00 GMT",
+        }
+
+    def test_response(self):
+        entry = CacheEntry(EXAMPLE_URL, EXAMPLE_CONTENT, encoding="utf-8")
+        assert entry.response().text == "file content"
+
+
+class TestHttpCache:
+    """Test cases for HttpCache class."""
+
+    def test_disabled(self):
+        HttpCache.store(EXAMPLE_URL, None, make_response(
+            200, EXAMPLE_CONTENT, {"ETag": EXAMPLE_ETAG},
+        ))
+        assert HttpCache.load(EXAMPLE_URL, None) is None
+
+    def test_store_and_load(self, http_cache):
+        HttpCache.store(EXAMPLE_URL, HEADERS, make_response(
+            200, EXAMPLE_CONTENT, {"ETag": EXAMPLE_ETAG},
+        ))
+        entry = HttpCache.load(EXAMPLE_URL, HEADERS)
+        assert entry.content == EXAMPLE_CONTENT
+        assert entry.etag == EXAMPLE_ETAG
+        assert HttpCache.load(EXAMPLE_URL, None) is None
+
+    def test_store_without_validators(self, http_cache):
+        HttpCache.store(EXAMPLE_URL, None, make_response(200, EXAMPLE_CONTENT))
+        assert HttpCache.load(EXAMPLE_URL, None) is None
+
+    def test_get_revalidates(self, http_cache, mocker):
+        mock_get = mocker.patch("requests.Session.get", side_effect=[
+            make_response(200, EXAMPLE_CONTENT, {"ETag": EXAMPLE_ETAG}),
+            make_response(304),
+        ])
+
+        assert Url._get(EXAMPLE_URL).text == "file content"
+        assert Url._get(EXAMPLE_URL).text == "file content"
+        assert mock_get.call_args.kwargs["headers"] == {
+            "If-None-Match": EXAMPLE_ETAG,
+        }
@@ -70,6 +70,54 @@ class TestProject:
         assert manifest.licenses == ["MIT"]
         assert "Example description" in manifest.description.text
 
+    def test_fingerprint(self, sample_project, mock_repository, mocker):
+        manifest_yaml = (
+            "version: 1.0.0\n"
+            "name: Test Project\n"
+            "description: https://example/description.md\n"
+            "website: https://example.com"
+        )
+        mock_repository.fetch.return_value = manifest_yaml
+        fingerprint = sample_project.fingerprint
+        assert fingerprint == self._refresh(sample_project).fingerprint
+
+        mock_repository.fetch.return_value = manifest_yaml + "\n"
+        assert fingerprint != self._refresh(sample_project).fingerprint
+
+        mock_repository.fetch.return_value = manifest_yaml
+        mocker.patch(
+            'url.UrlContent._contents',
+            {"https://example/description.md": mocker.Mock(text="Changed")},
+        )
+        assert fingerprint != self._refresh(sample_project).fingerprint
+
+    def test_recent_news(self, sample_project, mocker):
+        mocker.patch('url.StrictUrl._validate', return_value=True)
+        sample_project.__dict__['manifest'] = mocker.Mock(
+            newsfeed=mocker.Mock(text=(
+                "## Three\n2025-03-01\n"
+                "## Two\n2025-02-01\n"
+                "## One\nNo date"
+            )),
+        )
+
+        news = sample_project.recent_news(limit=2)
+        assert [(n.title, n.number) for n in news] == [
+            ("Two", 2), ("Three", 3),
+        ]
+        assert all(n.project is sample_project for n in news)
+
+        news = sample_project.recent_news(since=date(2025, 2, 15))
+        assert [n.title for n in news] == ["Three"]
+
+        with pytest.raises(ValueError, match="Failed to load news"):
+            sample_project.news
+
+    def _refresh(self, project):
+        project.__dict__.pop('manifest_yaml', None)
+        project.__dict__.pop('fingerprint', None)
+        return project
+
 
 class TestConfig:
     def test_valid_config(
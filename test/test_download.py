@@ -0,0 +1,109 @@
+# SPDX-FileCopyrightText: 2025 CERN (home.cern)
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Test cases for size-limited downloads."""
+
+from http.server import BaseHTTPRequestHandler
+
+import pytest
+
+from download import DownloadError, media_type
+from session import Session
+from url import Url
+
+BODIES = {
+    "/latin-1": ("text/plain; charset=ISO-8859-1", "café".encode("latin-1")),
+    "/utf-8": ("text/markdown", "café".encode()),
+    "/large": ("text/plain", b"x" * 100),
+    "/image": ("image/png", b"\x89PNG"),
+    "/missing": ("text/html", b"<html>Not Found</html>"),
+}
+
+
+class DownloadHandler(BaseHTTPRequestHandler):
+    """Request handler serving bodies of various types and sizes."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        if self.path == "/chunked":
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain")
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+            for _ in range(10):
+                self.wfile.write(b"a\r\n" + b"x" * 10 + b"\r\n")
+            self.wfile.write(b"0\r\n\r\n")
+            return
+        content_type, body = BODIES[self.path]
+        self.send_response(404 if self.path == "/missing" else 200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def mock_requests():
+    """Use real requests against the local server."""
+
+
+@pytest.fixture
+def server_handler():
+    """Handle requests to the local server."""
+    return DownloadHandler
+
+
+def test_media_type():
+    assert media_type("Text/Plain; Charset=\"UTF-8\"") == (
+        "text/plain", "UTF-8",
+    )
+    assert media_type("application/json") == ("application/json", None)
+    assert media_type("") == ("", None)
+
+
+class TestDownload:
+    """Test cases for the download function."""
+
+    def test_charset(self, server_url):
+        res = Session.get(server_url + "/latin-1", max_bytes=50, timeout=10)
+        assert res.encoding == "iso8859-1"
+        assert res.text == "café"
+
+    def test_default_encoding(self, server_url):
+        res = Session.get(server_url + "/utf-8", max_bytes=50, timeout=10)
+        assert res.encoding == "utf-8"
+        assert res.text == "café"
+
+    def test_content_length_exceeded(self, server_url):
+        with pytest.raises(DownloadError, match="exceeds 50 bytes"):
+            Session.get(server_url + "/large", max_bytes=50, timeout=10)
+
+    def test_stream_exceeded(self, server_url):
+        with pytest.raises(DownloadError, match="exceeds 50 bytes"):
+            Session.get(server_url + "/chunked", max_bytes=50, timeout=10)
+        res = Session.get(server_url + "/chunked", max_bytes=100, timeout=10)
+        assert res.text == "x" * 100
+
+    def test_binary_rejected(self, server_url):
+        with pytest.raises(DownloadError, match="'image/png'"):
+            Session.get(server_url + "/image", max_bytes=50, timeout=10)
+
+    def test_error_not_rejected(self, server_url):
+        res = Session.get(server_url + "/missing", max_bytes=50, timeout=10)
+        assert res.status_code == 404
+
+    def test_connection_reused(self, server_url):
+        for _ in range(3):
+            Session.get(server_url + "/utf-8", max_bytes=50, timeout=10)
+        assert Session.stats()["connections"] == 1
+
+    def test_rejection_not_retried(self, server_url, mocker):
+        mock_sleep = mocker.patch("time.sleep")
+        with pytest.raises(ValueError, match="is not text"):
+            Url._get(server_url + "/image")
+        mock_sleep.assert_not_called()
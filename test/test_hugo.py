@@ -33,23 +33,35 @@ def sample_section(sample_page):
 class TestPage:
     """Tests for the Page class."""
 
-    def test_write_success(self, sample_page, mocker):
-        """Test successful page writing with mocked file operations."""
-        mock_file = mocker.patch("builtins.open", mocker.mock_open())
+    def test_write_success(self, sample_page, mocker, tmp_path):
+        """Test successful page writing."""
         mock_yaml_dump = mocker.patch(
             "yaml.safe_dump",
             return_value="yaml_output"
         )
+        page_path = tmp_path / "test_path.md"
 
-        sample_page.write("test_path.md")
+        assert sample_page.write(str(page_path))
 
         mock_yaml_dump.assert_called_once_with(sample_page.front_matter)
-        mock_file.assert_called_once_with("test_path.md", 'w')
-        file_handle = mock_file()
         expected_content = (
             "---\nyaml_output---\n# Test Page\n\nThis is a test page."
         )
-        file_handle.write.assert_called_once_with(expected_content)
+        assert page_path.read_text() == expected_content
+        assert [path.name for path in tmp_path.iterdir()] == ["test_path.md"]
+
+    def test_write_unchanged(self, sample_page, tmp_path):
+        """Test that an unchanged page is not rewritten."""
+        page_path = tmp_path / "test_path.md"
+        assert sample_page.write(str(page_path))
+        mtime = page_path.stat().st_mtime_ns
+
+        assert not sample_page.write(str(page_path))
+        assert page_path.stat().st_mtime_ns == mtime
+
+        sample_page.markdown = "Changed"
+        assert sample_page.write(str(page_path))
+        assert page_path.read_text().endswith("Changed")
 
     def test_write_invalid_front_matter(self, mocker):
         """Test writing with invalid front matter."""
@@ -97,6 +109,23 @@ class TestSection:
         assert "Failed to write 'bad_page' page" in caplog.text
         assert "Disk full" in caplog.text
 
+    def test_write_summary(self, sample_section, tmp_path):
+        """Test the summary of written, unchanged and removed pages."""
+        sample_section["page1"].write(str(tmp_path / "page1.md"))
+        for name in ("_index", "stale", "kept"):
+            (tmp_path / "{0}.md".format(name)).write_text("content")
+        (tmp_path / "other.txt").write_text("content")
+        sample_section.kept = {"kept"}
+
+        summary = sample_section.write(str(tmp_path))
+
+        assert summary.written == ["page2"]
+        assert summary.unchanged == ["page1"]
+        assert summary.removed == ["stale"]
+        assert sorted(path.name for path in tmp_path.iterdir()) == [
+            "_index.md", "kept.md", "other.txt", "page1.md", "page2.md",
+        ]
+
     def test_page_path(self, sample_section):
         """Test the _page_path helper method."""
         path = sample_section._page_path("/content/dir", "test_page")
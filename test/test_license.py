@@ -43,7 +43,9 @@ class TestSpdxLicenseList:
     @pytest.fixture(autouse=True)
     def clear_license_list(self):
         """Clear the license list before each test."""
-        SpdxLicenseList._spdx_license_list = []
+        SpdxLicenseList._records = {}
+        SpdxLicenseList._licenses = {}
+        SpdxLicenseList._aliases = {}
 
     @pytest.mark.parametrize("json_input,expected_count,expected_id", [
         (
@@ -72,8 +74,8 @@ class TestSpdxLicenseList:
     def test_from_json(self, json_input, expected_count, expected_id):
         """Test loading licenses from JSON."""
         SpdxLicenseList.from_json(json_input)
-        assert len(SpdxLicenseList._spdx_license_list) == expected_count
-        assert SpdxLicenseList._spdx_license_list[0].id == expected_id
+        assert len(SpdxLicenseList._records) == expected_count
+        assert SpdxLicenseList.get_license(expected_id).id == expected_id
 
     @pytest.mark.parametrize("json_input,expected_exception", [
         ("invalid json", ValueError),
@@ -95,7 +97,7 @@ class TestSpdxLicenseList:
             }]
         }))
         SpdxLicenseList.from_file(str(file_path))
-        assert len(SpdxLicenseList._spdx_license_list) == 1
+        assert len(SpdxLicenseList._records) == 1
 
     @pytest.mark.parametrize("license_id,should_exist", [
         ("Apache-2.0", True),
@@ -103,9 +105,7 @@ class TestSpdxLicenseList:
     ])
     def test_get_license(self, license_id, should_exist):
         """Test license retrieval."""
-        SpdxLicenseList._spdx_license_list = [
-            self._create_license("Apache-2.0")
-        ]
+        SpdxLicenseList.from_json(self._licenses_json("Apache-2.0"))
         if should_exist:
             license_data = SpdxLicenseList.get_license(license_id)
             assert license_data.id == license_id
@@ -114,10 +114,63 @@ class TestSpdxLicenseList:
                 SpdxLicenseList.get_license(license_id)
             assert "Unknown SPDX identifier" in str(excinfo.value)
 
-    def _create_license(self, license_id):
-        """Helper to create test license."""
-        return License(
-            id=license_id,
-            name="{0} License".format(license_id),
-            url="https://opensource.org/licenses/{0}".format(license_id)
-        )
+    def test_reload(self):
+        """Test that reloading replaces the license list."""
+        SpdxLicenseList.from_json(self._licenses_json("MIT"))
+        SpdxLicenseList.from_json(self._licenses_json("Apache-2.0"))
+        assert list(SpdxLicenseList._records) == ["Apache-2.0"]
+
+    def test_lazy_licenses(self):
+        """Test that License objects are only created when requested."""
+        SpdxLicenseList.from_json(self._licenses_json("MIT", "Apache-2.0"))
+        assert SpdxLicenseList._licenses == {}
+
+        spdx_license = SpdxLicenseList.get_license("MIT")
+        assert spdx_license.id == "MIT"
+        assert spdx_license.name == "MIT License"
+        assert SpdxLicenseList.get_license("MIT") is spdx_license
+        assert list(SpdxLicenseList._licenses) == ["MIT"]
+
+    def test_invalid_license_data(self):
+        """Test that invalid license data fails when requested."""
+        SpdxLicenseList.from_json(json.dumps({"licenses": [{
+            "licenseId": "MIT", "name": "", "reference": "https://mit",
+        }]}))
+        with pytest.raises(ValueError, match="Failed to load license data"):
+            SpdxLicenseList.get_license("MIT")
+
+    def test_duplicate_ids(self):
+        """Test that duplicate identifiers are rejected."""
+        with pytest.raises(ValueError, match="Duplicate SPDX identifier"):
+            SpdxLicenseList.from_json(self._licenses_json("MIT", "MIT"))
+
+    @pytest.mark.parametrize("license_id,options,expected_id", [
+        ("mit", {"case_insensitive": True}, "MIT"),
+        ("GPL-2.0+", {"resolve_deprecated": True}, "GPL-2.0-or-later"),
+        ("gpl-2.0", {
+            "case_insensitive": True, "resolve_deprecated": True,
+        }, "GPL-2.0-only"),
+        ("GPL-2.0", {}, "GPL-2.0"),
+    ])
+    def test_aliases(self, license_id, options, expected_id):
+        """Test case-insensitive and deprecated identifier lookups."""
+        SpdxLicenseList.from_json(self._licenses_json(
+            "MIT", "GPL-2.0", "GPL-2.0+", "GPL-2.0-only", "GPL-2.0-or-later",
+            deprecated=("GPL-2.0", "GPL-2.0+"),
+        ), **options)
+        assert SpdxLicenseList.get_license(license_id).id == expected_id
+
+    def test_aliases_disabled(self):
+        """Test that lookups are exact by default."""
+        SpdxLicenseList.from_json(self._licenses_json("MIT"))
+        with pytest.raises(ValueError, match="Unknown SPDX identifier"):
+            SpdxLicenseList.get_license("mit")
+
+    def _licenses_json(self, *license_ids, deprecated=()):
+        """Helper to create SPDX license list JSON."""
+        return json.dumps({"licenses": [{
+            "licenseId": license_id,
+            "name": "{0} License".format(license_id),
+            "reference": "https://spdx.org/licenses/{0}".format(license_id),
+            "isDeprecatedLicenseId": license_id in deprecated,
+        } for license_id in license_ids]})
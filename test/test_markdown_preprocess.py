@@ -0,0 +1,65 @@
+# SPDX-FileCopyrightText: 2025 CERN (home.cern)
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Test cases for Markdown preprocessing."""
+
+import pytest
+
+import markdown_preprocess
+
+DESCRIPTION = """# Project
+
+<!-- Comment with a
+# heading in it -->
+
+![Board](https://example.com/board.png)
+
+---
+
+The project is a board. It has
+two paragraphs ![icon](icon.png) here.
+
+## Features
+
+- Feature
+"""
+
+
+class TestFirstSection:
+    """Test cases for the first_section function."""
+
+    def test_first_prose_section(self):
+        assert markdown_preprocess.first_section(DESCRIPTION) == (
+            "The project is a board. It has\ntwo paragraphs  here."
+        )
+
+    def test_text_before_heading(self):
+        md = "Intro\n# Heading\nText"
+        assert markdown_preprocess.first_section(md) == "Intro"
+
+    def test_skips_empty_sections(self):
+        md = "# A\n<!-- c -->\n## B\n  ---  \n![x](y)\n### C\nText\n---\n"
+        assert markdown_preprocess.first_section(md) == "Text"
+
+    @pytest.mark.parametrize("md", ["", "# A\n## B", "<!-- c -->\n---"])
+    def test_no_prose(self, md):
+        assert markdown_preprocess.first_section(md) is None
+
+
+class TestHelpers:
+    """Test cases for the other preprocessing functions."""
+
+    def test_images(self):
+        md = "![a](one.png) text ![b](two.png)\n![c\n](three.png)"
+        assert markdown_preprocess.images(md) == ["one.png", "two.png"]
+        assert markdown_preprocess.strip_images(md) == " text \n"
+
+    @pytest.mark.parametrize("text,expected", [
+        ("First sentence. Second.", "First sentence"),
+        ("Colon:\nlist", "Colon"),
+        ("Line\n\nParagraph", "Line"),
+        ("No full stop", "No full stop"),
+    ])
+    def test_summary(self, text, expected):
+        assert markdown_preprocess.summary(text) == expected
@@ -0,0 +1,93 @@
+# SPDX-FileCopyrightText: 2025 CERN (home.cern)
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Test cases for the build metrics."""
+
+import json
+
+import pytest
+
+from metrics import HostMetrics, Metrics
+from session import Session
+
+EXAMPLE_URL = "https://example.com/file.txt"
+
+
+@pytest.fixture(autouse=True)
+def clear_metrics():
+    """Reset the metrics before each test."""
+    Metrics.clear()
+    yield
+    Metrics.clear()
+
+
+class TestHostMetrics:
+    """Test cases for HostMetrics class."""
+
+    def test_observe(self):
+        host_metrics = HostMetrics()
+        host_metrics.observe(0.01, 100, failed=False)
+        host_metrics.observe(0.3, 0, failed=True)
+        host_metrics.observe(20, 0, failed=True)
+
+        host_dict = host_metrics.as_dict()
+        assert host_dict["requests"] == 3
+        assert host_dict["errors"] == 2
+        assert host_dict["bytes"] == 100
+        assert host_dict["histogram"]["0.05"] == 1
+        assert host_dict["histogram"]["0.5"] == 1
+        assert host_dict["histogram"]["inf"] == 1
+
+
+class TestMetrics:
+    """Test cases for Metrics class."""
+
+    def test_timer(self):
+        with Metrics.timer("projects", "example"):
+            pass
+        with pytest.raises(ValueError):
+            with Metrics.timer("projects", "example"):
+                raise ValueError("Test error")
+
+        timers = Metrics.report()["timers"]
+        assert list(timers["projects"]) == ["example"]
+        assert timers["projects"]["example"] >= 0
+
+    def test_record_request(self):
+        Metrics.record_request(EXAMPLE_URL, 0.2, 42)
+        Metrics.record_retry(EXAMPLE_URL)
+
+        host_dict = Metrics.report()["hosts"]["example.com"]
+        assert host_dict["requests"] == 1
+        assert host_dict["retries"] == 1
+        assert host_dict["bytes"] == 42
+
+    def test_session_requests(self):
+        Session.get(EXAMPLE_URL)
+        Session.head(EXAMPLE_URL)
+
+        assert Metrics.report()["hosts"]["example.com"]["requests"] == 2
+
+    def test_save(self, tmp_path):
+        Metrics.record_request(EXAMPLE_URL, 0.2, 42)
+        report_path = tmp_path / "report.json"
+        Metrics.save(str(report_path))
+
+        assert json.loads(report_path.read_text()) == Metrics.report()
+
+    def test_save_failure(self, tmp_path):
+        with pytest.raises(ValueError, match="Failed to save file"):
+            Metrics.save(str(tmp_path / "missing" / "report.json"))
+
+    def test_summary(self):
+        with Metrics.timer("phases", "projects"):
+            pass
+        with Metrics.timer("projects", "example"):
+            pass
+        Metrics.record_request(EXAMPLE_URL, 0.2, 42)
+
+        summary = Metrics.summary()
+        assert "projects" in summary
+        assert "example" in summary
+        assert "example.com" in summary
@@ -3,6 +3,7 @@
 # SPDX-License-Identifier: BSD-3-Clause
 
 from schema import BaseModelForbidExtra, Schema, AnnotatedStr, AnnotatedStrList
+from url import StrictUrl
 
 
 class ForbidExtraTestModel(BaseModelForbidExtra):
@@ -29,3 +30,7 @@ class ChildValidationTestModel(Schema):
 
 class ChildExtraFieldsTestModel(Schema):
     field: str
+
+
+class UrlSchemaTestModel(Schema):
+    url: StrictUrl
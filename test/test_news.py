@@ -6,6 +6,7 @@
 
 import pytest
 import logging
+from datetime import date, timedelta
 
 from config import News, Project
 from news import NewsPage, NewsSection
@@ -29,6 +30,7 @@ def sample_news_config(mocker):
     }
 
     mock_news.description = "Test news description"
+    mock_news.number = 1
     mock_project = mocker.Mock()
     mock_project.id = PROJ_ID
     mock_project.manifest.name = "Test Project"
@@ -37,29 +39,61 @@ def sample_news_config(mocker):
     return mock_news
 
 
+@pytest.fixture
+def news_limits():
+    """Fixture restoring the news limits."""
+    yield NewsSection
+    NewsSection.max_per_project = None
+    NewsSection.max_age = None
+    NewsSection.max_news = None
+
+
+@pytest.fixture
+def dated_projects(mocker):
+    """Fixture providing projects with news of the given dates."""
+    def make_projects(*dates):
+        projects = []
+        for index, project_dates in enumerate(dates):
+            project = mocker.Mock(spec=Project)
+            project.id = "prj{0}".format(index)
+            project.manifest.name = project.id
+            news_list = []
+            for number, news_date in enumerate(project_dates, 1):
+                news = mocker.Mock(spec=News)
+                news.model_dump.return_value = {"title": "News"}
+                news.description = None
+                news.date = news_date
+                news.number = number
+                news.project = project
+                news_list.append(news)
+            project.recent_news.return_value = news_list
+            projects.append(project)
+        return projects
+    return make_projects
+
+
 @pytest.fixture
 def sample_project_configs(mocker, sample_news_config):
     """Fixture providing multiple project configs with news."""
     good_project = mocker.Mock(spec=Project)
     good_project.id = PROJ_ID
-    good_project.news = [sample_news_config]
+    good_project.recent_news.return_value = [sample_news_config]
 
     bad_news_project = mocker.Mock(spec=Project)
     bad_news_project.id = BAD_PROJ_ID
 
     bad_news = mocker.Mock(spec=News)
     bad_news.description = "Bad news description"
+    bad_news.number = 1
     bad_project_mock = mocker.Mock()
     bad_project_mock.id = BAD_PROJ_ID
     bad_news.project = bad_project_mock
     bad_news.model_dump.side_effect = ValueError("News dump error")
-    bad_news_project.news = [bad_news]
+    bad_news_project.recent_news.return_value = [bad_news]
 
     bad_project = mocker.Mock(spec=Project)
     bad_project.id = "no-news-prj"
-    type(bad_project).news = mocker.PropertyMock(
-        side_effect=ValueError("Failed to get news")
-    )
+    bad_project.recent_news.side_effect = ValueError("Failed to get news")
 
     return [good_project, bad_news_project, bad_project]
 
@@ -114,6 +148,21 @@ class TestNewsSection:
         assert NEWS_PAGE_FORMAT.format(BAD_PROJ_ID) not in section
         assert all(msg in log_msg for msg in expected_logs)
 
+    def test_from_config_keeps_failed_news(
+        self, sample_project_configs, tmp_path
+    ):
+        """Test that the existing pages of failed news are kept."""
+        section = NewsSection.from_config(sample_project_configs)
+        for name in ("no-news-prj-1", "no-news-prj-2", "bad-prj-1", "old-1"):
+            (tmp_path / "{0}.md".format(name)).write_text("content")
+
+        summary = section.write(str(tmp_path))
+
+        assert summary.removed == ["old-1"]
+        assert sorted(path.stem for path in tmp_path.iterdir()) == [
+            "bad-prj-1", "no-news-prj-1", "no-news-prj-2", "test-prj-1",
+        ]
+
     def test_from_config_success_internal(self, sample_news_config):
         """Test successful _from_config method."""
         news_list = [sample_news_config]
@@ -122,3 +171,33 @@ class TestNewsSection:
         assert len(section) == 1
         assert NEWS_PAGE_FORMAT.format(PROJ_ID) in section
         assert isinstance(section[NEWS_PAGE_FORMAT.format(PROJ_ID)], NewsPage)
+
+    def test_from_config_limits(self, news_limits, dated_projects):
+        """Test that the limits are passed to the projects."""
+        news_limits.max_per_project = 5
+        news_limits.max_age = 10
+        news_limits.max_news = 3
+        projects = dated_projects([])
+
+        NewsSection.from_config(projects)
+
+        projects[0].recent_news.assert_called_once_with(
+            3, date.today() - timedelta(days=10),
+        )
+
+    def test_from_config_max_news(
+        self, news_limits, dated_projects, tmp_path
+    ):
+        """Test that only the most recent news overall are generated."""
+        news_limits.max_news = 3
+        projects = dated_projects(
+            [date(2025, 1, 1), date(2025, 3, 1)],
+            [date(2025, 2, 1), date(2025, 4, 1)],
+        )
+        section = NewsSection.from_config(projects)
+        (tmp_path / "prj0-1.md").write_text("content")
+
+        summary = section.write(str(tmp_path))
+
+        assert sorted(section) == ["prj0-2", "prj1-1", "prj1-2"]
+        assert summary.removed == ["prj0-1"]
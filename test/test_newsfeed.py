@@ -0,0 +1,107 @@
+# SPDX-FileCopyrightText: 2025 CERN (home.cern)
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Test cases for the newsfeed parser."""
+
+from datetime import date
+
+import pytest
+
+from newsfeed import Newsfeed, NewsEntry, entries
+from newsfeed_regex import regex_entries
+
+NEWSFEED = """# Newsfeed
+
+<!-- Newest news first.
+## Not news -->
+
+## Release 2.0 ![logo](logo.png)
+
+2025-02-01
+
+![Board](board.png)
+
+Release 2.0 is <!-- really --> out.
+### Changes
+
+- Faster
+
+## Release 1.0
+2024-12-31 (postponed)
+"""
+
+
+class TestEntries:
+    """Test cases for the entries function."""
+
+    def test_entries(self):
+        assert list(entries(NEWSFEED)) == [
+            NewsEntry(
+                line=6,
+                title="Release 2.0 ![logo](logo.png)",
+                date=date(2025, 2, 1),
+                images=["logo.png", "board.png"],
+                description=(
+                    "Release 2.0 is  out.\n### Changes\n\n- Faster"
+                ),
+            ),
+            NewsEntry(
+                line=17,
+                title="Release 1.0",
+                date=date(2024, 12, 31),
+            ),
+        ]
+
+    def test_lazy(self):
+        newsfeed = entries("## One\n2025-01-01\n\n## Two\nNo date")
+        assert next(newsfeed).title == "One"
+        with pytest.raises(ValueError, match="date at line 4"):
+            next(newsfeed)
+
+    def test_text_before_first_heading(self):
+        entry = next(entries("Intro ## Title\n2025-01-01\nText"))
+        assert entry.title == "Title"
+        assert entry.description == "Text"
+
+    def test_empty(self):
+        assert list(entries("# Newsfeed\n\n<!-- ## Hidden -->")) == []
+
+    def test_blank_headings(self):
+        md = "## \n\n## One\n2025-01-01\nText\n##  \nMore\n## Two\n2025-02-01"
+        assert [
+            (entry.line, entry.title, entry.description)
+            for entry in entries(md)
+        ] == [(3, "One", "Text\n##  \nMore"), (8, "Two", None)]
+
+    @pytest.mark.parametrize("md", [
+        NEWSFEED,
+        "## One\n2025-01-01\nText\n## ",
+        " ## ",
+        "## One\n2025-01-01\n<!-- Old\n## Two\n2025-02-01 -->\nText\n"
+        "## Three\n2025-03-01",
+        "## One\r\n2025-01-01\r\nText\r\n\r\n## Two\r\n2025-02-01\r\n",
+        "Intro\n## One ![a](a.png)\n2025-01-01 ![b](b.png)\n\n"
+        "![c](c.png)\nText",
+    ])
+    def test_regex_equivalence(self, md):
+        assert [
+            (entry.title, entry.date, entry.images, entry.description)
+            for entry in entries(md)
+        ] == regex_entries(md)
+
+    @pytest.mark.parametrize("md,message", [
+        ("\n\n## Title\nNo date", "date at line 3"),
+        ("<!--\n-->## Title\n2025-13-01", "date at line 2"),
+    ])
+    def test_invalid(self, md, message):
+        with pytest.raises(ValueError, match=message):
+            list(entries(md))
+
+
+class TestNewsfeed:
+    """Test cases for the Newsfeed class."""
+
+    def test_len(self):
+        assert len(Newsfeed(NEWSFEED)) == 2
+        assert len(Newsfeed("## One\nNo date\n## Two\nNo date")) == 2
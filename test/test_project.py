@@ -6,9 +6,12 @@
 
 import pytest
 import logging
+import warnings
 
 from config import Project
 from project import ProjectPage, ProjectSection
+from state import SectionState
+from url import WarningBuffer
 
 
 PROJ_ID = "test-prj"
@@ -22,6 +25,7 @@ def sample_project_config(mocker):
     """Fixture providing a mocked Project configuration."""
     mock_project = mocker.Mock(spec=Project)
     mock_project.id = PROJ_ID
+    mock_project.repository = mocker.Mock()
     mock_project.model_dump.return_value = {
         ID_KEY: PROJ_ID,
         "weight": 1,
@@ -44,6 +48,7 @@ def sample_project_configs(sample_project_config, mocker):
     """Fixture providing multiple project configs."""
     bad_project = mocker.Mock(spec=Project)
     bad_project.id = BAD_ID
+    bad_project.repository = mocker.Mock()
     bad_project.model_dump.return_value = {ID_KEY: BAD_ID}
 
     bad_manifest = mocker.Mock()
@@ -106,3 +111,52 @@ class TestProjectSection:
         assert PROJ_ID in section
         assert BAD_ID not in section
         assert all(msg in log_msg for msg in expected_logs)
+
+    def test_from_config_workers_keep_order(
+        self, sample_project_configs, mocker, caplog,
+    ):
+        """Test concurrent generation keeps the configuration order."""
+        def from_config(config):
+            WarningBuffer.warn("Warning for '{0}'".format(config.id))
+            return mocker.Mock(spec=ProjectPage)
+
+        mocker.patch.object(
+            ProjectPage, 'from_config', side_effect=from_config,
+        )
+        with caplog.at_level(logging.INFO):
+            with warnings.catch_warnings(record=True) as warns:
+                warnings.simplefilter('always')
+                section = ProjectSection.from_config(
+                    sample_project_configs, workers=4,
+                )
+
+        assert list(section) == [PROJ_ID, BAD_ID]
+        assert [str(warn.message) for warn in warns] == [
+            f"Warning for '{PROJ_ID}'",
+            f"Warning for '{BAD_ID}'",
+        ]
+        assert caplog.text.index(PROJ_ID) < caplog.text.index(BAD_ID)
+
+    def test_from_config_incremental(
+        self, sample_project_configs, mocker, tmp_path, caplog,
+    ):
+        """Test that unchanged projects are kept from the previous build."""
+        sample_project_configs[0].fingerprint = "unchanged"
+        sample_project_configs[1].fingerprint = "changed"
+        (tmp_path / f"{PROJ_ID}.md").write_text("page")
+        (tmp_path / f"{BAD_ID}.md").write_text("page")
+        section_state = SectionState(str(tmp_path), previous={
+            PROJ_ID: {"fingerprint": "unchanged", "pages": [PROJ_ID]},
+            BAD_ID: {"fingerprint": "old", "pages": [BAD_ID]},
+        })
+        mock_from_config = mocker.patch.object(ProjectPage, 'from_config')
+
+        with caplog.at_level(logging.INFO):
+            section = ProjectSection.from_config(
+                sample_project_configs, section_state=section_state,
+            )
+
+        assert list(section) == [BAD_ID]
+        mock_from_config.assert_called_once_with(sample_project_configs[1])
+        assert f"Keeping unchanged '{PROJ_ID}' page" in caplog.text
+        assert section_state.current[BAD_ID]["fingerprint"] == "changed"
@@ -12,10 +12,12 @@ from redirect import RedirectPage, RedirectSection
 
 @pytest.fixture(autouse=True)
 def mock_requests(mocker):
-    """Mock requests.head to avoid real HTTP calls."""
+    """Mock requests.Session.head to avoid real HTTP calls."""
     mock_response = mocker.Mock()
     mock_response.status_code = 200
-    mock_head = mocker.patch('requests.head', return_value=mock_response)
+    mock_head = mocker.patch(
+        'requests.Session.head', return_value=mock_response,
+    )
     return mock_head
 
 
@@ -104,17 +106,17 @@ class TestRedirectSection:
         assert "Failed to generate 'invalid' page" in caplog.text
 
     def test_write_success(
-        self, sample_redirect_configs, mocker, mock_requests
+        self, sample_redirect_configs, mock_requests, tmp_path
     ):
-        """Test successful write operation with mocked file operations."""
-        mock_open = mocker.patch('builtins.open', mocker.mock_open())
+        """Test successful write operation."""
         sample_redirect_configs_length = len(sample_redirect_configs)
 
-        RedirectSection.from_config(sample_redirect_configs).write(
-            "/output/path"
+        summary = RedirectSection.from_config(sample_redirect_configs).write(
+            str(tmp_path)
         )
 
-        assert mock_open.call_count == sample_redirect_configs_length
+        assert len(summary.written) == sample_redirect_configs_length
+        assert len(list(tmp_path.iterdir())) == sample_redirect_configs_length
         assert mock_requests.call_count == sample_redirect_configs_length
 
     def test_write_failure(
@@ -6,6 +6,9 @@
 
 import json
 import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 import pytest
 from urllib.parse import quote
 from repository import Repository, GitHubRepository, GitLabRepository
@@ -83,8 +86,118 @@ class TestGitHubRepository:
         assert file_content == TEST_FILE_CONTENT
 
 
+class GraphQLHandler(BaseHTTPRequestHandler):
+    """Stand-in for the GitHub GraphQL API."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        length = int(self.headers["Content-Length"])
+        request = json.loads(self.rfile.read(length))
+        if "variables" in request:
+            self._answer_gitlab(
+                request["variables"]["paths"], request["variables"]["first"],
+            )
+            return
+        query = request["query"]
+        self.server.queries.append((self.headers["Authorization"], query))
+        data = {}
+        for alias, name in re.findall(
+            r'(r\d+): repository\(owner: "[^"]+", name: "([^"]+)"\)', query,
+        ):
+            data[alias] = None if name == "missing" else {
+                "object": {"text": "manifest of {0}".format(name)},
+            }
+        self._send({"data": data})
+
+    def log_message(self, *args):
+        pass
+
+    def _answer_gitlab(self, paths, first):
+        self.server.queries.append((self.path, paths))
+        self._send({"data": {"projects": {"nodes": [
+            {"fullPath": path, "repository": {"rootRef": TEST_DEFAULT_BRANCH}}
+            for path in paths if path != "group/missing"
+        ][:first]}}})
+
+    def _send(self, payload):
+        body = json.dumps(payload).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def graphql_server(mocker):
+    """Serve a GitHub GraphQL stand-in on a local port."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), GraphQLHandler)
+    server.queries = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    mocker.patch.object(
+        GitHubRepository, "graphql_url",
+        "http://127.0.0.1:{0}/graphql".format(server.server_port),
+    )
+    mocker.patch.object(
+        GitLabRepository, "graphql_url",
+        "http://127.0.0.1:{0}/{{0}}/api/graphql".format(server.server_port),
+    )
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+class TestGitHubPrefetch:
+    """Test fetching files from GitHub repositories in batches."""
+
+    def test_prefetch(self, mocker, monkeypatch, graphql_server):
+        """Test that prefetched files are not requested again."""
+        monkeypatch.setenv("GITHUB_TOKEN", "secret")
+        mocker.patch.object(GitHubRepository, "batch_size", 2)
+        mock_get = mocker.patch(MOCK_GET_PATH)
+        mock_get.return_value.text = TEST_FILE_CONTENT
+        repos = [
+            GitHubRepository("https://github.com/owner/{0}.git".format(name))
+            for name in ("one", "two", "missing")
+        ]
+
+        Repository.prefetch(repos, ".ohwr.yaml")
+
+        assert len(graphql_server.queries) == 2
+        assert graphql_server.queries[0][0] == "bearer secret"
+        assert 'expression: "HEAD:.ohwr.yaml"' in graphql_server.queries[0][1]
+        assert repos[0].fetch(".ohwr.yaml") == "manifest of one"
+        assert repos[1].fetch(".ohwr.yaml") == "manifest of two"
+        mock_get.assert_not_called()
+        assert repos[2].fetch(".ohwr.yaml") == TEST_FILE_CONTENT
+        mock_get.assert_called_once()
+
+    def test_prefetch_without_token(self, monkeypatch, graphql_server):
+        """Test that nothing is prefetched without a token."""
+        monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+
+        Repository.prefetch([GitHubRepository(TEST_GITHUB_URL)], ".ohwr.yaml")
+
+        assert graphql_server.queries == []
+
+    def test_prefetch_failure(self, mocker, monkeypatch, caplog):
+        """Test that a failed query falls back to fetching files one by one."""
+        monkeypatch.setenv("GITHUB_TOKEN", "secret")
+        mocker.patch.object(
+            GitHubRepository, "_post", side_effect=ValueError("Query error"),
+        )
+
+        Repository.prefetch([GitHubRepository(TEST_GITHUB_URL)], ".ohwr.yaml")
+
+        assert "Failed to prefetch" in caplog.text
+        assert GitHubRepository._files == {}
+
+
 class TestGitLabRepository:
     """Test GitLabRepository functionality."""
+
     @pytest.mark.parametrize(
         "repo_url",
         [TEST_GITLAB_URL, TEST_CERN_URL],
@@ -127,6 +240,67 @@ class TestGitLabRepository:
             repository.fetch(TEST_FILE_PATH)
         assert "Failed to load JSON" in str(excinfo.value)
 
+    def test_fetch_files_single_lookup(self, mocker):
+        """Test that the default branch is looked up once per repository."""
+        mock_get = self._setup_mocks(mocker)
+        file_response = mocker.Mock()
+        file_response.text = TEST_FILE_CONTENT
+        mock_get.side_effect = [*mock_get.side_effect, file_response]
+        project_url, file_url = self._get_expected_urls(TEST_GITLAB_URL)
+
+        repository = GitLabRepository(TEST_GITLAB_URL)
+        repository.fetch(TEST_FILE_PATH)
+        GitLabRepository(TEST_GITLAB_URL).fetch(TEST_FILE_PATH)
+
+        assert mock_get.call_count == 3
+        assert mock_get.call_args_list.count(mocker.call(project_url)) == 1
+
+    def test_default_branches_persistence(self, mocker, tmp_path):
+        """Test that known default branches skip the metadata lookup."""
+        branches_path = str(tmp_path / "branches.json")
+        self._setup_mocks(mocker)
+        GitLabRepository(TEST_GITLAB_URL).fetch(TEST_FILE_PATH)
+        GitLabRepository.save_default_branches(branches_path)
+
+        GitLabRepository._default_branches = {}
+        GitLabRepository.load_default_branches(branches_path)
+        mock_get = mocker.patch(MOCK_GET_PATH)
+        mock_get.return_value.text = TEST_FILE_CONTENT
+        _, file_url = self._get_expected_urls(TEST_GITLAB_URL)
+
+        file_content = GitLabRepository(TEST_GITLAB_URL).fetch(TEST_FILE_PATH)
+        mock_get.assert_called_once_with(file_url)
+        assert file_content == TEST_FILE_CONTENT
+
+    def test_expired_default_branches(self, mocker, tmp_path):
+        """Test that default branches resolved too long ago are ignored."""
+        branches_path = tmp_path / "branches.json"
+        resolved = time.time() - GitLabRepository.max_age
+        branches_path.write_text(json.dumps({
+            TEST_GITLAB_URL: {"branch": "old", "resolved": resolved - 1},
+            TEST_CERN_URL: {"branch": "main", "resolved": resolved + 60},
+            "https://gitlab.com/group/legacy.git": "master",
+        }))
+
+        GitLabRepository.load_default_branches(str(branches_path))
+
+        assert GitLabRepository._known_branches == {TEST_CERN_URL: "main"}
+
+    def test_stale_default_branch(self, mocker):
+        """Test that a stale known default branch is looked up again."""
+        GitLabRepository._known_branches = {TEST_GITLAB_URL: "old"}
+        mock_get = self._setup_mocks(mocker)
+        mock_get.side_effect = [
+            ValueError("Not found"), *mock_get.side_effect,
+        ]
+
+        file_content = GitLabRepository(TEST_GITLAB_URL).fetch(TEST_FILE_PATH)
+        assert mock_get.call_count == 3
+        assert file_content == TEST_FILE_CONTENT
+        assert GitLabRepository._default_branches == {
+            TEST_GITLAB_URL: TEST_DEFAULT_BRANCH,
+        }
+
     def _get_expected_urls(self, repo_url):
         """Generate expected URLs for GitLab API calls."""
         match = re.search(r"^https://([^/]+)/(.+?)\.git", repo_url)
@@ -151,3 +325,56 @@ class TestGitLabRepository:
         file_response.text = TEST_FILE_CONTENT
         mock_get.side_effect = [project_response, file_response]
         return mock_get
+
+    def test_prefetch_default_branches(self, mocker, graphql_server):
+        """Test resolving default branches in one query per host."""
+        mocker.patch.object(GitLabRepository, "batch_size", 2)
+        mock_get = mocker.patch(MOCK_GET_PATH)
+        mock_get.return_value.text = TEST_FILE_CONTENT
+        repos = [
+            GitLabRepository("https://gitlab.com/group/{0}.git".format(name))
+            for name in ("one", "Two", "missing")
+        ] + [GitLabRepository(TEST_CERN_URL)]
+
+        Repository.prefetch(repos, ".ohwr.yaml")
+
+        assert graphql_server.queries == [
+            ("/gitlab.com/api/graphql", ["group/one", "group/two"]),
+            ("/gitlab.com/api/graphql", ["group/missing"]),
+            ("/gitlab.cern.ch/api/graphql", ["group/repo"]),
+        ]
+        assert repos[1].fetch(TEST_FILE_PATH) == TEST_FILE_CONTENT
+        mock_get.assert_called_once_with(
+            "https://gitlab.com/group/Two/-/raw/{0}/{1}".format(
+                TEST_DEFAULT_BRANCH, TEST_FILE_PATH,
+            ),
+        )
+        assert "https://gitlab.com/group/missing.git" not in (
+            GitLabRepository._default_branches
+        )
+
+    def test_prefetch_default_branches_large_batch(
+        self, mocker, graphql_server
+    ):
+        """Test that every project of a large batch is resolved."""
+        mocker.patch.object(GitLabRepository, "batch_size", 60)
+        repos = [
+            GitLabRepository("https://gitlab.com/group/{0}.git".format(index))
+            for index in range(60)
+        ]
+
+        Repository.prefetch(repos, ".ohwr.yaml")
+
+        assert len(graphql_server.queries) == 1
+        assert len(GitLabRepository._default_branches) == 60
+
+    def test_prefetch_default_branches_failure(self, mocker, caplog):
+        """Test that a failed query falls back to per-project lookups."""
+        mocker.patch.object(
+            GitLabRepository, "_post", side_effect=ValueError("Query error"),
+        )
+
+        Repository.prefetch([GitLabRepository(TEST_GITLAB_URL)], ".ohwr.yaml")
+
+        assert "Failed to resolve default branches" in caplog.text
+        assert GitLabRepository._default_branches == {}
@@ -0,0 +1,73 @@
+# SPDX-FileCopyrightText: 2025 CERN (home.cern)
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Test cases for the retry policy."""
+
+import time
+from email.utils import formatdate
+
+import pytest
+import requests
+
+from conftest import make_response
+from retry import RetryPolicy
+
+
+def http_error(status_code, headers=None):
+    """Create the error raised by a response with a status code."""
+    res = make_response(status_code, headers=headers)
+    return requests.exceptions.HTTPError(response=res)
+
+
+class TestRetryPolicy:
+    """Test cases for RetryPolicy class."""
+
+    @pytest.mark.parametrize("error", [
+        requests.exceptions.ConnectionError("Refused"),
+        requests.exceptions.Timeout("Timeout"),
+        http_error(429),
+        http_error(503),
+    ])
+    def test_transient(self, error):
+        delay = RetryPolicy(base_delay=1).delay(1, error)
+        assert 0 <= delay <= 2
+
+    @pytest.mark.parametrize("error", [
+        requests.exceptions.InvalidURL("Invalid"),
+        http_error(403),
+        http_error(404),
+    ])
+    def test_permanent(self, error):
+        assert RetryPolicy().delay(0, error) is None
+
+    def test_attempts(self):
+        error = requests.exceptions.ConnectionError("Refused")
+        assert RetryPolicy(attempts=3).delay(1, error) is not None
+        assert RetryPolicy(attempts=3).delay(2, error) is None
+
+    def test_max_delay(self):
+        error = requests.exceptions.ConnectionError("Refused")
+        policy = RetryPolicy(attempts=20, base_delay=1, max_delay=4)
+        assert all(policy.delay(attempt, error) <= 4 for attempt in range(19))
+
+    def test_retry_after_seconds(self):
+        error = http_error(503, {"Retry-After": "7"})
+        assert RetryPolicy().delay(0, error) == 7
+
+    def test_retry_after_date(self):
+        error = http_error(429, {
+            "Retry-After": formatdate(time.time() + 10, usegmt=True),
+        })
+        assert 8 <= RetryPolicy().delay(0, error) <= 10
+
+    def test_rate_limit_reset(self):
+        error = http_error(403, {
+            "X-RateLimit-Remaining": "0",
+            "X-RateLimit-Reset": str(int(time.time()) + 5),
+        })
+        assert 3 <= RetryPolicy().delay(0, error) <= 5
+
+    def test_requested_delay_too_long(self):
+        error = http_error(429, {"Retry-After": "3600"})
+        assert RetryPolicy(max_delay=30).delay(0, error) is None
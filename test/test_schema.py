@@ -2,6 +2,8 @@
 #
 # SPDX-License-Identifier: BSD-3-Clause
 
+import json
+
 import pytest
 from pydantic import ValidationError
 from test_models import (
@@ -11,8 +13,10 @@ from test_models import (
     ValidSchemaTestModel,
     ChildValidationTestModel,
     ChildExtraFieldsTestModel,
+    UrlSchemaTestModel,
 )
-from schema import Schema
+from schema import Schema, load_yaml, validate_str
+from url import UrlCheck
 
 
 class TestBaseModelForbidExtra:
@@ -91,6 +95,32 @@ field2: value2"""
         with pytest.raises(ValidationError):
             Schema.from_yaml("   ")
 
+    def test_from_yaml_checks_urls(self, mocker):
+        """Test that URLs are checked once the model is validated."""
+        mock_head = mocker.patch("requests.Session.head")
+        UrlSchemaTestModel.from_yaml("url: https://example.com")
+        mock_head.assert_called_once()
+
+    def test_from_yaml_defers_url_checks(self, mocker):
+        """Test that an active URL check collects the URLs to check later."""
+        mock_head = mocker.patch("requests.Session.head")
+        with UrlCheck() as url_check:
+            model = UrlSchemaTestModel.from_yaml("url: https://example.com")
+        assert model.url.url == "https://example.com"
+        assert len(url_check) == 1
+        mock_head.assert_not_called()
+
+        url_check.run()
+        mock_head.assert_called_once()
+        assert len(url_check) == 0
+
+    def test_from_yaml_skips_url_checks(self, mocker):
+        """Test that URL checks are skipped, e.g. to lint configurations."""
+        mock_head = mocker.patch("requests.Session.head")
+        mocker.patch.object(UrlCheck, "skip", True)
+        UrlSchemaTestModel.from_yaml("url: https://example.com")
+        mock_head.assert_not_called()
+
 
 class TestSchemaInheritance:
     """Test schema inheritance scenarios."""
@@ -112,3 +142,57 @@ class TestSchemaInheritance:
         with pytest.raises(ValueError) as exc_info:
             ChildExtraFieldsTestModel.from_yaml(yaml_str)
         assert "Extra inputs are not permitted" in str(exc_info.value)
+
+
+class TestValidateStr:
+    """Test the validate_str function."""
+
+    def test_strips_whitespace(self):
+        """Test that surrounding whitespace is stripped."""
+        assert validate_str("  value\n") == "value"
+
+    @pytest.mark.parametrize("str_value", ["", "   ", None])
+    def test_invalid(self, str_value):
+        """Test that blank strings and non-strings are rejected."""
+        with pytest.raises(ValidationError):
+            validate_str(str_value)
+
+
+class TestLoadYaml:
+    """Test the load_yaml function."""
+
+    def test_cache(self, tmp_path):
+        """Test that unchanged YAML is loaded from the cache."""
+        cache_path = str(tmp_path / "cache.json")
+        assert load_yaml("field: value", cache_path) == {"field": "value"}
+
+        cached = json.loads((tmp_path / "cache.json").read_text())
+        cached["yaml"] = {"field": "cached"}
+        (tmp_path / "cache.json").write_text(json.dumps(cached))
+        assert load_yaml("field: value", cache_path) == {"field": "cached"}
+        assert load_yaml("field: other", cache_path) == {"field": "other"}
+
+    @pytest.mark.parametrize("yaml_str", [
+        "date: 2025-01-01",
+        "1: integer key",
+    ])
+    def test_cache_not_json(self, tmp_path, yaml_str):
+        """Test that YAML without an exact JSON form is not cached."""
+        cache_path = tmp_path / "cache.json"
+        assert load_yaml(yaml_str, str(cache_path)) == load_yaml(yaml_str)
+        assert not cache_path.exists()
+
+    def test_cache_invalid(self, tmp_path):
+        """Test that an invalid cache file is ignored."""
+        cache_path = tmp_path / "cache.json"
+        cache_path.write_text("not json")
+        assert load_yaml("field: value", str(cache_path)) == {
+            "field": "value",
+        }
+
+    def test_invalid_yaml(self, tmp_path):
+        """Test that invalid YAML fails and is not cached."""
+        cache_path = tmp_path / "cache.json"
+        with pytest.raises(ValueError, match="Failed to load YAML"):
+            load_yaml("field: value: value", str(cache_path))
+        assert not cache_path.exists()
@@ -0,0 +1,62 @@
+# SPDX-FileCopyrightText: 2025 CERN (home.cern)
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Test cases for the shared HTTP session."""
+
+from http.server import BaseHTTPRequestHandler
+
+import pytest
+
+from session import Session
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    """Request handler keeping connections alive."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = b"content"
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_HEAD(self):
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def mock_requests():
+    """Use real requests against the local server."""
+
+
+@pytest.fixture
+def server_handler():
+    """Handle requests to the local server."""
+    return KeepAliveHandler
+
+
+class TestSession:
+    """Test cases for Session class."""
+
+    def test_connection_reuse(self, server_url):
+        """Test that sequential requests share one connection."""
+        for _ in range(3):
+            assert Session.get(server_url, timeout=10).text == "content"
+        assert Session.head(server_url, timeout=10).status_code == 200
+        assert Session.stats() == {"connections": 1, "requests": 4}
+
+    def test_pool_sizes(self):
+        """Test that forge hosts get their own connection pools."""
+        session = Session._get_session()
+        adapter = session.get_adapter("https://api.github.com/repos")
+        assert adapter._pool_maxsize == Session.pool_sizes["api.github.com"]
+        adapter = session.get_adapter("https://example.com/")
+        assert adapter._pool_maxsize == Session.default_pool_size
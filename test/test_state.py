@@ -0,0 +1,75 @@
+# SPDX-FileCopyrightText: 2025 CERN (home.cern)
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Test cases for the incremental build state."""
+
+import pytest
+
+from state import BuildState
+
+BUILD_KEY = "key"
+PROJ_ID = "test-prj"
+FINGERPRINT = "fingerprint"
+
+
+@pytest.fixture
+def state_path(tmp_path):
+    """Build state file path."""
+    return str(tmp_path / "state.json")
+
+
+@pytest.fixture
+def previous_state(state_path, tmp_path):
+    """Build state saved by a previous build with one page."""
+    (tmp_path / "{0}.md".format(PROJ_ID)).write_text("page")
+    build_state = BuildState(state_path, BUILD_KEY)
+    build_state.section("projects", str(tmp_path)).update(
+        PROJ_ID, FINGERPRINT, [PROJ_ID],
+    )
+    build_state.save()
+    return build_state
+
+
+class TestBuildState:
+    """Test cases for BuildState class."""
+
+    def test_missing_file(self, state_path, tmp_path):
+        section_state = BuildState(state_path, BUILD_KEY).section(
+            "projects", str(tmp_path),
+        )
+        assert section_state.unchanged(PROJ_ID, FINGERPRINT) is None
+
+    def test_invalid_file(self, state_path, tmp_path):
+        (tmp_path / "state.json").write_text("invalid")
+        with pytest.raises(ValueError, match="Failed to load file"):
+            BuildState(state_path, BUILD_KEY)
+
+    def test_unchanged(self, previous_state, state_path, tmp_path):
+        section_state = BuildState(state_path, BUILD_KEY).section(
+            "projects", str(tmp_path),
+        )
+        assert section_state.unchanged(PROJ_ID, FINGERPRINT) == [PROJ_ID]
+        assert section_state.unchanged(PROJ_ID, "changed") is None
+        assert PROJ_ID in section_state.current
+
+    def test_other_key(self, previous_state, state_path, tmp_path):
+        section_state = BuildState(state_path, "other").section(
+            "projects", str(tmp_path),
+        )
+        assert section_state.unchanged(PROJ_ID, FINGERPRINT) is None
+
+    def test_missing_page(self, previous_state, state_path, tmp_path):
+        (tmp_path / "{0}.md".format(PROJ_ID)).unlink()
+        section_state = BuildState(state_path, BUILD_KEY).section(
+            "projects", str(tmp_path),
+        )
+        assert section_state.unchanged(PROJ_ID, FINGERPRINT) is None
+
+    def test_key_from_files(self, tmp_path):
+        key_file = tmp_path / "licenses.json"
+        key_file.write_text("licenses")
+        key = BuildState.key_from_files([str(key_file)])
+        assert key == BuildState.key_from_files([str(key_file)])
+        key_file.write_text("changed")
+        assert key != BuildState.key_from_files([str(key_file)])
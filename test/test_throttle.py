@@ -0,0 +1,94 @@
+# SPDX-FileCopyrightText: 2025 CERN (home.cern)
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Test cases for the host throttle."""
+
+import time
+
+import pytest
+import requests
+
+from conftest import make_response
+from session import Session
+from throttle import CircuitOpenError, HostThrottle, TokenBucket
+from url import Url
+
+EXAMPLE_URL = "https://example.com/file.txt"
+
+
+class TestTokenBucket:
+    """Test cases for TokenBucket class."""
+
+    def test_reserve(self):
+        bucket = TokenBucket(rate=10, capacity=2)
+
+        assert bucket.reserve() == 0
+        assert bucket.reserve() == 0
+        assert 0 < bucket.reserve() <= 0.1
+        assert 0.1 < bucket.reserve() <= 0.2
+
+
+class TestHostThrottle:
+    """Test cases for HostThrottle class."""
+
+    def test_opens_after_failures(self):
+        error = requests.exceptions.ConnectionError("Refused")
+        for _ in range(HostThrottle.threshold):
+            HostThrottle.admit(EXAMPLE_URL)
+            HostThrottle.record(EXAMPLE_URL, error=error)
+
+        with pytest.raises(CircuitOpenError, match="example.com"):
+            HostThrottle.admit(EXAMPLE_URL)
+        HostThrottle.admit("https://example.org/file.txt")
+
+    def test_success_resets_failures(self):
+        error = requests.exceptions.ConnectionError("Refused")
+        for _ in range(HostThrottle.threshold - 1):
+            HostThrottle.record(EXAMPLE_URL, error=error)
+        HostThrottle.record(EXAMPLE_URL, res=make_response(404))
+        HostThrottle.record(EXAMPLE_URL, error=error)
+
+        HostThrottle.admit(EXAMPLE_URL)
+
+    def test_throttled_response(self):
+        HostThrottle.record(EXAMPLE_URL, res=make_response(403, headers={
+            "X-RateLimit-Remaining": "0",
+            "X-RateLimit-Reset": str(int(time.time()) + 600),
+        }))
+
+        with pytest.raises(CircuitOpenError):
+            HostThrottle.admit(EXAMPLE_URL)
+
+    def test_defers_short_waits(self, mocker):
+        mock_sleep = mocker.patch("time.sleep")
+        HostThrottle.record(
+            EXAMPLE_URL, res=make_response(429, headers={"Retry-After": "2"}),
+        )
+
+        HostThrottle.admit(EXAMPLE_URL)
+        assert 0 < mock_sleep.call_args.args[0] <= 2
+
+    def test_rate_limit(self, mocker):
+        mocker.patch.dict(HostThrottle.rates, {"example.com": 1})
+        mocker.patch.object(HostThrottle, "burst", 1)
+        mock_sleep = mocker.patch("time.sleep")
+
+        HostThrottle.admit(EXAMPLE_URL)
+        mock_sleep.assert_not_called()
+        HostThrottle.admit(EXAMPLE_URL)
+        assert 0 < mock_sleep.call_args.args[0] <= 1
+
+    def test_fails_fast(self, mocker):
+        mock_get = mocker.patch(
+            "requests.Session.get",
+            side_effect=requests.exceptions.ConnectionError("Refused"),
+        )
+        mocker.patch("time.sleep")
+        for _ in range(HostThrottle.threshold):
+            with pytest.raises(requests.exceptions.ConnectionError):
+                Session.get(EXAMPLE_URL)
+
+        with pytest.raises(ValueError, match="unavailable"):
+            Url._get(EXAMPLE_URL)
+        assert mock_get.call_count == HostThrottle.threshold
@@ -4,11 +4,17 @@
 
 import pytest
 import json
-from requests.exceptions import RequestException
+import threading
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from requests.exceptions import HTTPError, RequestException
 from pydantic import BaseModel, ValidationError
 from url import (
     StrictUrl,
+    Url,
+    UrlCheck,
     UrlContent,
+    UrlRegistry,
     GitLabWikiPage,
     GenericUrlContent,
     StrictUrlList
@@ -22,11 +28,16 @@ GITLAB_DOMAIN = "gitlab.com"
 PAGE_NAME = "page"
 PROJECT_NAME = "project"
 CONTENT_TEXT = "content"
-REQUESTS_HEAD = "requests.head"
-REQUESTS_GET = "requests.get"
+REQUESTS_HEAD = "requests.Session.head"
+REQUESTS_GET = "requests.Session.get"
 RE_SEARCH = "re.search"
 
 
+def streamed_response(mocker):
+    """Create a mock response with an empty streamed body."""
+    return mocker.Mock(headers={}, **{"iter_content.return_value": []})
+
+
 class StrictUrlListTestModel(BaseModel):
     """Test model for StrictUrlList validation."""
     urls: StrictUrlList
@@ -57,7 +68,7 @@ class TestStrictUrl:
         assert StrictUrl._serialize(url_obj) == EXAMPLE_URL
 
     def test_url_get_success(self, mocker):
-        mock_response = mocker.Mock()
+        mock_response = streamed_response(mocker)
         mock_response.raise_for_status.return_value = None
         mocker.patch(REQUESTS_GET, return_value=mock_response)
 
@@ -70,12 +81,175 @@ class TestStrictUrl:
         with pytest.raises(ValueError):
             StrictUrl._get("http://invalid.com")
 
+    def test_url_get_not_found_not_retried(self, mocker):
+        mock_response = streamed_response(mocker)
+        mock_response.raise_for_status.side_effect = HTTPError(
+            response=mocker.Mock(status_code=404, headers={}),
+        )
+        mock_get = mocker.patch(REQUESTS_GET, return_value=mock_response)
+        mock_sleep = mocker.patch('time.sleep')
+
+        with pytest.raises(ValueError):
+            StrictUrl._get(EXAMPLE_URL)
+        assert mock_get.call_count == 1
+        mock_sleep.assert_not_called()
+
+    def test_url_get_retries_transient_errors(self, mocker):
+        mock_response = streamed_response(mocker)
+        mock_response.raise_for_status.return_value = None
+        mock_get = mocker.patch(REQUESTS_GET, side_effect=[
+            RequestException("GET error"), mock_response,
+        ])
+        mock_sleep = mocker.patch('time.sleep')
+
+        assert StrictUrl._get(EXAMPLE_URL) == mock_response
+        assert mock_get.call_count == 2
+        mock_sleep.assert_called_once()
+
+    def test_validation_is_deferred(self, mocker):
+        mock_head = mocker.patch(REQUESTS_HEAD)
+
+        with UrlCheck() as url_check:
+            url = StrictUrl._validate(EXAMPLE_URL)
+        assert url.url == EXAMPLE_URL
+        mock_head.assert_not_called()
+
+        url_check.run()
+        mock_head.assert_called_once_with(
+            EXAMPLE_URL, timeout=10, allow_redirects=True,
+        )
+
+    def test_run_warns_for_unreachable_url(self, mocker):
+        mocker.patch(REQUESTS_HEAD, side_effect=RequestException("Error"))
+        mocker.patch('time.sleep')
+
+        with UrlCheck() as url_check:
+            Url._validate(EXAMPLE_URL)
+            Url._validate(EXAMPLE_ORG_URL)
+        with warnings.catch_warnings(record=True) as warns:
+            warnings.simplefilter('always')
+            url_check.run()
+        assert len(warns) == 2
+        assert EXAMPLE_URL in str(warns[0].message)
+        assert EXAMPLE_ORG_URL in str(warns[1].message)
+
+    def test_run_raises_for_unreachable_strict_url(self, mocker):
+        mocker.patch(REQUESTS_HEAD, side_effect=RequestException("Error"))
+        mocker.patch('time.sleep')
+
+        with UrlCheck() as url_check:
+            StrictUrlListTestModel(urls=["http://invalid.com"])
+        with pytest.raises(ValueError) as excinfo:
+            url_check.run()
+        assert "http://invalid.com" in str(excinfo.value)
+
+
+class TestUrlRegistry:
+    """Test the process-wide URL result registry."""
+
+    def test_check_once(self, mocker):
+        mock_head = mocker.patch(REQUESTS_HEAD)
+
+        for _ in range(3):
+            StrictUrl._validate(EXAMPLE_URL)
+        StrictUrl._validate(EXAMPLE_ORG_URL)
+
+        assert mock_head.call_count == 2
+        assert UrlRegistry.stats() == {"urls": 2, "saved": 2}
+
+    def test_failure_is_shared(self, mocker):
+        mock_head = mocker.patch(
+            REQUESTS_HEAD, side_effect=RequestException("Error"),
+        )
+        mocker.patch('time.sleep')
+
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                StrictUrl._validate(EXAMPLE_URL)
+        assert mock_head.call_count == 3
+
+    def test_unexpected_failure_is_shared(self, mocker):
+        head = mocker.Mock(side_effect=RuntimeError("Unexpected"))
+
+        with pytest.raises(RuntimeError):
+            UrlRegistry.check(EXAMPLE_URL, head)
+        with pytest.raises(ValueError, match="Unexpected"):
+            UrlRegistry.check(EXAMPLE_URL, head)
+        assert head.call_count == 1
+
+    def test_in_flight_check_is_shared(self, mocker):
+        started = threading.Event()
+        release = threading.Event()
+
+        def head(url, **kwargs):
+            started.set()
+            release.wait()
+            return mocker.Mock()
+
+        mock_head = mocker.patch(REQUESTS_HEAD, side_effect=head)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            first = executor.submit(StrictUrl._validate, EXAMPLE_URL)
+            started.wait()
+            second = executor.submit(StrictUrl._validate, EXAMPLE_URL)
+            release.set()
+            assert first.result() == second.result()
+        assert mock_head.call_count == 1
+
+    def test_get_answers_check(self, mocker):
+        mock_head = mocker.patch(REQUESTS_HEAD)
+
+        StrictUrl._get(EXAMPLE_URL)
+        StrictUrl._validate(EXAMPLE_URL)
+
+        mock_head.assert_not_called()
+        assert UrlRegistry._results[EXAMPLE_URL].response is None
+
+    def test_save_and_load(self, mocker, tmp_path):
+        path = str(tmp_path / "url-checks.json")
+
+        def head(url, **kwargs):
+            if url == EXAMPLE_ORG_URL:
+                raise RequestException("Error")
+            return mocker.Mock()
+
+        mocker.patch(REQUESTS_HEAD, side_effect=head)
+        mocker.patch('time.sleep')
+        StrictUrl._validate(EXAMPLE_URL)
+        with pytest.raises(ValueError):
+            StrictUrl._validate(EXAMPLE_ORG_URL)
+        UrlRegistry.save(path)
+        UrlRegistry.clear()
+
+        mock_head = mocker.patch(REQUESTS_HEAD)
+        UrlRegistry.load(path)
+        StrictUrl._validate(EXAMPLE_URL)
+        StrictUrl._validate(EXAMPLE_ORG_URL)
+        mock_head.assert_called_once_with(
+            EXAMPLE_ORG_URL, timeout=10, allow_redirects=True,
+        )
+
+    def test_load_expired(self, mocker, tmp_path):
+        path = tmp_path / "url-checks.json"
+        path.write_text(json.dumps({EXAMPLE_URL: 0}))
+        mock_head = mocker.patch(REQUESTS_HEAD)
+
+        UrlRegistry.load(str(path))
+        StrictUrl._validate(EXAMPLE_URL)
+        mock_head.assert_called_once()
+
+    def test_load_invalid(self, tmp_path):
+        path = tmp_path / "url-checks.json"
+        path.write_text("[]")
+        with pytest.raises(ValueError, match="Invalid URL checks"):
+            UrlRegistry.load(str(path))
+        UrlRegistry.load(str(tmp_path / "missing.json"))
+
 
 class TestUrlContent:
     """Test the UrlContent abstract class and its implementations."""
 
     def test_generic_url_content(self, mocker):
-        mock_response = mocker.Mock()
+        mock_response = streamed_response(mocker)
         mock_response.raise_for_status.return_value = None
         mock_response.text = "Sample content"
         mocker.patch(REQUESTS_GET, return_value=mock_response)
@@ -85,7 +259,7 @@ class TestUrlContent:
         assert content_obj.text == "Sample content"
 
     def test_gitlab_wiki_content(self, mocker):
-        mock_response = mocker.Mock()
+        mock_response = streamed_response(mocker)
         mock_response.raise_for_status.return_value = None
         mock_response.json.return_value = {"content": "Wiki content"}
         mocker.patch(REQUESTS_GET, return_value=mock_response)
@@ -99,7 +273,7 @@ class TestUrlContent:
         assert wiki_content.text == "Wiki content"
 
     def test_gitlab_wiki_invalid_json(self, mocker):
-        mock_response = mocker.Mock()
+        mock_response = streamed_response(mocker)
         mock_response.raise_for_status.return_value = None
         mock_response.json.side_effect = json.JSONDecodeError(
             "Invalid", "doc", 1